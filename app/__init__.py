@@ -8,16 +8,17 @@ This module is responsible for:
     - Configuring Flask extensions (SQLAlchemy, Migrate, Marshmallow)
     - Registering custom error handlers
     - Registering REST API routes
+    - Registering maintenance CLI commands
     - Creating the Flask application via the `create_app` factory
 
 Functions:
     - register_extensions(app): Initialize and register Flask extensions.
     - register_error_handlers(app): Register custom error handlers for the app.
+    - register_cli(app): Register the maintenance CLI commands (app.cli).
     - create_app(config_class): Application factory that creates and configures
       the Flask app.
 """
 
-import os
 import sys
 import traceback
 from sqlalchemy import inspect
@@ -26,15 +27,22 @@ from flask_migrate import Migrate
 from flask_marshmallow import Marshmallow
 from flask_cors import CORS
 from werkzeug.exceptions import InternalServerError
+from werkzeug.utils import import_string
 
+from app.runtime_config import RuntimeConfig
+from app.cli import register_cli
 from app.models.db import db
 from app.logger import logger
 from app.routes import register_routes
+from app.utils import OrjsonProvider
 
 # Initialisation des extensions Flask
 migrate = Migrate()
 ma = Marshmallow()
 
+# Environments where CORS is opened to any origin
+CORS_ENVIRONMENTS = frozenset({"development", "staging"})
+
 
 def should_sync():
     """
@@ -238,14 +246,29 @@ def create_app(config_class):
 
     Returns:
         Flask: The configured and ready-to-use Flask application instance.
+
+    Raises:
+        ValueError: If the selected configuration is incomplete.
     """
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
 
+    if isinstance(config_class, str):
+        config_class = import_string(config_class)
+    config_class.validate()
     app.config.from_object(config_class)
+    app.extensions["cfg"] = RuntimeConfig.from_env()
+    # Configurations tuning the connection pool size it to the worker
+    engine_options = app.config.get("SQLALCHEMY_ENGINE_OPTIONS")
+    if engine_options is not None:
+        app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+            **engine_options,
+            "pool_size": app.extensions["cfg"].db_pool_size,
+        }
 
-    env = os.getenv("FLASK_ENV")
+    env = app.extensions["cfg"].env
     logger.info("Creating app in environment.", environment=env)
-    if env in ("development", "staging"):
+    if env in CORS_ENVIRONMENTS:
         CORS(
             app, supports_credentials=True, resources={r"/*": {"origins": "*"}}
         )
@@ -253,6 +276,7 @@ def create_app(config_class):
     register_extensions(app)
     register_error_handlers(app)
     register_routes(app)
+    register_cli(app)
     if app.config.get("TESTING"):
         register_test_routes(app)
 
@@ -0,0 +1,71 @@
+"""
+cli.py
+------
+
+Flask CLI commands for database maintenance.
+
+Commands:
+    - flask project-history partitions: Create upcoming monthly partitions of
+      project_history and drop those past the retention period. Meant to run
+      nightly (cron); PostgreSQL only.
+"""
+
+import click
+from flask.cli import AppGroup
+from sqlalchemy import text
+
+from app.models.db import db
+
+history_cli = AppGroup("project-history", help="Project history maintenance.")
+
+
+@history_cli.command("partitions")
+@click.option(
+    "--months-ahead",
+    default=3,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help="Monthly partitions to create after the current month.",
+)
+@click.option(
+    "--retention-months",
+    default=None,
+    type=click.IntRange(min=0),
+    help="Drop partitions older than this many months (default: keep all).",
+)
+def maintain_partitions(months_ahead, retention_months):
+    """Create upcoming history partitions and drop expired ones."""
+    if db.session.get_bind().dialect.name != "postgresql":
+        click.echo("project_history is only partitioned on PostgreSQL.")
+        return
+
+    created = db.session.scalar(
+        text(
+            "SELECT project_history_create_partitions(CAST(now() AS date), "
+            "CAST(date_trunc('month', now()) "
+            "+ make_interval(months => :months + 1) AS date))"
+        ),
+        {"months": months_ahead},
+    )
+    dropped = 0
+    if retention_months is not None:
+        dropped = db.session.scalar(
+            text(
+                "SELECT project_history_drop_partitions("
+                "CAST(date_trunc('month', now()) "
+                "- make_interval(months => :months) AS date))"
+            ),
+            {"months": retention_months},
+        )
+    db.session.commit()
+    click.echo(f"Created {created} partition(s), dropped {dropped}.")
+
+
+def register_cli(app):
+    """
+    Register the maintenance CLI commands on the application.
+
+    Args:
+        app (Flask): The Flask application instance.
+    """
+    app.cli.add_command(history_cli)
@@ -13,64 +13,104 @@ Classes:
     - ProductionConfig: Configuration for production.
 
 Each class defines main parameters such as the secret key, database URL,
-debug mode, and SQLAlchemy modification tracking.
+debug mode, and SQLAlchemy modification tracking. Required settings are
+checked by ``Config.validate()``, called by ``create_app`` for the selected
+class only, so importing this module never raises.
 """
 
 import os
 from dotenv import load_dotenv
 
+_env = os.environ
+
+
+def _get(key, default=None):
+    """Return an environment variable with a single mapping lookup."""
+    return _env.get(key, default)
+
+
+# Project root (parent of the app package): .env files are resolved against it
+# rather than the current working directory.
+_APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 # Load .env file ONLY if not running in Docker
-# This hook ensures environment variables are loaded for flask commands
-if not os.environ.get("IN_DOCKER_CONTAINER") and not os.environ.get(
-    "APP_MODE"
-):
-    env = os.environ.get("FLASK_ENV", "development")
-    ENV_FILE = f".env.{env}"
-    if os.path.exists(ENV_FILE):
-        load_dotenv(ENV_FILE)
-    # Fallback to generic .env if environment-specific file doesn't exist
-    elif os.path.exists(".env"):
-        load_dotenv(".env")
+# This hook ensures environment variables are loaded for flask commands.
+# Exported variables take precedence (override=False); the file still
+# supplies the optional settings read elsewhere (GUARDIAN_SERVICE_URL,
+# LOG_LEVEL, ...), so it is loaded even when the required ones are set.
+if not _get("IN_DOCKER_CONTAINER") and not _get("APP_MODE"):
+    env = _get("FLASK_ENV", "development")
+    ENV_FILE = os.path.join(_APP_ROOT, f".env.{env}")
+    # Fallback to generic .env if environment-specific file doesn't exist.
+    # Opening the file directly replaces the exists() probe + reopen, and
+    # passing the stream skips python-dotenv's parent-directory search.
+    for candidate in (ENV_FILE, os.path.join(_APP_ROOT, ".env")):
+        try:
+            with open(candidate, encoding="utf-8") as stream:
+                load_dotenv(stream=stream, override=False)
+        except OSError:
+            continue
+        break
+
+# Resolved once at import time and shared by every configuration class
+_SECRET_KEY = _get("SECRET_KEY", "dev")
+_DATABASE_URL = _get("DATABASE_URL")
 
 
 class Config:
     """Base configuration common to all environments."""
 
-    SECRET_KEY = os.environ.get("SECRET_KEY", "dev")
+    SECRET_KEY = _SECRET_KEY
+    SQLALCHEMY_DATABASE_URI = None
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    @classmethod
+    def validate(cls):
+        """
+        Check that the settings required by this configuration are set.
+
+        Raises:
+            ValueError: If DATABASE_URL is not set.
+        """
+        if not cls.SQLALCHEMY_DATABASE_URI:
+            raise ValueError("DATABASE_URL environment variable is not set.")
+
 
 class DevelopmentConfig(Config):
     """Configuration for the development environment."""
 
     DEBUG = True
-    SQLALCHEMY_DATABASE_URI = os.environ.get("DATABASE_URL")
-    if not SQLALCHEMY_DATABASE_URI:
-        raise ValueError("DATABASE_URL environment variable is not set.")
+    SQLALCHEMY_DATABASE_URI = _DATABASE_URL
 
 
 class TestingConfig(Config):
     """Configuration for the testing environment."""
 
     TESTING = True
-    SQLALCHEMY_DATABASE_URI = os.environ.get("DATABASE_URL")
-    if not SQLALCHEMY_DATABASE_URI:
-        raise ValueError("DATABASE_URL environment variable is not set.")
+    SQLALCHEMY_DATABASE_URI = _DATABASE_URL
 
 
 class StagingConfig(Config):
     """Configuration for the staging environment."""
 
     DEBUG = True
-    SQLALCHEMY_DATABASE_URI = os.environ.get("DATABASE_URL")
-    if not SQLALCHEMY_DATABASE_URI:
-        raise ValueError("DATABASE_URL environment variable is not set.")
+    SQLALCHEMY_DATABASE_URI = _DATABASE_URL
 
 
 class ProductionConfig(Config):
     """Configuration for the production environment."""
 
     DEBUG = False
-    SQLALCHEMY_DATABASE_URI = os.environ.get("DATABASE_URL")
-    if not SQLALCHEMY_DATABASE_URI:
-        raise ValueError("DATABASE_URL environment variable is not set.")
+    SQLALCHEMY_DATABASE_URI = _DATABASE_URL
+    # create_app adds pool_size: one pooled connection per gunicorn thread
+    # (RuntimeConfig.db_pool_size), while max_overflow leaves headroom for
+    # bursts. Connections are checked before use and replaced after 30
+    # minutes, so those dropped by the server or a proxy idle timeout never
+    # reach a request; LIFO reuse keeps the hot ones warm and lets the idle
+    # surplus age out.
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "max_overflow": 4,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+        "pool_use_lifo": True,
+    }
@@ -41,13 +41,15 @@ handler.setFormatter(
 )
 
 # Set log level from LOG_LEVEL env var, default to INFO
-log_level = os.environ.get("LOG_LEVEL", "INFO").upper()
-if log_level not in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"):
+VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+log_level = os.environ.get("LOG_LEVEL", "INFO").strip().upper()
+if log_level not in VALID_LOG_LEVELS:
     log_level = "INFO"
 logging.basicConfig(level=getattr(logging, log_level), handlers=[handler])
 
 # Choose renderer based on environment
-if env in ("development", "testing"):
+CONSOLE_ENVIRONMENTS = frozenset({"development", "testing"})
+if env in CONSOLE_ENVIRONMENTS:
     renderer = structlog.dev.ConsoleRenderer(colors=True)
 else:
     renderer = structlog.processors.JSONRenderer()
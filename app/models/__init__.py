@@ -3,32 +3,56 @@ app.models
 ----------
 
 This module exports the models.
+
+Models are resolved lazily (PEP 562) so that importing ``app.models`` does
+not configure the SQLAlchemy mappers until a model is actually accessed.
 """
 
-from app.models.project import (
-    Project,
-    ProjectMember,
-    Milestone,
-    Deliverable,
-    ProjectRole,
-    ProjectPolicy,
-    ProjectPermission,
-    ProjectHistory,
-    milestone_deliverable_association,
-    role_policy_association,
-    policy_permission_association,
-)
-
-__all__ = [
-    "Project",
-    "ProjectMember",
-    "Milestone",
-    "Deliverable",
-    "ProjectRole",
-    "ProjectPolicy",
-    "ProjectPermission",
-    "ProjectHistory",
-    "milestone_deliverable_association",
-    "role_policy_association",
-    "policy_permission_association",
-]
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - static analysis only
+    from app.models.project import (  # noqa: F401
+        Project,
+        ProjectMember,
+        Milestone,
+        Deliverable,
+        ProjectRole,
+        ProjectPolicy,
+        ProjectPermission,
+        ProjectHistory,
+        milestone_deliverable_association,
+        role_policy_association,
+        policy_permission_association,
+    )
+
+_LAZY_EXPORTS = {
+    "Project": "app.models.project",
+    "ProjectMember": "app.models.project",
+    "Milestone": "app.models.project",
+    "Deliverable": "app.models.project",
+    "ProjectRole": "app.models.project",
+    "ProjectPolicy": "app.models.project",
+    "ProjectPermission": "app.models.project",
+    "ProjectHistory": "app.models.project",
+    "milestone_deliverable_association": "app.models.project",
+    "role_policy_association": "app.models.project",
+    "policy_permission_association": "app.models.project",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    """Import the requested model on first access and cache it."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Expose lazily exported names to dir() and tab completion."""
+    return sorted(set(globals()) | set(__all__))
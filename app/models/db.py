@@ -5,8 +5,44 @@ app.models.db
 This module initializes the SQLAlchemy instance (db) for the
 PM Guardian API. The db object is used throughout the application
 for ORM operations and database management.
+
+It also defines UtcNow, the single clock used for every timestamp the
+service stores (naive UTC, like the baseline ``datetime.utcnow``).
 """
 
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import DateTime
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
 
 db = SQLAlchemy()
+
+
+class UtcNow(FunctionElement):  # pylint: disable=too-many-ancestors
+    """
+    Current UTC time as a naive timestamp, computed by the database.
+
+    Usable as a column server_default/onupdate and as an UPDATE value.
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(UtcNow, "postgresql")
+def _utcnow_postgresql(_element, _compiler, **_kw):
+    # now() is converted to the session's time zone when stored into a
+    # timestamp without time zone: convert it to UTC explicitly
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(UtcNow, "sqlite")
+def _utcnow_sqlite(_element, _compiler, **_kw):
+    # UTC, in the storage format of SQLAlchemy's DateTime so values the
+    # database and Python write compare and round-trip alike
+    return "STRFTIME('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
+@compiles(UtcNow)
+def _utcnow_default(_element, _compiler, **_kw):
+    return "CURRENT_TIMESTAMP"
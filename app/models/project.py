@@ -19,70 +19,136 @@ Models included:
 - ProjectHistory: Audit trail for project changes
 """
 
+# pylint: disable=too-many-lines
+
+import threading
 import uuid
-from datetime import datetime, timezone
-from sqlalchemy import Index, CheckConstraint
-from app.models.db import db
+from collections import namedtuple
+from sqlalchemy import (
+    CheckConstraint,
+    Column,
+    Index,
+    MetaData,
+    SmallInteger,
+    Table,
+    Uuid,
+    event,
+    exists,
+    insert,
+    inspect,
+    select,
+    update,
+)
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, validates
+from app.logger import logger
+from app.models.db import UtcNow, db
+from app.utils.cache import TTLCache
+
+# ============================================================================
+# ENUMERATED TYPES (native ENUM on PostgreSQL)
+# ============================================================================
+
+PROJECT_STATUSES = (
+    "created",
+    "initialized",
+    "consultation",
+    "lost",
+    "active",
+    "suspended",
+    "completed",
+    "archived",
+)
+WORK_ITEM_STATUSES = (
+    "planned",
+    "in_progress",
+    "completed",
+    "delayed",
+    "cancelled",
+)
+DELIVERABLE_TYPES = ("document", "software", "hardware", "service", "other")
+
+project_status_enum = db.Enum(*PROJECT_STATUSES, name="project_status")
+milestone_status_enum = db.Enum(*WORK_ITEM_STATUSES, name="milestone_status")
+deliverable_status_enum = db.Enum(
+    *WORK_ITEM_STATUSES, name="deliverable_status"
+)
+deliverable_type_enum = db.Enum(*DELIVERABLE_TYPES, name="deliverable_type")
+
+# Predefined permissions and their SMALLINT code (project_permissions.kind).
+# Codes are persisted: append new permissions, never renumber existing ones.
+PERMISSION_KINDS = {
+    "read_files": 1,
+    "write_files": 2,
+    "delete_files": 3,
+    "lock_files": 4,
+    "validate_files": 5,
+    "update_project": 6,
+    "delete_project": 7,
+    "manage_members": 8,
+    "manage_roles": 9,
+    "manage_policies": 10,
+}
+PERMISSION_NAMES = {kind: name for name, kind in PERMISSION_KINDS.items()}
 
 
 # ============================================================================
 # ASSOCIATION TABLES (Many-to-Many)
 # ============================================================================
+# Pure junction tables: they only carry the two foreign keys forming the
+# primary key so RBAC joins can be answered from the index alone.
 
 milestone_deliverable_association = db.Table(
     "milestone_deliverable_association",
     db.Column(
         "milestone_id",
-        db.String(36),
+        db.Uuid(as_uuid=False),
         db.ForeignKey("milestones.id", ondelete="CASCADE"),
         primary_key=True,
     ),
     db.Column(
         "deliverable_id",
-        db.String(36),
+        db.Uuid(as_uuid=False),
         db.ForeignKey("deliverables.id", ondelete="CASCADE"),
         primary_key=True,
     ),
-    db.Column(
-        "created_at", db.DateTime, nullable=False, default=datetime.utcnow
-    ),
 )
 
 role_policy_association = db.Table(
     "role_policy_association",
     db.Column(
         "role_id",
-        db.String(36),
+        db.Uuid(as_uuid=False),
         db.ForeignKey("project_roles.id", ondelete="CASCADE"),
         primary_key=True,
     ),
     db.Column(
         "policy_id",
-        db.String(36),
+        db.Uuid(as_uuid=False),
         db.ForeignKey("project_policies.id", ondelete="CASCADE"),
         primary_key=True,
     ),
-    db.Column(
-        "created_at", db.DateTime, nullable=False, default=datetime.utcnow
-    ),
 )
 
 policy_permission_association = db.Table(
     "policy_permission_association",
     db.Column(
         "policy_id",
-        db.String(36),
+        db.Uuid(as_uuid=False),
         db.ForeignKey("project_policies.id", ondelete="CASCADE"),
         primary_key=True,
     ),
     db.Column(
         "permission_id",
-        db.String(36),
+        db.Uuid(as_uuid=False),
         db.ForeignKey("project_permissions.id", ondelete="CASCADE"),
         primary_key=True,
     ),
-    db.Column(
-        "created_at", db.DateTime, nullable=False, default=datetime.utcnow
+    # The primary key serves policy → permission; this serves the reverse
+    Index(
+        "idx_policy_permission_permission_policy",
+        "permission_id",
+        "policy_id",
     ),
 )
 
@@ -91,6 +157,49 @@ policy_permission_association = db.Table(
 # PROJECT MODEL
 # ============================================================================
 
+# Seconds a cached project snapshot stays valid in a worker process
+PROJECT_CACHE_TTL = 60
+
+# Immutable view of the columns used by existence/ownership checks.
+# ORM instances are never cached: they are bound to a request session.
+ProjectSnapshot = namedtuple(
+    "ProjectSnapshot", ["id", "company_id", "status", "removed_at"]
+)
+
+project_cache = TTLCache(ttl=PROJECT_CACHE_TTL, maxsize=4096)
+
+# session.info key: ids of projects changed by the transaction, evicted
+# from project_cache once it commits
+_PROJECTS_CHANGED = "projects_changed"
+
+
+def _project_cache_key(project_id):
+    """Return the canonical form of project_id, or None if malformed."""
+    try:
+        return str(uuid.UUID(str(project_id)))
+    except ValueError:
+        return None
+
+
+def mark_projects_changed(session, project_ids):
+    """Evict these projects from project_cache when the session commits."""
+    session.info.setdefault(_PROJECTS_CHANGED, set()).update(
+        _project_cache_key(project_id) for project_id in project_ids
+    )
+
+
+# Allowed lifecycle transitions, keyed by current status
+ALLOWED_STATUS_TRANSITIONS = {
+    "created": frozenset({"initialized"}),
+    "initialized": frozenset({"consultation"}),
+    "consultation": frozenset({"active", "lost"}),
+    "lost": frozenset(),  # Terminal state
+    "active": frozenset({"suspended", "completed"}),
+    "suspended": frozenset({"active"}),
+    "completed": frozenset({"archived"}),
+    "archived": frozenset(),  # Terminal state
+}
+
 
 class Project(db.Model):
     """
@@ -114,7 +223,9 @@ class Project(db.Model):
 
     # Primary key
     id = db.Column(
-        db.String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        db.Uuid(as_uuid=False),
+        primary_key=True,
+        default=lambda: str(uuid.uuid4()),
     )
 
     # Core fields
@@ -122,17 +233,17 @@ class Project(db.Model):
     description = db.Column(db.String(500), nullable=True)
 
     # Multi-tenancy and ownership
-    company_id = db.Column(db.String(36), nullable=False, index=True)
+    company_id = db.Column(db.Uuid(as_uuid=False), nullable=False, index=True)
     customer_id = db.Column(
-        db.String(36), nullable=True
-    )  # Reference to Identity Service (external UUID as string)
+        db.Uuid(as_uuid=False), nullable=True
+    )  # Reference to Identity Service (external UUID)
     created_by = db.Column(
-        db.String(36), nullable=False
-    )  # User who created (external UUID as string)
+        db.Uuid(as_uuid=False), nullable=False
+    )  # User who created (external UUID)
 
     # Lifecycle status
     status = db.Column(
-        db.String(20), nullable=False, default="created", index=True
+        project_status_enum, nullable=False, default="created", index=True
     )
 
     # Consultation phase dates
@@ -155,8 +266,8 @@ class Project(db.Model):
         db.Numeric(12, 2), nullable=True
     )  # Decimal for precision
     budget_currency = db.Column(
-        db.String(3), nullable=True, default="EUR"
-    )  # ISO 4217
+        db.CHAR(3), nullable=True, default="EUR"
+    )  # ISO 4217 (fixed width, length enforced by the schemas)
 
     # Lifecycle timestamps
     suspended_at = db.Column(db.DateTime, nullable=True)
@@ -165,13 +276,13 @@ class Project(db.Model):
 
     # Audit trail
     created_at = db.Column(
-        db.DateTime, nullable=False, default=datetime.utcnow
+        db.DateTime, nullable=False, server_default=UtcNow()
     )
     updated_at = db.Column(
         db.DateTime,
         nullable=False,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=UtcNow(),
+        onupdate=UtcNow(),
     )
     removed_at = db.Column(db.DateTime, nullable=True)  # Soft delete
 
@@ -179,60 +290,71 @@ class Project(db.Model):
     members = db.relationship(
         "ProjectMember",
         back_populates="project",
-        lazy="dynamic",
+        lazy="raise",
         cascade="all, delete-orphan",
     )
     milestones = db.relationship(
         "Milestone",
         back_populates="project",
-        lazy="dynamic",
+        lazy="raise",
         cascade="all, delete-orphan",
     )
     deliverables = db.relationship(
         "Deliverable",
         back_populates="project",
-        lazy="dynamic",
+        lazy="raise",
         cascade="all, delete-orphan",
     )
     roles = db.relationship(
         "ProjectRole",
         back_populates="project",
-        lazy="dynamic",
+        lazy="raise",
         cascade="all, delete-orphan",
     )
     policies = db.relationship(
         "ProjectPolicy",
         back_populates="project",
-        lazy="dynamic",
+        lazy="raise",
         cascade="all, delete-orphan",
     )
     history = db.relationship(
         "ProjectHistory",
         back_populates="project",
-        lazy="dynamic",
+        lazy="raise",
         cascade="all, delete-orphan",
-        order_by="ProjectHistory.changed_at.desc()",
+        # Callable resolved at mapper configuration, no string evaluation.
+        # The lambda defers the lookup until ProjectHistory is defined.
+        order_by=lambda: ProjectHistory.changed_at.desc(),  # pylint: disable=unnecessary-lambda
     )
 
     # Indexes for performance
     __table_args__ = (
         Index("idx_projects_company_status", "company_id", "status"),
-        Index("idx_projects_company_removed", "company_id", "removed_at"),
-        Index("idx_projects_customer", "customer_id"),
-        CheckConstraint(
-            "status IN ('created', 'initialized', 'consultation', "
-            "'lost', 'active', 'suspended', 'completed', 'archived')",
-            name="check_project_status",
+        # Partial indexes: only active (non soft-deleted) rows are indexed
+        Index(
+            "idx_projects_company_active",
+            "company_id",
+            postgresql_where=db.text("removed_at IS NULL"),
         ),
-        CheckConstraint(
-            "budget_currency IS NULL OR length(budget_currency) = 3",
-            name="check_currency_code",
+        Index(
+            "idx_projects_company_status_active",
+            "company_id",
+            "status",
+            postgresql_where=db.text("removed_at IS NULL"),
         ),
+        Index("idx_projects_customer", "customer_id"),
     )
 
     def __repr__(self):
         return f"<Project {self.name} ({self.status})>"
 
+    @validates("customer_id", "created_by")
+    def validate_external_uuid(self, _key, value):
+        """Normalize external UUIDs (str or uuid.UUID) to canonical strings."""
+        if value is None:
+            return None
+        return str(uuid.UUID(str(value)))
+
     def is_active(self):
         """Check if project is not soft-deleted."""
         return self.removed_at is None
@@ -249,22 +371,123 @@ class Project(db.Model):
         - suspended -> active
         - completed -> archived
         """
-        transitions = {
-            "created": ["initialized"],
-            "initialized": ["consultation"],
-            "consultation": ["active", "lost"],
-            "lost": [],  # Terminal state
-            "active": ["suspended", "completed"],
-            "suspended": ["active"],
-            "completed": ["archived"],
-            "archived": [],  # Terminal state
-        }
-        return new_status in transitions.get(self.status, [])
+        return new_status in ALLOWED_STATUS_TRANSITIONS.get(
+            self.status, frozenset()
+        )
+
+    @classmethod
+    def soft_delete_many(cls, ids, session=None):
+        """
+        Soft delete several projects with a single UPDATE statement.
+
+        removed_at is set by the database (UtcNow()) and already deleted
+        projects are left untouched. The caller owns the transaction.
+
+        Args:
+            ids: Iterable of project IDs
+            session: Optional session (defaults to db.session)
+
+        Returns:
+            int: Number of projects soft-deleted
+        """
+        ids = list(ids)
+        session = session or db.session
+        stmt = (
+            update(cls)
+            .where(cls.id.in_(ids), cls.removed_at.is_(None))
+            .values(removed_at=UtcNow())
+            .execution_options(synchronize_session="fetch")
+        )
+        rowcount = session.execute(stmt).rowcount
+        # Bulk UPDATEs bypass the flush events: flag the changes explicitly
+        mark_projects_changed(session, ids)
+        mark_access_changed(session)
+        return rowcount
+
+    @classmethod
+    def get_cached(cls, project_id):
+        """
+        Return a ProjectSnapshot for project_id, memoized per process.
+
+        Entries are keyed by the canonical id, so every accepted spelling
+        of a UUID shares one entry. A snapshot is evicted when a
+        transaction updating or deleting the project commits, and expires
+        after PROJECT_CACHE_TTL.
+
+        Args:
+            project_id: Project ID
+
+        Returns:
+            ProjectSnapshot or None if the project does not exist
+        """
+        key = _project_cache_key(project_id)
+        if key is None:
+            return None
+        snapshot = project_cache.get(key)
+        if snapshot is not None:
+            return snapshot
+        project = db.session.get(cls, key)
+        if project is None:
+            return None
+        snapshot = ProjectSnapshot(
+            project.id, project.company_id, project.status, project.removed_at
+        )
+        project_cache.set(key, snapshot)
+        return snapshot
+
+    @classmethod
+    def get_active_cached(cls, project_id, company_id):
+        """
+        Return the cached snapshot of a non-deleted project of the company.
+
+        Args:
+            project_id: Project ID
+            company_id: Company ID from JWT
+
+        Returns:
+            ProjectSnapshot or None if the project does not exist, belongs
+            to another company or is soft-deleted
+        """
+        snapshot = cls.get_cached(project_id)
+        if (
+            snapshot is None
+            or snapshot.company_id != company_id
+            or snapshot.removed_at
+        ):
+            return None
+        return snapshot
+
+    @classmethod
+    def get_active(cls, project_id, company_id):
+        """
+        Return a non-deleted project of the company, read from the database.
+
+        Write endpoints use this instead of get_active_cached: a snapshot
+        cached by another worker may predate a soft delete.
+
+        Args:
+            project_id: Project ID
+            company_id: Company ID from JWT
+
+        Returns:
+            Project or None if the project does not exist, belongs to
+            another company or is soft-deleted
+        """
+        key = _project_cache_key(project_id)
+        if key is None:
+            return None
+        project = db.session.get(cls, key)
+        if (
+            project is None
+            or project.company_id != company_id
+            or project.removed_at
+        ):
+            return None
+        return project
 
     def soft_delete(self):
-        """Soft delete the project."""
-        self.removed_at = datetime.now(timezone.utc)
-        db.session.commit()
+        """Soft delete the project (the caller commits)."""
+        return self.soft_delete_many([self.id])
 
     def restore(self):
         """Restore a soft-deleted project."""
@@ -272,6 +495,36 @@ class Project(db.Model):
         db.session.commit()
 
 
+@event.listens_for(Session, "after_flush")
+def _flag_project_changes(session, _flush_context):
+    """Remember the projects updated or deleted by this transaction."""
+    changed = [
+        obj.id
+        for obj in (*session.dirty, *session.deleted)
+        if isinstance(obj, Project)
+    ]
+    if changed:
+        mark_projects_changed(session, changed)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_project_cache(session):
+    """
+    Evict changed projects once the transaction commits.
+
+    Evicting at flush time would let a concurrent request re-cache the
+    pre-change row before the commit makes the change visible.
+    """
+    for project_id in session.info.pop(_PROJECTS_CHANGED, ()):
+        project_cache.delete(project_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_project_changes(session):
+    """Forget project changes that were rolled back."""
+    session.info.pop(_PROJECTS_CHANGED, None)
+
+
 # ============================================================================
 # MILESTONE MODEL
 # ============================================================================
@@ -293,18 +546,20 @@ class Milestone(db.Model):
 
     # Primary key
     id = db.Column(
-        db.String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        db.Uuid(as_uuid=False),
+        primary_key=True,
+        default=lambda: str(uuid.uuid4()),
     )
 
     # Foreign keys
     project_id = db.Column(
-        db.String(36),
+        db.Uuid(as_uuid=False),
         db.ForeignKey("projects.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
     company_id = db.Column(
-        db.String(36), nullable=False, index=True
+        db.Uuid(as_uuid=False), nullable=False, index=True
     )  # Denormalized for performance
 
     # Core fields
@@ -312,19 +567,21 @@ class Milestone(db.Model):
     description = db.Column(db.String(500), nullable=True)
 
     # Status and dates
-    status = db.Column(db.String(20), nullable=False, default="planned")
+    status = db.Column(
+        milestone_status_enum, nullable=False, default="planned"
+    )
     planned_date = db.Column(db.Date, nullable=True)
     actual_date = db.Column(db.Date, nullable=True)
 
     # Audit trail
     created_at = db.Column(
-        db.DateTime, nullable=False, default=datetime.utcnow
+        db.DateTime, nullable=False, server_default=UtcNow()
     )
     updated_at = db.Column(
         db.DateTime,
         nullable=False,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=UtcNow(),
+        onupdate=UtcNow(),
     )
     removed_at = db.Column(db.DateTime, nullable=True)
 
@@ -337,12 +594,21 @@ class Milestone(db.Model):
         lazy="dynamic",
     )
 
+    # Server defaults (created_at, updated_at) come back with the
+    # INSERT/UPDATE (RETURNING) instead of a later refresh SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
     __table_args__ = (
         Index("idx_milestones_project_status", "project_id", "status"),
         Index("idx_milestones_company", "company_id"),
-        CheckConstraint(
-            "status IN ('planned', 'in_progress', 'completed', 'delayed', 'cancelled')",
-            name="check_milestone_status",
+        # Serves the project listing and its keyset pagination
+        # (newest first)
+        Index(
+            "idx_milestones_project_active",
+            "project_id",
+            db.text("created_at DESC"),
+            db.text("id DESC"),
+            postgresql_where=db.text("removed_at IS NULL"),
         ),
     )
 
@@ -367,37 +633,41 @@ class Deliverable(db.Model):
 
     # Primary key
     id = db.Column(
-        db.String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        db.Uuid(as_uuid=False),
+        primary_key=True,
+        default=lambda: str(uuid.uuid4()),
     )
 
     # Foreign keys
     project_id = db.Column(
-        db.String(36),
+        db.Uuid(as_uuid=False),
         db.ForeignKey("projects.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
-    company_id = db.Column(db.String(36), nullable=False, index=True)
+    company_id = db.Column(db.Uuid(as_uuid=False), nullable=False, index=True)
 
     # Core fields
     name = db.Column(db.String(100), nullable=False)
     description = db.Column(db.String(500), nullable=True)
-    type = db.Column(db.String(20), nullable=False, default="document")
+    type = db.Column(deliverable_type_enum, nullable=False, default="document")
 
     # Status and dates
-    status = db.Column(db.String(20), nullable=False, default="planned")
+    status = db.Column(
+        deliverable_status_enum, nullable=False, default="planned"
+    )
     planned_date = db.Column(db.Date, nullable=True)
     actual_date = db.Column(db.Date, nullable=True)
 
     # Audit trail
     created_at = db.Column(
-        db.DateTime, nullable=False, default=datetime.utcnow
+        db.DateTime, nullable=False, server_default=UtcNow()
     )
     updated_at = db.Column(
         db.DateTime,
         nullable=False,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=UtcNow(),
+        onupdate=UtcNow(),
     )
     removed_at = db.Column(db.DateTime, nullable=True)
 
@@ -410,16 +680,21 @@ class Deliverable(db.Model):
         lazy="dynamic",
     )
 
+    # Server defaults (created_at, updated_at) come back with the
+    # INSERT/UPDATE (RETURNING) instead of a later refresh SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
     __table_args__ = (
         Index("idx_deliverables_project_status", "project_id", "status"),
         Index("idx_deliverables_company", "company_id"),
-        CheckConstraint(
-            "status IN ('planned', 'in_progress', 'completed', 'delayed', 'cancelled')",
-            name="check_deliverable_status",
-        ),
-        CheckConstraint(
-            "type IN ('document', 'software', 'hardware', 'service', 'other')",
-            name="check_deliverable_type",
+        # Serves the project listing and its keyset pagination
+        # (newest first)
+        Index(
+            "idx_deliverables_project_active",
+            "project_id",
+            db.text("created_at DESC"),
+            db.text("id DESC"),
+            postgresql_where=db.text("removed_at IS NULL"),
         ),
     )
 
@@ -441,28 +716,38 @@ class ProjectMember(db.Model):
 
     __tablename__ = "project_members"
 
-    # Composite primary key (project_id, user_id)
+    # Surrogate primary key: keeps secondary index entries small
+    # (BIGINT on PostgreSQL, INTEGER on SQLite for rowid autoincrement)
+    id = db.Column(
+        db.BigInteger().with_variant(db.Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    )
+
+    # Natural key (project_id, user_id), enforced by uq_project_member
     project_id = db.Column(
-        db.String(36),
+        db.Uuid(as_uuid=False),
         db.ForeignKey("projects.id", ondelete="CASCADE"),
-        primary_key=True,
+        nullable=False,
     )
     user_id = db.Column(
-        db.String(36), primary_key=True
+        db.Uuid(as_uuid=False), nullable=False
     )  # Reference to Identity Service
 
     # Denormalized for performance
-    company_id = db.Column(db.String(36), nullable=False, index=True)
+    company_id = db.Column(db.Uuid(as_uuid=False), nullable=False, index=True)
 
     # Role assignment
     role_id = db.Column(
-        db.String(36), db.ForeignKey("project_roles.id"), nullable=False
+        db.Uuid(as_uuid=False),
+        db.ForeignKey("project_roles.id"),
+        nullable=False,
     )
 
     # Audit trail
-    added_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    added_at = db.Column(db.DateTime, nullable=False, server_default=UtcNow())
     added_by = db.Column(
-        db.String(36), nullable=False
+        db.Uuid(as_uuid=False), nullable=False
     )  # User who added this member
     removed_at = db.Column(db.DateTime, nullable=True)  # Soft delete
 
@@ -474,6 +759,23 @@ class ProjectMember(db.Model):
         Index("idx_project_members_user", "user_id"),
         Index("idx_project_members_company", "company_id"),
         Index("idx_project_members_role", "role_id"),
+        # Covers role_id: memberships and their role are resolved by
+        # index-only scans during access checks
+        Index(
+            "idx_project_members_user_active",
+            "user_id",
+            "project_id",
+            postgresql_where=db.text("removed_at IS NULL"),
+            postgresql_include=["role_id"],
+        ),
+        # Serves the member listing of a project
+        Index(
+            "idx_project_members_project_active",
+            "project_id",
+            "company_id",
+            postgresql_where=db.text("removed_at IS NULL"),
+        ),
+        db.UniqueConstraint("project_id", "user_id", name="uq_project_member"),
     )
 
     def __repr__(self):
@@ -502,17 +804,19 @@ class ProjectRole(db.Model):
 
     # Primary key
     id = db.Column(
-        db.String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        db.Uuid(as_uuid=False),
+        primary_key=True,
+        default=lambda: str(uuid.uuid4()),
     )
 
     # Foreign keys
     project_id = db.Column(
-        db.String(36),
+        db.Uuid(as_uuid=False),
         db.ForeignKey("projects.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
-    company_id = db.Column(db.String(36), nullable=False, index=True)
+    company_id = db.Column(db.Uuid(as_uuid=False), nullable=False, index=True)
 
     # Core fields
     name = db.Column(db.String(50), nullable=False)
@@ -523,13 +827,13 @@ class ProjectRole(db.Model):
 
     # Audit trail
     created_at = db.Column(
-        db.DateTime, nullable=False, default=datetime.utcnow
+        db.DateTime, nullable=False, server_default=UtcNow()
     )
     updated_at = db.Column(
         db.DateTime,
         nullable=False,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=UtcNow(),
+        onupdate=UtcNow(),
     )
     removed_at = db.Column(db.DateTime, nullable=True)
 
@@ -548,6 +852,28 @@ class ProjectRole(db.Model):
         db.UniqueConstraint("project_id", "name", name="uq_project_role_name"),
     )
 
+    def has_permission(self, permission_name):
+        """
+        Return True if an active policy of this role grants permission_name.
+
+        Resolved with a single lookup against the precomputed
+        role → permission mapping (see ``role_permissions_source``).
+        """
+        kind = PERMISSION_KINDS.get(permission_name)
+        if kind is None:
+            return False
+        source = role_permissions_source(db.session.get_bind().dialect.name)
+        return bool(
+            db.session.scalar(
+                select(
+                    exists().where(
+                        source.c.role_id == self.id,
+                        source.c.permission_kind == kind,
+                    )
+                )
+            )
+        )
+
     def __repr__(self):
         return f"<ProjectRole {self.name}>"
 
@@ -569,17 +895,19 @@ class ProjectPolicy(db.Model):
 
     # Primary key
     id = db.Column(
-        db.String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        db.Uuid(as_uuid=False),
+        primary_key=True,
+        default=lambda: str(uuid.uuid4()),
     )
 
     # Foreign keys
     project_id = db.Column(
-        db.String(36),
+        db.Uuid(as_uuid=False),
         db.ForeignKey("projects.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
-    company_id = db.Column(db.String(36), nullable=False, index=True)
+    company_id = db.Column(db.Uuid(as_uuid=False), nullable=False, index=True)
 
     # Core fields
     name = db.Column(db.String(50), nullable=False)
@@ -587,13 +915,13 @@ class ProjectPolicy(db.Model):
 
     # Audit trail
     created_at = db.Column(
-        db.DateTime, nullable=False, default=datetime.utcnow
+        db.DateTime, nullable=False, server_default=UtcNow()
     )
     updated_at = db.Column(
         db.DateTime,
         nullable=False,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=UtcNow(),
+        onupdate=UtcNow(),
     )
     removed_at = db.Column(db.DateTime, nullable=True)
 
@@ -655,20 +983,24 @@ class ProjectPermission(db.Model):
 
     # Primary key
     id = db.Column(
-        db.String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        db.Uuid(as_uuid=False),
+        primary_key=True,
+        default=lambda: str(uuid.uuid4()),
     )
 
     # Foreign keys
     project_id = db.Column(
-        db.String(36),
+        db.Uuid(as_uuid=False),
         db.ForeignKey("projects.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
-    company_id = db.Column(db.String(36), nullable=False, index=True)
+    company_id = db.Column(db.Uuid(as_uuid=False), nullable=False, index=True)
 
     # Core fields
     name = db.Column(db.String(50), nullable=False)
+    # SMALLINT code of name (see PERMISSION_KINDS), used by RBAC lookups
+    kind = db.Column(db.SmallInteger, nullable=False)
     description = db.Column(db.String(200), nullable=True)
     category = db.Column(
         db.String(20), nullable=False
@@ -676,7 +1008,7 @@ class ProjectPermission(db.Model):
 
     # Audit trail
     created_at = db.Column(
-        db.DateTime, nullable=False, default=datetime.utcnow
+        db.DateTime, nullable=False, server_default=UtcNow()
     )
     removed_at = db.Column(db.DateTime, nullable=True)
 
@@ -685,11 +1017,17 @@ class ProjectPermission(db.Model):
         "ProjectPolicy",
         secondary=policy_permission_association,
         back_populates="permissions",
-        lazy="dynamic",
+        lazy="select",
     )
 
     __table_args__ = (
-        Index("idx_project_permissions_project_name", "project_id", "name"),
+        # Full (project_id, name) lookups use uq_project_permission_name
+        Index(
+            "idx_project_permissions_active_lookup",
+            "project_id",
+            "kind",
+            postgresql_where=db.text("removed_at IS NULL"),
+        ),
         Index("idx_project_permissions_company", "company_id"),
         Index("idx_project_permissions_category", "category"),
         db.UniqueConstraint(
@@ -699,12 +1037,236 @@ class ProjectPermission(db.Model):
             "category IN ('file_operations', 'project_operations', 'member_operations')",
             name="check_permission_category",
         ),
+        CheckConstraint(
+            "kind BETWEEN 1 AND 10",
+            name="check_permission_kind",
+        ),
     )
 
+    @validates("name")
+    def validate_name(self, _key, value):
+        """Restrict name to the predefined permissions and derive kind."""
+        if value not in PERMISSION_KINDS:
+            raise ValueError(f"Unknown permission: {value}")
+        self.kind = PERMISSION_KINDS[value]
+        return value
+
     def __repr__(self):
         return f"<ProjectPermission {self.name} ({self.category})>"
 
 
+# ============================================================================
+# RBAC: RESOLVED ROLE PERMISSIONS (materialized view on PostgreSQL)
+# ============================================================================
+
+ROLE_PERMISSIONS_VIEW = "role_permissions_mv"
+
+# Declared on its own MetaData so that db.create_all() never creates it as a
+# table: the view is owned by the Alembic migration.
+role_permissions_mv = Table(
+    ROLE_PERMISSIONS_VIEW,
+    MetaData(),
+    Column("role_id", Uuid(as_uuid=False), nullable=False),
+    Column("permission_kind", SmallInteger, nullable=False),
+)
+
+# Same mapping computed inline, used where materialized views are not
+# available (SQLite in tests).
+role_permissions_join = (
+    select(
+        role_policy_association.c.role_id.label("role_id"),
+        ProjectPermission.kind.label("permission_kind"),
+    )
+    .join(
+        ProjectPolicy, ProjectPolicy.id == role_policy_association.c.policy_id
+    )
+    .join(
+        policy_permission_association,
+        policy_permission_association.c.policy_id == ProjectPolicy.id,
+    )
+    .join(
+        ProjectPermission,
+        ProjectPermission.id == policy_permission_association.c.permission_id,
+    )
+    .where(
+        ProjectPolicy.removed_at.is_(None),
+        ProjectPermission.removed_at.is_(None),
+    )
+    .subquery("role_permissions")
+)
+
+# Changes to these models alter the role → permission mapping
+_ROLE_PERMISSION_MODELS = (ProjectRole, ProjectPolicy, ProjectPermission)
+
+
+def role_permissions_source(dialect_name):
+    """
+    Return the selectable exposing (role_id, permission_kind) pairs.
+
+    PostgreSQL reads the materialized view; other dialects fall back to the
+    equivalent join.
+    """
+    if dialect_name == "postgresql":
+        return role_permissions_mv
+    return role_permissions_join
+
+
+# Seconds during which committed RBAC changes are coalesced into one refresh
+ROLE_PERMISSIONS_REFRESH_DELAY = 1.0
+
+# session.info flag: the transaction changed the role → permission mapping
+_ROLE_PERMISSIONS_CHANGED = "role_permissions_changed"
+
+
+class _ViewRefresher:
+    """
+    Refresh a materialized view in the background, once per burst of changes.
+
+    The first commit of a burst arms a timer; commits landing before it
+    fires are served by the same refresh. A commit landing while the
+    refresh runs arms a new timer, so its change is never missed.
+    """
+
+    def __init__(self, view, delay):
+        self.view = view
+        self.delay = delay
+        self._timer = None
+        self._lock = threading.Lock()
+
+    def schedule(self, engine):
+        """Refresh the view on engine within ``delay`` seconds."""
+        with self._lock:
+            if self._timer is not None:
+                return
+            self._timer = threading.Timer(
+                self.delay, self._refresh, args=(engine,)
+            )
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _refresh(self, engine):
+        with self._lock:
+            self._timer = None
+        try:
+            with engine.begin() as connection:
+                connection.execute(
+                    db.text(
+                        f"REFRESH MATERIALIZED VIEW CONCURRENTLY {self.view}"
+                    )
+                )
+        except SQLAlchemyError:
+            logger.exception(
+                "Materialized view refresh failed", view=self.view
+            )
+        # Decisions cached from the view before the refresh may be stale
+        permission_cache.clear()
+        member_access_cache.clear()
+
+
+role_permissions_refresher = _ViewRefresher(
+    ROLE_PERMISSIONS_VIEW, ROLE_PERMISSIONS_REFRESH_DELAY
+)
+
+
+@event.listens_for(Session, "after_flush")
+def _flag_role_permission_changes(session, _flush_context):
+    """Flag transactions that modify roles, policies or permissions."""
+    changed = (*session.new, *session.dirty, *session.deleted)
+    if any(isinstance(obj, _ROLE_PERMISSION_MODELS) for obj in changed):
+        session.info[_ROLE_PERMISSIONS_CHANGED] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _refresh_role_permissions(session):
+    """
+    Schedule a refresh of the materialized view after RBAC changes commit.
+
+    The refresh runs outside the request transaction, so writers do not
+    queue behind it. Authorization checks may read the previous mapping
+    for up to ROLE_PERMISSIONS_REFRESH_DELAY seconds plus the refresh time.
+    """
+    if not session.info.pop(_ROLE_PERMISSIONS_CHANGED, False):
+        return
+    engine = session.get_bind()
+    if engine.dialect.name == "postgresql":
+        role_permissions_refresher.schedule(engine)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_role_permission_changes(session):
+    """Forget RBAC changes that were rolled back."""
+    session.info.pop(_ROLE_PERMISSIONS_CHANGED, None)
+
+
+# ============================================================================
+# RBAC: PERMISSION DECISION CACHE
+# ============================================================================
+
+# Seconds a cached permission decision stays valid in a worker process.
+# This is also the staleness bound across workers: an access change clears
+# the caches of the worker that commits it only, so other gunicorn workers
+# may keep answering from a decision (a revoked grant included) for up to
+# PERMISSION_CACHE_TTL seconds after the commit.
+PERMISSION_CACHE_TTL = 60
+
+# (user_id, company_id, project_id, permission name) -> allowed
+permission_cache = TTLCache(ttl=PERMISSION_CACHE_TTL, maxsize=100_000)
+
+# (user_id, company_id, project_id) -> membership, role and permissions of
+# the user on an existing project (batch endpoints)
+member_access_cache = TTLCache(ttl=PERMISSION_CACHE_TTL, maxsize=100_000)
+
+# session.info flag: the transaction changed data behind access decisions
+_ACCESS_CHANGED = "access_changed"
+
+
+def mark_access_changed(session):
+    """Clear the permission cache when the session's transaction commits."""
+    session.info[_ACCESS_CHANGED] = True
+
+
+def _affects_access(session, obj):
+    """Return True if a flushed object can change a permission decision."""
+    if isinstance(obj, Project):
+        return (
+            obj in session.deleted
+            or inspect(obj).attrs.removed_at.history.has_changes()
+        )
+    return isinstance(obj, (ProjectMember, *_ROLE_PERMISSION_MODELS))
+
+
+@event.listens_for(Session, "after_flush")
+def _flag_access_changes(session, _flush_context):
+    """Flag transactions that modify projects, members or RBAC rows."""
+    changed = (*session.new, *session.dirty, *session.deleted)
+    if any(_affects_access(session, obj) for obj in changed):
+        mark_access_changed(session)
+
+
+@event.listens_for(Session, "after_commit")
+def _clear_permission_cache(session):
+    """
+    Drop cached decisions once access changes are committed.
+
+    Clearing starts a new cache generation: a request that read the
+    database before the commit captured the previous generation, so its
+    pre-change decision is not cached (see TTLCache.set_many).
+
+    Only this process is cleared. Other worker processes keep their
+    entries until they expire, i.e. for at most PERMISSION_CACHE_TTL
+    seconds after the commit.
+    """
+    if session.info.pop(_ACCESS_CHANGED, False):
+        permission_cache.clear()
+        member_access_cache.clear()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_access_changes(session):
+    """Forget access changes that were rolled back."""
+    session.info.pop(_ACCESS_CHANGED, None)
+
+
 # ============================================================================
 # PROJECT HISTORY MODEL (Audit Trail)
 # ============================================================================
@@ -715,30 +1277,40 @@ class ProjectHistory(db.Model):
     ProjectHistory model for audit trail of project changes.
 
     Tracks all significant changes to projects for compliance and debugging.
+
+    On PostgreSQL the table is range-partitioned by month on changed_at
+    (primary key (id, changed_at)); partitions are created and expired by
+    ``flask project-history partitions``.
     """
 
     __tablename__ = "project_history"
 
-    # Primary key
+    # Primary key (id, changed_at): see the partitioning note above
     id = db.Column(
-        db.String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        db.Uuid(as_uuid=False),
+        primary_key=True,
+        default=lambda: str(uuid.uuid4()),
     )
 
     # Foreign keys
     project_id = db.Column(
-        db.String(36),
+        db.Uuid(as_uuid=False),
         db.ForeignKey("projects.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
-    company_id = db.Column(db.String(36), nullable=False, index=True)
+    company_id = db.Column(db.Uuid(as_uuid=False), nullable=False)
 
     # Change tracking
     changed_by = db.Column(
-        db.String(36), nullable=False
-    )  # User who made the change (external UUID as string)
+        db.Uuid(as_uuid=False), nullable=False
+    )  # User who made the change (external UUID)
+    # Part of the identity and the partition key: filled by the database
+    # in UTC and fetched back on INSERT (eager_defaults below)
     changed_at = db.Column(
-        db.DateTime, nullable=False, default=datetime.utcnow, index=True
+        db.DateTime,
+        primary_key=True,
+        nullable=False,
+        server_default=UtcNow(),
     )
 
     # Change details
@@ -760,9 +1332,14 @@ class ProjectHistory(db.Model):
     project = db.relationship("Project", back_populates="history")
 
     __table_args__ = (
-        Index("idx_project_history_project_date", "project_id", "changed_at"),
-        Index("idx_project_history_company", "company_id"),
-        Index("idx_project_history_action", "action"),
+        # Only index of this append-heavy table: serves the newest-first
+        # per-project listing (and Project.history) as well as project_id
+        # lookups for the cascading delete
+        Index(
+            "idx_history_project_changed_desc",
+            "project_id",
+            db.text("changed_at DESC"),
+        ),
         CheckConstraint(
             "action IN ('created', 'updated', 'status_changed', "
             "'deleted', 'restored', 'member_added', 'member_removed', "
@@ -771,5 +1348,23 @@ class ProjectHistory(db.Model):
         ),
     )
 
+    __mapper_args__ = {"eager_defaults": True}
+
+    @classmethod
+    def record_many(cls, entries, session=None):
+        """
+        Insert several audit entries with a single executemany INSERT.
+
+        No ORM objects are built; id and changed_at come from the column
+        defaults. The caller owns the transaction, so the entries commit
+        or roll back together with the change they describe.
+
+        Args:
+            entries: List of dicts of column values, all with the same keys
+            session: Optional session (defaults to db.session)
+        """
+        if entries:
+            (session or db.session).execute(insert(cls), entries)
+
     def __repr__(self):
         return f"<ProjectHistory {self.action} at {self.changed_at}>"
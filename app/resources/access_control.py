@@ -15,152 +15,622 @@ Resources:
 - CheckProjectAccessResource: POST /check-project-access (single project authorization)
 - CheckFileAccessBatchResource: POST /check-file-access-batch (batch file authorization)
 - CheckProjectAccessBatchResource: POST /check-project-access-batch (batch project authorization)
+
+Decisions are cached per worker process. An access change (revoked
+permission, removed member, deleted project...) takes effect immediately
+in the worker that commits it, and in the other workers within
+PERMISSION_CACHE_TTL seconds.
 """
 
-from flask import g, request
+import re
+import uuid
+from collections import defaultdict, namedtuple
+from operator import itemgetter
+
+from flask import current_app, g, request
 from flask_restful import Resource
+from marshmallow import ValidationError
+from sqlalchemy import and_, bindparam, select, text, tuple_
 from app.models.db import db
-from app.models.project import Project, ProjectMember
-from app.utils import require_jwt_auth
+from app.models.project import (
+    PERMISSION_KINDS,
+    PERMISSION_NAMES,
+    Project,
+    ProjectMember,
+    ProjectRole,
+    member_access_cache,
+    permission_cache,
+    role_permissions_join,
+    role_permissions_source,
+)
+from app.schemas import FileAccessCheckSchema, ProjectAccessCheckSchema
+from app.utils import (
+    ConcurrencyLimiter,
+    Singleflight,
+    limit_concurrency,
+    require_jwt_auth,
+    stream_json_list,
+)
+
+# Fields every check of a request must provide, in response order
+# (project_id and action always come last)
+_FILE_CHECK_FIELDS = ("file_id", "project_id", "action")
+_PROJECT_CHECK_FIELDS = ("project_id", "action")
+
+_file_checks_schema = FileAccessCheckSchema(many=True)
+_project_checks_schema = ProjectAccessCheckSchema(many=True)
+
+
+# Canonical (lowercase, hyphenated) UUID: returned as is, without parsing
+_CANONICAL_UUID_RE = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+)
+
+
+def _canonical_uuid(value):
+    """Return value as a canonical UUID string, or None if malformed."""
+    if isinstance(value, str) and _CANONICAL_UUID_RE.fullmatch(value):
+        return value
+    try:
+        return str(uuid.UUID(str(value)))
+    except ValueError:
+        return None
+
+
+def _load_checks(schema, checks):
+    """
+    Validate the checks of a request in one pass.
 
+    Args:
+        schema: Check schema instance loading with many=True
+        checks: List of checks from the request body
 
-class CheckFileAccessResource(Resource):
+    Returns:
+        tuple: (loaded check dicts, frozenset of invalid check indexes).
+            Invalid checks keep only their valid fields.
     """
-    Check if user has permission to access files.
+    try:
+        return schema.load(checks), frozenset()
+    except ValidationError as error:
+        return error.valid_data, frozenset(error.messages)
 
-    POST: Batch check file access permissions
-    Expected JSON body:
-    {
-        "file_checks": [
-            {"file_id": "uuid", "project_id": "uuid", "action": "read_files"},
-            {"file_id": "uuid", "project_id": "uuid", "action": "write_files"}
-        ]
-    }
+
+def _check_pairs(checks, invalid):
+    """
+    Collect the distinct (project_id, action) pairs of well-formed checks.
+
+    Project IDs are canonicalized; invalid checks and checks with a
+    malformed project ID are skipped (they are never allowed).
+
+    Args:
+        checks: List of loaded check dicts
+        invalid: Frozenset of invalid check indexes
+    """
+    pairs = set()
+    for index, check in enumerate(checks):
+        if index in invalid:
+            continue
+        project_id = _canonical_uuid(check["project_id"])
+        if project_id is not None:
+            pairs.add((project_id, check["action"]))
+    return pairs
+
+
+# Permission checks currently evaluated by this worker, keyed like the cache
+_inflight_checks = Singleflight()
+
+# Access-check requests in flight per user, shared by the four endpoints
+_check_requests = ConcurrencyLimiter()
+
+
+def _allowed_permission_pairs(user_id, company_id, pairs):
+    """
+    Return the subset of (project_id, action) pairs granted to the user.
+
+    Actions that are not predefined permissions are never granted and are
+    dropped up front. Decisions are served from the process-local
+    permission cache; only the misses are evaluated against the database,
+    then cached. Misses already being evaluated by a concurrent request of
+    the same worker are awaited rather than queried again.
+
+    Args:
+        user_id: User ID
+        company_id: Company ID
+        pairs: Set of (canonical project_id, permission name) tuples
 
     Returns:
-    {
-        "results": [
-            {"file_id": "uuid", "project_id": "uuid", "action": "read_files", "allowed": true},
-            {"file_id": "uuid", "project_id": "uuid", "action": "write_files", "allowed": false}
-        ]
+        set: The allowed (project_id, permission name) tuples
+    """
+    keys = {
+        (user_id, company_id, *pair): pair
+        for pair in pairs
+        if pair[1] in PERMISSION_KINDS
     }
+    # Captured before any read: decisions evaluated on data that a commit
+    # invalidated in the meantime are then not cached
+    generation = permission_cache.generation
+    decisions = permission_cache.get_many(keys)
+    misses = {key: pair for key, pair in keys.items() if key not in decisions}
+    decisions.update(
+        _inflight_checks.run_many(
+            misses,
+            lambda owned: _query_decisions(
+                user_id,
+                company_id,
+                {key: misses[key] for key in owned},
+                generation,
+            ),
+        )
+    )
+    return {keys[key] for key, allowed in decisions.items() if allowed}
+
+
+def _query_decisions(user_id, company_id, misses, generation):
     """
+    Evaluate and cache the decisions of uncached checks.
 
-    @require_jwt_auth()
-    def post(self):
-        """
-        Batch check file access permissions for the authenticated user.
+    Args:
+        user_id: User ID
+        company_id: Company ID
+        misses: Dict of cache key -> (canonical project_id, action) pair
+        generation: permission_cache generation captured before the read
 
-        Evaluates the complete permission chain for each file check.
-        """
-        company_id = g.company_id
-        user_id = g.user_id
+    Returns:
+        dict: cache key -> allowed
+    """
+    allowed = _query_allowed_pairs(user_id, company_id, set(misses.values()))
+    decisions = {key: pair in allowed for key, pair in misses.items()}
+    permission_cache.set_many(decisions, generation)
+    return decisions
 
-        data = request.get_json()
-        if not data or "file_checks" not in data:
-            return {"error": "file_checks array is required"}, 400
 
-        file_checks = data["file_checks"]
-        if not isinstance(file_checks, list):
-            return {"error": "file_checks must be an array"}, 400
+# Server-side evaluation of a whole batch, defined by a migration
+# (PostgreSQL only)
+REBAC_CHECK_BATCH = text(
+    "SELECT project_id, kind FROM rebac_check_batch("
+    "CAST(:user_id AS uuid), CAST(:company_id AS uuid), "
+    "CAST(:project_ids AS uuid[]), CAST(:kinds AS smallint[])) "
+    "WHERE allowed"
+).columns(project_id=db.Uuid(as_uuid=False), kind=db.SmallInteger)
 
-        results = []
 
-        for check in file_checks:
-            # Validate check structure
-            if not all(
-                key in check for key in ["file_id", "project_id", "action"]
-            ):
-                results.append(
-                    {
-                        "file_id": check.get("file_id"),
-                        "project_id": check.get("project_id"),
-                        "action": check.get("action"),
-                        "allowed": False,
-                        "reason": "Invalid check format",
-                    }
-                )
-                continue
+def _begin_read_only_snapshot():
+    """
+    Open the request's transaction as READ ONLY, REPEATABLE READ.
 
-            file_id = check["file_id"]
-            project_id = check["project_id"]
-            action = check["action"]
+    Every statement evaluating a batch then shares one snapshot instead of
+    acquiring its own. PostgreSQL only, and only when the session has not
+    started its transaction yet; the isolation level and read-only flag
+    are reset when the connection returns to the pool.
+    """
+    session = db.session()
+    if session.in_transaction():
+        return
+    if session.get_bind().dialect.name != "postgresql":
+        return
+    session.connection(
+        execution_options={
+            "isolation_level": "REPEATABLE READ",
+            "postgresql_readonly": True,
+        }
+    )
 
-            # Check permission
-            allowed = self._check_user_permission(
-                user_id, company_id, project_id, action
-            )
 
-            results.append(
+# Pairs evaluated per statement: keeps IN lists and arrays at a size the
+# PostgreSQL planner handles well, whatever the size of the request
+QUERY_CHUNK_SIZE = 500
+
+
+def _query_allowed_pairs(user_id, company_id, pairs):
+    """
+    Return the subset of (project_id, action) pairs granted to the user.
+
+    Pairs are evaluated by chunks of QUERY_CHUNK_SIZE, one statement per
+    chunk covering the complete RBAC chain, with every soft-delete filter
+    applied in the database:
+    1. Project belongs to company and is not deleted
+    2. User is an active member of the project
+    3. Member's role is active
+    4-5. An active policy of the role grants the permission
+
+    Pairs on projects the user is not an active member of are denied by a
+    prelude query without walking the chain; actions are matched on their
+    SMALLINT permission kind.
+
+    Args:
+        user_id: User ID
+        company_id: Company ID
+        pairs: Set of (canonical project_id, predefined permission name)
+            tuples
+
+    Returns:
+        set: The allowed (project_id, permission name) tuples
+    """
+    if not pairs:
+        return set()
+
+    _begin_read_only_snapshot()
+    member_project_ids = _member_project_ids(
+        user_id, {project_id for project_id, _ in pairs}
+    )
+    kind_pairs = [
+        (project_id, PERMISSION_KINDS[action])
+        for project_id, action in pairs
+        if project_id in member_project_ids
+    ]
+    if not kind_pairs:
+        return set()
+
+    dialect_name = db.session.get_bind().dialect.name
+    allowed = set()
+    for start in range(0, len(kind_pairs), QUERY_CHUNK_SIZE):
+        rows = _execute_allowed_kinds(
+            user_id,
+            company_id,
+            kind_pairs[start : start + QUERY_CHUNK_SIZE],
+            dialect_name,
+        )
+        allowed.update(
+            (project_id, PERMISSION_NAMES[kind]) for project_id, kind in rows
+        )
+    return allowed
+
+
+# Projects among :project_ids the user is an active member of, answered
+# from idx_project_members_user_active
+MEMBER_PROJECTS_QUERY = select(ProjectMember.project_id).where(
+    ProjectMember.user_id == bindparam("user_id"),
+    ProjectMember.removed_at.is_(None),
+    ProjectMember.project_id.in_(bindparam("project_ids", expanding=True)),
+)
+
+
+def _member_project_ids(user_id, project_ids):
+    """
+    Return the subset of project_ids the user is an active member of.
+
+    Args:
+        user_id: User ID
+        project_ids: Set of canonical project IDs
+
+    Returns:
+        set: The canonical IDs of the user's projects
+    """
+    project_ids = list(project_ids)
+    member_project_ids = set()
+    for start in range(0, len(project_ids), QUERY_CHUNK_SIZE):
+        member_project_ids.update(
+            db.session.scalars(
+                MEMBER_PROJECTS_QUERY,
                 {
-                    "file_id": file_id,
-                    "project_id": project_id,
-                    "action": action,
-                    "allowed": allowed,
-                }
+                    "user_id": user_id,
+                    "project_ids": project_ids[
+                        start : start + QUERY_CHUNK_SIZE
+                    ],
+                },
             )
+        )
+    return member_project_ids
+
+
+# Portable equivalent of rebac_check_batch(), built once (other dialects)
+ALLOWED_KINDS_QUERY = (
+    select(ProjectMember.project_id, role_permissions_join.c.permission_kind)
+    .join(Project, Project.id == ProjectMember.project_id)
+    .join(ProjectRole, ProjectRole.id == ProjectMember.role_id)
+    .join(
+        role_permissions_join,
+        role_permissions_join.c.role_id == ProjectRole.id,
+    )
+    .where(
+        ProjectMember.user_id == bindparam("user_id"),
+        ProjectMember.removed_at.is_(None),
+        Project.company_id == bindparam("company_id"),
+        Project.removed_at.is_(None),
+        ProjectRole.removed_at.is_(None),
+        tuple_(
+            ProjectMember.project_id,
+            role_permissions_join.c.permission_kind,
+        ).in_(bindparam("kind_pairs", expanding=True)),
+    )
+)
+
+
+def _execute_allowed_kinds(user_id, company_id, kind_pairs, dialect_name):
+    """
+    Run one statement returning the granted (project_id, kind) rows.
 
-        return {"results": results}, 200
+    PostgreSQL runs the rebac_check_batch() function; other dialects
+    (SQLite in tests) run the equivalent JOIN query. Both statements are
+    built once at import; only their parameters change between calls.
+    """
+    if dialect_name == "postgresql":
+        project_ids, kinds = zip(*kind_pairs)
+        return db.session.execute(
+            REBAC_CHECK_BATCH,
+            {
+                "user_id": user_id,
+                "company_id": company_id,
+                "project_ids": list(project_ids),
+                "kinds": list(kinds),
+            },
+        )
+    return db.session.execute(
+        ALLOWED_KINDS_QUERY,
+        {
+            "user_id": user_id,
+            "company_id": company_id,
+            "kind_pairs": kind_pairs,
+        },
+    )
 
-    def _check_user_permission(self, user_id, company_id, project_id, action):
-        """
-        Check if user has permission to perform action on project.
 
-        Evaluates the complete RBAC chain:
-        1. Project exists and belongs to company
-        2. User is a member of the project
-        3. Member has roles
-        4. Roles have policies
-        5. Policies have the required permission
+def _iter_check_results(checks, invalid, fields, allowed_pairs):
+    """
+    Generate the response entries of a batch from its allowed pairs.
+
+    Each entry echoes the check's fields followed by its decision. Invalid
+    checks are denied with an "Invalid check format" reason, and checks
+    whose action is not a predefined permission with an "Unknown action"
+    reason.
 
-        Args:
-            user_id: User ID
-            company_id: Company ID
-            project_id: Project ID
-            action: Permission action (e.g., 'read_files', 'write_files')
+    Args:
+        checks: List of loaded check dicts
+        invalid: Frozenset of invalid check indexes
+        fields: Tuple of required fields, ending with project_id and action
+        allowed_pairs: Set of allowed (canonical project_id, action) tuples
 
-        Returns:
-            bool: True if user has permission, False otherwise
+    Yields:
+        dict: One result per check, in request order
+    """
+    get_fields = itemgetter(*fields)
+    for index, check in enumerate(checks):
+        if index in invalid:
+            result = {field: check.get(field) for field in fields}
+            result["allowed"] = False
+            result["reason"] = "Invalid check format"
+        else:
+            values = get_fields(check)
+            project_id, action = values[-2:]
+            result = dict(zip(fields, values))
+            if action not in PERMISSION_KINDS:
+                result["allowed"] = False
+                result["reason"] = "Unknown action"
+            else:
+                pair = (_canonical_uuid(project_id), action)
+                result["allowed"] = pair in allowed_pairs
+        yield result
+
+
+# Access of the requesting user to one existing project (batch endpoints).
+# role_name is None when the member has no active role.
+MemberAccess = namedtuple(
+    "MemberAccess", ["is_member", "role_name", "permissions"]
+)
+
+
+def _load_member_access(user_id, company_id, project_ids):
+    """
+    Load the user's membership, role and permissions for several projects.
+
+    Access to existing projects is served from the process-local member
+    access cache (cleared whenever access changes are committed); only the
+    other projects are queried, then cached.
+
+    Args:
+        user_id: User ID
+        company_id: Company ID
+        project_ids: Set of canonical project IDs
+
+    Returns:
+        dict: project_id -> MemberAccess, for existing projects only
+    """
+    keys = {
+        (user_id, company_id, project_id): project_id
+        for project_id in project_ids
+    }
+    generation = member_access_cache.generation
+    cached = member_access_cache.get_many(keys)
+    access = {keys[key]: value for key, value in cached.items()}
+    misses = {
+        project_id for key, project_id in keys.items() if key not in cached
+    }
+    loaded = _query_member_access(user_id, company_id, misses)
+    member_access_cache.set_many(
+        {
+            (user_id, company_id, project_id): value
+            for project_id, value in loaded.items()
+        },
+        generation,
+    )
+    access.update(loaded)
+    return access
+
+
+def _query_member_access(user_id, company_id, project_ids):
+    """
+    Query the user's membership, role and permissions for several projects.
+
+    Two queries cover a whole batch: one joins each active project of the
+    company to the user's active membership and active role, the other
+    fetches the permissions granted to those roles.
+
+    Args:
+        user_id: User ID
+        company_id: Company ID
+        project_ids: Set of canonical project IDs
+
+    Returns:
+        dict: project_id -> MemberAccess, for existing projects only
+    """
+    if not project_ids:
+        return {}
+
+    _begin_read_only_snapshot()
+    rows = db.session.execute(
+        select(
+            Project.id.label("project_id"),
+            ProjectMember.id.label("member_id"),
+            ProjectRole.id.label("role_id"),
+            ProjectRole.name.label("role_name"),
+        )
+        .outerjoin(
+            ProjectMember,
+            and_(
+                ProjectMember.project_id == Project.id,
+                ProjectMember.user_id == user_id,
+                ProjectMember.removed_at.is_(None),
+            ),
+        )
+        .outerjoin(
+            ProjectRole,
+            and_(
+                ProjectRole.id == ProjectMember.role_id,
+                ProjectRole.removed_at.is_(None),
+            ),
+        )
+        .where(
+            Project.id.in_(project_ids),
+            Project.company_id == company_id,
+            Project.removed_at.is_(None),
+        )
+    ).all()
+
+    permissions = defaultdict(set)
+    role_ids = {row.role_id for row in rows if row.role_id is not None}
+    if role_ids:
+        role_permissions = role_permissions_source(
+            db.session.get_bind().dialect.name
+        )
+        granted = db.session.execute(
+            select(
+                role_permissions.c.role_id, role_permissions.c.permission_kind
+            ).where(role_permissions.c.role_id.in_(role_ids))
+        )
+        for role_id, kind in granted:
+            permissions[role_id].add(PERMISSION_NAMES[kind])
+
+    # One permission name set per role, shared by all its checks
+    permission_sets = {
+        role_id: frozenset(names) for role_id, names in permissions.items()
+    }
+    return {
+        row.project_id: MemberAccess(
+            is_member=row.member_id is not None,
+            role_name=row.role_name,
+            permissions=permission_sets.get(row.role_id, frozenset()),
+        )
+        for row in rows
+    }
+
+
+def _evaluate_member_access(member_access, permission_name):
+    """
+    Evaluate the RBAC chain for one check from preloaded member access.
+
+    1. Project exists and belongs to company
+    2. User is a member of the project
+    3. Member has an active role
+    4-5. An active policy of the role grants the permission
+
+    Returns:
+        tuple: (allowed: bool, role_name: str|None, reason: str|None)
+    """
+    if member_access is None:
+        return False, None, "Project not found"
+    if not member_access.is_member:
+        return False, None, "User is not a member of the project"
+    if member_access.role_name is None:
+        return False, None, "No valid role assigned"
+    if permission_name in member_access.permissions:
+        return True, member_access.role_name, None
+    return False, member_access.role_name, "Permission denied"
+
+
+def _batch_size_error(checks):
+    """
+    Reject requests carrying more checks than accepted, before any work.
+
+    Returns:
+        tuple|None: A 413 response, or None if the batch is accepted
+    """
+    max_batch = current_app.extensions["cfg"].max_access_check_batch
+    if len(checks) > max_batch:
+        return {"error": f"At most {max_batch} checks per request"}, 413
+    return None
+
+
+class _AccessCheckResource(Resource):
+    """
+    Base of the endpoints answering allowed/denied for each check.
+
+    Subclasses name the request key holding the checks, the schema loading
+    them and the fields echoed in each result.
+    """
+
+    checks_key = None
+    checks_schema = None
+    check_fields = ()
+
+    @require_jwt_auth()
+    @limit_concurrency(_check_requests, "max_concurrent_checks")
+    def post(self):
+        """
+        Batch check access permissions for the authenticated user.
+
+        Evaluates the complete permission chain for each check.
         """
-        # 1. Verify project exists and belongs to company
-        project = db.session.get(Project, project_id)
-        if (
-            not project
-            or project.company_id != company_id
-            or project.removed_at
-        ):
-            return False
-
-        # 2. Get user's membership in the project
-        member = (
-            db.session.query(ProjectMember)
-            .filter_by(project_id=project_id, user_id=user_id)
-            .filter(ProjectMember.removed_at.is_(None))
-            .first()
+        data = request.get_json()
+        if not data or self.checks_key not in data:
+            return {"error": f"{self.checks_key} array is required"}, 400
+
+        checks = data[self.checks_key]
+        if not isinstance(checks, list):
+            return {"error": f"{self.checks_key} must be an array"}, 400
+        batch_size_error = _batch_size_error(checks)
+        if batch_size_error:
+            return batch_size_error
+
+        checks, invalid = _load_checks(self.checks_schema, checks)
+        allowed_pairs = _allowed_permission_pairs(
+            g.user_id, g.company_id, _check_pairs(checks, invalid)
+        )
+        return stream_json_list(
+            "results",
+            _iter_check_results(
+                checks, invalid, self.check_fields, allowed_pairs
+            ),
         )
 
-        if not member:
-            return False
 
-        # 3. Get member's roles (through member.role relationship)
-        role = member.role
-        if not role or role.removed_at:
-            return False
+class CheckFileAccessResource(_AccessCheckResource):
+    """
+    Check if user has permission to access files.
 
-        # 4. Get policies associated with the role
-        policies = [p for p in role.policies if not p.removed_at]
+    POST: Batch check file access permissions
+    Expected JSON body:
+    {
+        "file_checks": [
+            {"file_id": "uuid", "project_id": "uuid", "action": "read_files"},
+            {"file_id": "uuid", "project_id": "uuid", "action": "write_files"}
+        ]
+    }
 
-        # 5. Check if any policy has the required permission
-        for policy in policies:
-            permissions = [p for p in policy.permissions if not p.removed_at]
-            for permission in permissions:
-                if permission.name == action:
-                    return True
+    Returns:
+    {
+        "results": [
+            {"file_id": "uuid", "project_id": "uuid", "action": "read_files", "allowed": true},
+            {"file_id": "uuid", "project_id": "uuid", "action": "write_files", "allowed": false}
+        ]
+    }
+    """
 
-        return False
+    checks_key = "file_checks"
+    checks_schema = _file_checks_schema
+    check_fields = _FILE_CHECK_FIELDS
 
 
-class CheckProjectAccessResource(Resource):
+class CheckProjectAccessResource(_AccessCheckResource):
     """
     Check if user has permission to access projects.
 
@@ -182,116 +652,111 @@ class CheckProjectAccessResource(Resource):
     }
     """
 
+    checks_key = "project_checks"
+    checks_schema = _project_checks_schema
+    check_fields = _PROJECT_CHECK_FIELDS
+
+
+class _AccessCheckBatchResource(Resource):
+    """
+    Base of the batch endpoints, reporting the role and the denial reason
+    of each check.
+
+    Subclasses may map generic actions to permission names.
+    """
+
+    action_map = {}
+
     @require_jwt_auth()
+    @limit_concurrency(_check_requests, "max_concurrent_checks")
     def post(self):
         """
-        Batch check project access permissions for the authenticated user.
+        Batch check access permissions for the authenticated user.
 
-        Evaluates the complete permission chain for each project check.
+        Evaluates the complete permission chain for each check.
         """
-        company_id = g.company_id
-        user_id = g.user_id
-
         data = request.get_json()
-        if not data or "project_checks" not in data:
-            return {"error": "project_checks array is required"}, 400
+        if not data or "checks" not in data:
+            return {"error": "checks array is required"}, 400
 
-        project_checks = data["project_checks"]
-        if not isinstance(project_checks, list):
-            return {"error": "project_checks must be an array"}, 400
+        checks = data["checks"]
+        if not isinstance(checks, list):
+            return {"error": "checks must be an array"}, 400
+        batch_size_error = _batch_size_error(checks)
+        if batch_size_error:
+            return batch_size_error
+
+        checks, invalid = _load_checks(_project_checks_schema, checks)
+        access = _load_member_access(
+            g.user_id,
+            g.company_id,
+            {project_id for project_id, _ in _check_pairs(checks, invalid)},
+        )
+        return stream_json_list(
+            "results", self._iter_results(checks, invalid, access)
+        )
 
-        results = []
+    def _iter_results(self, checks, invalid, access):
+        """
+        Generate the response entries of a batch, in request order.
 
-        for check in project_checks:
+        Args:
+            checks: List of loaded check dicts
+            invalid: Frozenset of invalid check indexes
+            access: Preloaded project_id -> MemberAccess mapping
+        """
+        decisions = {}
+        for index, check in enumerate(checks):
             # Validate check structure
-            if not all(key in check for key in ["project_id", "action"]):
-                results.append(
-                    {
-                        "project_id": check.get("project_id"),
-                        "action": check.get("action"),
-                        "allowed": False,
-                        "reason": "Invalid check format",
-                    }
-                )
+            if index in invalid:
+                yield {
+                    "project_id": check.get("project_id"),
+                    "action": check.get("action"),
+                    "allowed": False,
+                    "role": None,
+                    "reason": "Invalid check format",
+                }
                 continue
 
             project_id = check["project_id"]
             action = check["action"]
 
-            # Check permission
-            allowed = self._check_user_permission(
-                user_id, company_id, project_id, action
-            )
-
-            results.append(
-                {
-                    "project_id": project_id,
-                    "action": action,
-                    "allowed": allowed,
-                }
-            )
-
-        return {"results": results}, 200
+            # Check permission and get role info (once per distinct check)
+            key = (_canonical_uuid(project_id), action)
+            if key not in decisions:
+                decisions[key] = self._check_user_permission(
+                    access, project_id, action
+                )
+            allowed, role_name, reason = decisions[key]
+
+            yield {
+                "project_id": project_id,
+                "action": action,
+                "allowed": allowed,
+                "role": role_name,
+                "reason": reason,
+            }
 
-    def _check_user_permission(self, user_id, company_id, project_id, action):
+    def _check_user_permission(self, access, project_id, action):
         """
         Check if user has permission to perform action on project.
 
-        Evaluates the complete RBAC chain:
-        1. Project exists and belongs to company
-        2. User is a member of the project
-        3. Member has roles
-        4. Roles have policies
-        5. Policies have the required permission
-
         Args:
-            user_id: User ID
-            company_id: Company ID
+            access: Preloaded project_id -> MemberAccess mapping
             project_id: Project ID
-            action: Permission action (e.g., 'update_project', 'delete_project')
+            action: Permission action, possibly a generic action of
+                action_map
 
         Returns:
-            bool: True if user has permission, False otherwise
+            tuple: (allowed: bool, role_name: str|None, reason: str|None)
         """
-        # 1. Verify project exists and belongs to company
-        project = db.session.get(Project, project_id)
-        if (
-            not project
-            or project.company_id != company_id
-            or project.removed_at
-        ):
-            return False
-
-        # 2. Get user's membership in the project
-        member = (
-            db.session.query(ProjectMember)
-            .filter_by(project_id=project_id, user_id=user_id)
-            .filter(ProjectMember.removed_at.is_(None))
-            .first()
+        return _evaluate_member_access(
+            access.get(_canonical_uuid(project_id)),
+            self.action_map.get(action, action),
         )
 
-        if not member:
-            return False
 
-        # 3. Get member's role
-        role = member.role
-        if not role or role.removed_at:
-            return False
-
-        # 4. Get policies associated with the role
-        policies = [p for p in role.policies if not p.removed_at]
-
-        # 5. Check if any policy has the required permission
-        for policy in policies:
-            permissions = [p for p in policy.permissions if not p.removed_at]
-            for permission in permissions:
-                if permission.name == action:
-                    return True
-
-        return False
-
-
-class CheckFileAccessBatchResource(Resource):
+class CheckFileAccessBatchResource(_AccessCheckBatchResource):
     """
     Check if user has permission to access files (batch).
 
@@ -325,112 +790,17 @@ class CheckFileAccessBatchResource(Resource):
     }
     """
 
-    @require_jwt_auth()
-    def post(self):
-        """
-        Batch check file access permissions for the authenticated user.
-
-        Evaluates the complete permission chain for each file check.
-        """
-        company_id = g.company_id
-        user_id = g.user_id
-
-        data = request.get_json()
-        if not data or "checks" not in data:
-            return {"error": "checks array is required"}, 400
-
-        checks = data["checks"]
-        if not isinstance(checks, list):
-            return {"error": "checks must be an array"}, 400
-
-        results = []
-
-        for check in checks:
-            # Validate check structure
-            if not all(key in check for key in ["project_id", "action"]):
-                results.append(
-                    {
-                        "project_id": check.get("project_id"),
-                        "action": check.get("action"),
-                        "allowed": False,
-                        "role": None,
-                        "reason": "Invalid check format",
-                    }
-                )
-                continue
-
-            project_id = check["project_id"]
-            action = check["action"]
-
-            # Check permission and get role info
-            allowed, role_name, reason = self._check_user_permission(
-                user_id, company_id, project_id, action
-            )
-
-            results.append(
-                {
-                    "project_id": project_id,
-                    "action": action,
-                    "allowed": allowed,
-                    "role": role_name,
-                    "reason": reason,
-                }
-            )
-
-        return {"results": results}, 200
-
-    def _check_user_permission(self, user_id, company_id, project_id, action):
-        """
-        Check if user has permission to perform action on project.
-
-        Args:
-            user_id: User ID
-            company_id: Company ID
-            project_id: Project ID
-            action: Permission action (e.g., 'read_files', 'write_files')
 
-        Returns:
-            tuple: (allowed: bool, role_name: str|None, reason: str|None)
-        """
-        # 1. Verify project exists and belongs to company
-        project = db.session.get(Project, project_id)
-        if (
-            not project
-            or project.company_id != company_id
-            or project.removed_at
-        ):
-            return False, None, "Project not found"
-
-        # 2. Get user's membership in the project
-        member = (
-            db.session.query(ProjectMember)
-            .filter_by(project_id=project_id, user_id=user_id)
-            .filter(ProjectMember.removed_at.is_(None))
-            .first()
-        )
+# Generic actions of the project batch endpoint mapped to specific
+# permissions; other actions are used as permission names
+_ACTION_MAP = {
+    "read": "read_files",
+    "write": "write_files",
+    "manage": "manage_project",
+}
 
-        if not member:
-            return False, None, "User is not a member of the project"
 
-        # 3. Get member's role
-        role = member.role
-        if not role or role.removed_at:
-            return False, None, "No valid role assigned"
-
-        # 4. Get policies associated with the role
-        policies = [p for p in role.policies if not p.removed_at]
-
-        # 5. Check if any policy has the required permission
-        for policy in policies:
-            permissions = [p for p in policy.permissions if not p.removed_at]
-            for permission in permissions:
-                if permission.name == action:
-                    return True, role.name, None
-
-        return False, role.name, "Permission denied"
-
-
-class CheckProjectAccessBatchResource(Resource):
+class CheckProjectAccessBatchResource(_AccessCheckBatchResource):
     """
     Check if user has permission to access projects (batch).
 
@@ -464,114 +834,4 @@ class CheckProjectAccessBatchResource(Resource):
     }
     """
 
-    @require_jwt_auth()
-    def post(self):
-        """
-        Batch check project access permissions for the authenticated user.
-
-        Evaluates the complete permission chain for each project check.
-        """
-        company_id = g.company_id
-        user_id = g.user_id
-
-        data = request.get_json()
-        if not data or "checks" not in data:
-            return {"error": "checks array is required"}, 400
-
-        checks = data["checks"]
-        if not isinstance(checks, list):
-            return {"error": "checks must be an array"}, 400
-
-        results = []
-
-        for check in checks:
-            # Validate check structure
-            if not all(key in check for key in ["project_id", "action"]):
-                results.append(
-                    {
-                        "project_id": check.get("project_id"),
-                        "action": check.get("action"),
-                        "allowed": False,
-                        "role": None,
-                        "reason": "Invalid check format",
-                    }
-                )
-                continue
-
-            project_id = check["project_id"]
-            action = check["action"]
-
-            # Check permission and get role info
-            allowed, role_name, reason = self._check_user_permission(
-                user_id, company_id, project_id, action
-            )
-
-            results.append(
-                {
-                    "project_id": project_id,
-                    "action": action,
-                    "allowed": allowed,
-                    "role": role_name,
-                    "reason": reason,
-                }
-            )
-
-        return {"results": results}, 200
-
-    def _check_user_permission(self, user_id, company_id, project_id, action):
-        """
-        Check if user has permission to perform action on project.
-
-        Args:
-            user_id: User ID
-            company_id: Company ID
-            project_id: Project ID
-            action: Permission action (e.g., 'read', 'write', 'manage')
-
-        Returns:
-            tuple: (allowed: bool, role_name: str|None, reason: str|None)
-        """
-        # 1. Verify project exists and belongs to company
-        project = db.session.get(Project, project_id)
-        if (
-            not project
-            or project.company_id != company_id
-            or project.removed_at
-        ):
-            return False, None, "Project not found"
-
-        # 2. Get user's membership in the project
-        member = (
-            db.session.query(ProjectMember)
-            .filter_by(project_id=project_id, user_id=user_id)
-            .filter(ProjectMember.removed_at.is_(None))
-            .first()
-        )
-
-        if not member:
-            return False, None, "User is not a member of the project"
-
-        # 3. Get member's role
-        role = member.role
-        if not role or role.removed_at:
-            return False, None, "No valid role assigned"
-
-        # Map generic actions to specific permissions
-        action_map = {
-            "read": "read_files",
-            "write": "write_files",
-            "manage": "manage_project",
-        }
-        permission_name = action_map.get(action, action)
-
-        # 4. Get policies associated with the role
-        policies = [p for p in role.policies if not p.removed_at]
-
-        # 5. Check if any policy has the required permission
-        for policy in policies:
-            permissions = [p for p in policy.permissions if not p.removed_at]
-            for permission in permissions:
-                if permission.name == permission_name:
-                    return True, role.name, None
-
-        return False, role.name, "Permission denied"
+    action_map = _ACTION_MAP
@@ -7,6 +7,7 @@ This module provides common functionality for all API resources including:
 - Error response formatting
 - Common database operations
 - UUID validation
+- Keyset pagination of list endpoints
 
 Note: JWT authentication is handled by the @require_jwt_auth() decorator
 from app.utils.auth. User ID and Company ID are available in Flask's g object:
@@ -14,9 +15,18 @@ from app.utils.auth. User ID and Company ID are available in Flask's g object:
 - g.company_id: Current user's company UUID
 """
 
+import base64
+import binascii
+import re
 import uuid as uuid_module
+from collections import namedtuple
+from datetime import datetime
+
+import orjson
+from flask import request
 from flask_restful import Resource
 from marshmallow import ValidationError
+from sqlalchemy import bindparam, func, tuple_, update
 from sqlalchemy.exc import SQLAlchemyError
 from app.models.db import db
 from app.logger import logger
@@ -80,6 +90,52 @@ class BaseResource(Resource):
             db.session.rollback()
             return False
 
+    def commit_and_dump(self, schema, obj):
+        """
+        Commit database changes and serialize obj as committed.
+
+        obj is dumped after the flush but before the commit: its server
+        defaults come back with the INSERT/UPDATE (mapper eager_defaults),
+        while the commit would expire it and make the dump reload the row.
+
+        Args:
+            schema: Schema instance serializing obj
+            obj: Model instance being created or updated
+
+        Returns:
+            dict: Serialized obj, or None if the commit failed
+        """
+        try:
+            db.session.flush()
+            data = schema.dump(obj)
+            db.session.commit()
+            return data
+        except SQLAlchemyError as error:
+            logger.error(f"Commit failed: {str(error)}")
+            db.session.rollback()
+            return None
+
+
+def update_returning(model, values, *criteria):
+    """
+    Update the row matching criteria and return it, in one statement.
+
+    Only the given columns are SET (plus onupdate columns such as
+    updated_at); the ORM instance is built from the RETURNING row, so no
+    SELECT precedes the UPDATE.
+
+    Args:
+        model: Model class to update
+        values (dict): Column values to set (must not be empty)
+        *criteria: WHERE clauses selecting at most one row
+
+    Returns:
+        The updated instance, or None if no row matched
+    """
+    return db.session.execute(
+        update(model).where(*criteria).values(**values).returning(model)
+    ).scalar_one_or_none()
+
 
 def error_response(message, status_code=400, errors=None):
     """
@@ -113,6 +169,13 @@ def success_response(data, status_code=200):
     return data, status_code
 
 
+# Hyphenated UUID, the form clients send: matched without building a UUID
+_UUID_RE = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
+    re.IGNORECASE,
+)
+
+
 def validate_uuid(uuid_string, field_name="id"):
     """
     Validate that a string is a valid UUID.
@@ -127,6 +190,9 @@ def validate_uuid(uuid_string, field_name="id"):
     Raises:
         ValueError: If the UUID is invalid
     """
+    if isinstance(uuid_string, str) and _UUID_RE.fullmatch(uuid_string):
+        return uuid_string
+    # Other spellings uuid.UUID accepts (braces, urn:uuid:, no hyphens)
     try:
         uuid_module.UUID(uuid_string)
         return uuid_string
@@ -134,3 +200,113 @@ def validate_uuid(uuid_string, field_name="id"):
         raise ValueError(
             f"Invalid {field_name}: must be a valid UUID"
         ) from error
+
+
+# Page size of paginated list endpoints (?limit=), default and maximum
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Requested page: size and (created_at, id) of the last row already seen
+Page = namedtuple("Page", ["limit", "after"])
+
+_SQLITE_TIMESTAMP = "%Y-%m-%d %H:%M:%f"
+
+
+def encode_cursor(created_at, row_id):
+    """Return the opaque cursor resuming a listing after this row."""
+    payload = orjson.dumps([created_at.isoformat(), row_id])
+    return base64.urlsafe_b64encode(payload).decode()
+
+
+def decode_cursor(cursor):
+    """
+    Decode a cursor made by encode_cursor.
+
+    Returns:
+        tuple: (created_at, id) of the last row of the previous page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        created_at, row_id = orjson.loads(base64.urlsafe_b64decode(cursor))
+        return datetime.fromisoformat(created_at), validate_uuid(row_id)
+    except (binascii.Error, orjson.JSONDecodeError, TypeError, ValueError):
+        raise ValueError("Invalid cursor") from None
+
+
+def parse_page_args():
+    """
+    Read the ?limit= and ?cursor= pagination parameters.
+
+    Returns:
+        Page or None when the client asked for neither (full listing)
+
+    Raises:
+        ValueError: If limit is not a positive integer or cursor is invalid
+    """
+    limit = request.args.get("limit")
+    cursor = request.args.get("cursor")
+    if limit is None and cursor is None:
+        return None
+    if limit is None:
+        limit = DEFAULT_PAGE_SIZE
+    else:
+        try:
+            limit = int(limit)
+        except ValueError:
+            limit = 0
+        if limit < 1:
+            raise ValueError("Invalid limit: must be a positive integer")
+    after = decode_cursor(cursor) if cursor else None
+    return Page(min(limit, MAX_PAGE_SIZE), after)
+
+
+def paginate(stmt, model, page):
+    """
+    Restrict a listing to one page, newest first.
+
+    Rows are ordered by (created_at, id) descending, so the cursor is a
+    keyset position served by the (project_id, created_at DESC, id DESC)
+    indexes. One extra row is fetched to tell whether a next page exists.
+
+    Args:
+        stmt: Select statement of the listing
+        model: Listed model (with created_at and id columns)
+        page (Page): Requested page
+
+    Returns:
+        Select: The paginated statement
+    """
+    created_at = model.created_at
+    after = page.after and (
+        bindparam(None, page.after[0], type_=created_at.type),
+        bindparam(None, page.after[1], type_=model.id.type),
+    )
+    if db.session.get_bind().dialect.name == "sqlite":
+        # SQLite keeps timestamps as text, server defaults without the
+        # fractional part bound values have: compare a normalized form
+        created_at = func.strftime(_SQLITE_TIMESTAMP, created_at)
+        after = after and (
+            func.strftime(_SQLITE_TIMESTAMP, after[0]),
+            after[1],
+        )
+    if after:
+        stmt = stmt.where(tuple_(created_at, model.id) < tuple_(*after))
+    return stmt.order_by(created_at.desc(), model.id.desc()).limit(
+        page.limit + 1
+    )
+
+
+def page_response(rows, page):
+    """
+    Make the body of a paginated listing from the rows of paginate().
+
+    Returns:
+        dict: {"data": rows of the page, "next_cursor": cursor or None}
+    """
+    next_cursor = None
+    if len(rows) > page.limit:
+        rows = rows[: page.limit]
+        next_cursor = encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
+    return {"data": rows, "next_cursor": next_cursor}
@@ -12,13 +12,20 @@ Endpoints:
 - DELETE /deliverables/{id} - Delete deliverable (soft delete)
 """
 
-import uuid
-from datetime import datetime, timezone
 from flask import request, g
 from marshmallow import ValidationError
-from app.resources.base import BaseResource, error_response, validate_uuid
+from sqlalchemy import select, update
+from app.resources.base import (
+    BaseResource,
+    error_response,
+    page_response,
+    paginate,
+    parse_page_args,
+    update_returning,
+    validate_uuid,
+)
 from app.utils.auth import require_jwt_auth, check_access_required
-from app.models.db import db
+from app.models.db import UtcNow, db
 from app.models.project import Project, Deliverable
 from app.schemas.project_schema import (
     DeliverableSchema,
@@ -32,36 +39,61 @@ ERROR_DELIVERABLE_NOT_FOUND = "Deliverable not found"
 ERROR_PROJECT_NOT_FOUND = "Project not found"
 ERROR_VALIDATION = "Validation error"
 
+# The list endpoint dumps rows straight from these columns (the fields of
+# DeliverableSchema), skipping ORM instances and per-field schema calls;
+# dates are encoded to ISO 8601 by orjson like the schema does
+_LIST_COLUMNS = tuple(Deliverable.__table__.c)
+
+deliverable_create_schema = DeliverableCreateSchema()
+deliverable_schema = DeliverableSchema()
+deliverable_update_schema = DeliverableUpdateSchema()
+
 
 class DeliverableListResource(BaseResource):
     """Resource for listing and creating deliverables within a project."""
 
     @require_jwt_auth()
     def get(self, project_id):
-        """List all deliverables for a specific project."""
+        """
+        List all deliverables for a specific project.
+
+        With ?limit= and/or ?cursor=, returns one page (newest first) as
+        {"data": [...], "next_cursor": ...} instead of the full list.
+        """
         try:
             validate_uuid(project_id, "project_id")
-            company_id = str(uuid.UUID(g.company_id))
+            company_id = g.company_id
 
-            # Verify project exists and belongs to company
-            project = Project.query.filter(
+            project_filter = (
                 Project.id == project_id,
                 Project.company_id == company_id,
-            ).first()
-
-            if not project or project.removed_at:
+                Project.removed_at.is_(None),
+            )
+
+            # Non-deleted deliverables of the project, provided it exists and
+            # belongs to the company, in one round-trip
+            # (served by idx_deliverables_project_active)
+            stmt = (
+                select(*_LIST_COLUMNS)
+                .join(Project, Project.id == Deliverable.project_id)
+                .where(*project_filter, Deliverable.removed_at.is_(None))
+            )
+            page = parse_page_args()
+            if page:
+                stmt = paginate(stmt, Deliverable, page)
+            rows = db.session.execute(stmt).mappings()
+            deliverables = [dict(row) for row in rows]
+
+            # Only an empty result needs telling an empty project apart
+            # from a missing one
+            if not deliverables and not Project.get_active_cached(
+                project_id, company_id
+            ):
                 return error_response(ERROR_PROJECT_NOT_FOUND, 404)
 
-            # Get deliverables for this project
-            deliverables = Deliverable.query.filter(
-                Deliverable.project_id == project_id
-            ).all()
-
-            # Filter out soft-deleted deliverables
-            deliverables = [d for d in deliverables if not d.removed_at]
-
-            schema = DeliverableSchema(many=True)
-            return schema.dump(deliverables), 200
+            if page:
+                return page_response(deliverables, page), 200
+            return deliverables, 200
 
         except ValueError as error:
             return error_response(str(error), 400)
@@ -74,15 +106,10 @@ class DeliverableListResource(BaseResource):
         """Create a new deliverable for a project."""
         try:
             validate_uuid(project_id, "project_id")
-            company_id = str(uuid.UUID(g.company_id))
+            company_id = g.company_id
 
             # Verify project exists and belongs to company
-            project = Project.query.filter(
-                Project.id == project_id,
-                Project.company_id == company_id,
-            ).first()
-
-            if not project or project.removed_at:
+            if not Project.get_active(project_id, company_id):
                 return error_response(ERROR_PROJECT_NOT_FOUND, 404)
 
             data = request.get_json()
@@ -110,19 +137,18 @@ class DeliverableListResource(BaseResource):
             data["company_id"] = company_id
 
             # Validate and deserialize
-            schema = DeliverableCreateSchema()
-            validated_data = schema.load(data)
+            validated_data = deliverable_create_schema.load(data)
 
             # Create deliverable
             deliverable = Deliverable(**validated_data)
             db.session.add(deliverable)
 
-            if not self.commit_or_rollback():
+            result = self.commit_and_dump(deliverable_schema, deliverable)
+            if result is None:
                 return error_response("Failed to create deliverable", 500)
 
             # Return created deliverable
-            return_schema = DeliverableSchema()
-            return return_schema.dump(deliverable), 201
+            return result, 201
 
         except ValidationError as error:
             return error_response(ERROR_VALIDATION, 400, errors=error.messages)
@@ -140,14 +166,13 @@ class DeliverableResource(BaseResource):
         """Get a specific deliverable by ID."""
         try:
             validate_uuid(deliverable_id, "id")
-            company_id = str(uuid.UUID(g.company_id))
+            company_id = g.company_id
 
             deliverable = self._get_deliverable(deliverable_id, company_id)
             if not deliverable:
                 return error_response(ERROR_DELIVERABLE_NOT_FOUND, 404)
 
-            schema = DeliverableSchema()
-            return schema.dump(deliverable), 200
+            return deliverable_schema.dump(deliverable), 200
 
         except ValueError as error:
             return error_response(str(error), 400)
@@ -172,14 +197,22 @@ class DeliverableResource(BaseResource):
         """Delete a deliverable (soft delete)."""
         try:
             validate_uuid(deliverable_id, "id")
-            company_id = str(uuid.UUID(g.company_id))
-
-            deliverable = self._get_deliverable(deliverable_id, company_id)
-            if not deliverable:
+            company_id = g.company_id
+
+            # Lookup, idempotency check and soft delete in one statement
+            deleted = db.session.execute(
+                update(Deliverable)
+                .where(
+                    Deliverable.id == deliverable_id,
+                    Deliverable.company_id == company_id,
+                    Deliverable.removed_at.is_(None),
+                )
+                .values(removed_at=UtcNow())
+                .returning(Deliverable.id)
+            ).first()
+            if not deleted:
                 return error_response(ERROR_DELIVERABLE_NOT_FOUND, 404)
 
-            deliverable.removed_at = datetime.now(timezone.utc)
-
             if not self.commit_or_rollback():
                 return error_response("Failed to delete deliverable", 500)
 
@@ -194,26 +227,38 @@ class DeliverableResource(BaseResource):
         """Internal method to handle both PUT and PATCH updates."""
         try:
             validate_uuid(deliverable_id, "id")
-            company_id = str(uuid.UUID(g.company_id))
+            company_id = g.company_id
 
-            deliverable = self._get_deliverable(deliverable_id, company_id)
+            try:
+                data = deliverable_update_schema.load(
+                    request.get_json(), partial=partial
+                )
+            except ValidationError:
+                # A missing deliverable still takes precedence over a bad body
+                if not self._get_deliverable(deliverable_id, company_id):
+                    return error_response(ERROR_DELIVERABLE_NOT_FOUND, 404)
+                raise
+
+            # Lookup and update in one statement, setting only the
+            # submitted fields (an empty PATCH just reads the deliverable)
+            if data:
+                deliverable = update_returning(
+                    Deliverable,
+                    data,
+                    Deliverable.id == deliverable_id,
+                    Deliverable.company_id == company_id,
+                    Deliverable.removed_at.is_(None),
+                )
+            else:
+                deliverable = self._get_deliverable(deliverable_id, company_id)
             if not deliverable:
                 return error_response(ERROR_DELIVERABLE_NOT_FOUND, 404)
 
-            # Validate and deserialize
-            schema = DeliverableUpdateSchema(partial=partial)
-            validated_data = schema.load(request.get_json())
-
-            # Update deliverable fields
-            for key, value in validated_data.items():
-                if hasattr(deliverable, key):
-                    setattr(deliverable, key, value)
-
-            if not self.commit_or_rollback():
+            result = self.commit_and_dump(deliverable_schema, deliverable)
+            if result is None:
                 return error_response("Failed to update deliverable", 500)
 
-            return_schema = DeliverableSchema()
-            return return_schema.dump(deliverable), 200
+            return result, 200
 
         except ValidationError as error:
             return error_response(ERROR_VALIDATION, 400, errors=error.messages)
@@ -225,19 +270,16 @@ class DeliverableResource(BaseResource):
     @staticmethod
     def _get_deliverable(deliverable_id, company_id):
         """Get deliverable by ID and company."""
-        # Ensure string UUIDs for comparison (db.String(36))
-        if not isinstance(deliverable_id, str):
-            deliverable_id = str(deliverable_id)
-        if not isinstance(company_id, str):
-            company_id = str(company_id)
-
-        deliverable = Deliverable.query.filter(
-            Deliverable.id == deliverable_id,
-            Deliverable.company_id == company_id,
-        ).first()
-
-        # Check if soft-deleted
-        if deliverable and deliverable.removed_at:
+        # Primary-key lookup: served from the session's identity map when
+        # the deliverable is already loaded in this request
+        deliverable = db.session.get(Deliverable, deliverable_id)
+
+        # Check tenancy and if soft-deleted
+        if (
+            deliverable is None
+            or deliverable.company_id != company_id
+            or deliverable.removed_at
+        ):
             return None
 
         return deliverable
@@ -17,14 +17,20 @@ Security:
 - Create/Update/Delete require RBAC permissions
 """
 
-from datetime import datetime, timezone
 from flask import request, g
 from flask_restful import Resource
 from marshmallow import ValidationError
+from sqlalchemy import and_, bindparam, select, update
 from sqlalchemy.exc import IntegrityError
 
-from app.models.db import db
-from app.models.project import Project, ProjectMember, ProjectRole
+from app.models.db import UtcNow, db
+from app.resources.base import update_returning
+from app.models.project import (
+    Project,
+    ProjectMember,
+    ProjectRole,
+    mark_access_changed,
+)
 from app.schemas.project_schema import (
     ProjectMemberCreateSchema,
     ProjectMemberSchema,
@@ -35,6 +41,49 @@ from app.utils import (
     check_access_required,
 )
 
+project_members_schema = ProjectMemberSchema(many=True)
+project_member_create_schema = ProjectMemberCreateSchema()
+project_member_schema = ProjectMemberSchema()
+project_member_update_schema = ProjectMemberUpdateSchema()
+
+# Lookups run on every member request are built once: executing a prebuilt
+# statement with new parameters skips constructing the statement and
+# regenerating its compiled-cache key
+_ACTIVE_MEMBERS = select(ProjectMember).where(
+    ProjectMember.project_id == bindparam("project_id"),
+    ProjectMember.company_id == bindparam("company_id"),
+    ProjectMember.removed_at.is_(None),
+)
+_ACTIVE_MEMBER = _ACTIVE_MEMBERS.where(
+    ProjectMember.user_id == bindparam("user_id")
+)
+# Project, role (or NULL) and member (or NULL, even soft-deleted)
+_MEMBER_TARGETS = (
+    select(Project.id, ProjectRole.id, ProjectMember)
+    .select_from(Project)
+    .outerjoin(
+        ProjectRole,
+        and_(
+            ProjectRole.id == bindparam("role_id"),
+            ProjectRole.project_id == Project.id,
+            ProjectRole.company_id == bindparam("company_id"),
+            ProjectRole.removed_at.is_(None),
+        ),
+    )
+    .outerjoin(
+        ProjectMember,
+        and_(
+            ProjectMember.project_id == Project.id,
+            ProjectMember.user_id == bindparam("user_id"),
+        ),
+    )
+    .where(
+        Project.id == bindparam("project_id"),
+        Project.company_id == bindparam("company_id"),
+        Project.removed_at.is_(None),
+    )
+)
+
 
 class MemberListResource(Resource):
     """
@@ -56,20 +105,16 @@ class MemberListResource(Resource):
         company_id = g.company_id
 
         # Verify project exists and belongs to company
-        project = Project.query.filter_by(
-            id=project_id, company_id=company_id, removed_at=None
-        ).first()
-
-        if not project:
+        if not Project.get_active_cached(project_id, company_id):
             return {"error": "Project not found"}, 404
 
         # Get all non-deleted members
-        members = ProjectMember.query.filter_by(
-            project_id=project_id, company_id=company_id, removed_at=None
+        members = db.session.scalars(
+            _ACTIVE_MEMBERS,
+            {"project_id": project_id, "company_id": company_id},
         ).all()
 
-        schema = ProjectMemberSchema(many=True)
-        return schema.dump(members), 200
+        return project_members_schema.dump(members), 200
 
     @require_jwt_auth()
     @check_access_required("create")
@@ -92,17 +137,8 @@ class MemberListResource(Resource):
         company_id = g.company_id
         added_by = g.user_id
 
-        # Verify project exists and belongs to company
-        project = Project.query.filter_by(
-            id=project_id, company_id=company_id, removed_at=None
-        ).first()
-
-        if not project:
-            return {"error": "Project not found"}, 404
-
         # Parse and validate request data
         try:
-            schema = ProjectMemberCreateSchema()
             data = request.get_json()
 
             # Inject authoritative values (project_id, company_id, added_by)
@@ -110,46 +146,49 @@ class MemberListResource(Resource):
             data["company_id"] = company_id
             data["added_by"] = added_by
 
-            validated_data = schema.load(data)
+            validated_data = project_member_create_schema.load(data)
         except ValidationError as e:
+            # A missing project still takes precedence over a bad body
+            if not Project.get_active(project_id, company_id):
+                return {"error": "Project not found"}, 404
             return {"errors": e.messages}, 400
 
+        # Project, role and existing member (including soft-deleted) in
+        # one round-trip
+        targets = _get_member_targets(
+            project_id,
+            company_id,
+            validated_data["role_id"],
+            validated_data["user_id"],
+        )
+
+        if not targets:
+            return {"error": "Project not found"}, 404
+
+        _, role_id, existing_member = targets
+
         # Verify role exists and belongs to this project
-        role = ProjectRole.query.filter_by(
-            id=validated_data["role_id"],
-            project_id=project_id,
-            company_id=company_id,
-            removed_at=None,
-        ).first()
-
-        if not role:
+        if not role_id:
             return {"error": "Role not found"}, 404
 
-        # Check if member already exists (including soft-deleted)
-        existing_member = ProjectMember.query.filter_by(
-            project_id=project_id, user_id=validated_data["user_id"]
-        ).first()
-
         if existing_member and existing_member.removed_at is None:
             return {"error": "Member already exists in this project"}, 409
 
         # If member was previously removed, restore instead of creating new
-        if existing_member and existing_member.removed_at is not None:
-            existing_member.removed_at = None
-            existing_member.role_id = validated_data["role_id"]
-            existing_member.added_by = added_by
-            db.session.commit()
-            schema = ProjectMemberSchema()
-            return schema.dump(existing_member), 201
-
-        # Create new member
-        try:
+        if existing_member:
+            member = existing_member
+            member.removed_at = None
+            member.role_id = validated_data["role_id"]
+            member.added_by = added_by
+        else:
             member = ProjectMember(**validated_data)
             db.session.add(member)
+
+        # Both paths share one commit and its error handling
+        try:
             db.session.commit()
 
-            schema = ProjectMemberSchema()
-            return schema.dump(member), 201
+            return project_member_schema.dump(member), 201
         except IntegrityError:
             db.session.rollback()
             return {"error": "Database integrity error"}, 400
@@ -183,8 +222,7 @@ class MemberResource(Resource):
         if not member:
             return {"error": "Member not found"}, 404
 
-        schema = ProjectMemberSchema()
-        return schema.dump(member), 200
+        return project_member_schema.dump(member), 200
 
     @require_jwt_auth()
     @check_access_required("update")
@@ -234,13 +272,24 @@ class MemberResource(Resource):
         """
         company_id = g.company_id
 
-        member = _get_member(project_id, user_id, company_id)
-        if not member:
-            return {"error": "Member not found"}, 404
-
-        # Soft delete
+        # Lookup, idempotency check and soft delete in one statement
         try:
-            member.removed_at = datetime.now(timezone.utc)
+            removed = db.session.execute(
+                update(ProjectMember)
+                .where(
+                    ProjectMember.project_id == project_id,
+                    ProjectMember.user_id == user_id,
+                    ProjectMember.company_id == company_id,
+                    ProjectMember.removed_at.is_(None),
+                )
+                .values(removed_at=UtcNow())
+                .returning(ProjectMember.id)
+            ).first()
+            if not removed:
+                return {"error": "Member not found"}, 404
+
+            # Bulk UPDATEs bypass the flush events: flag the access change
+            mark_access_changed(db.session)
             db.session.commit()
             return "", 204
         except Exception as e:
@@ -261,39 +310,63 @@ class MemberResource(Resource):
         """
         company_id = g.company_id
 
-        member = _get_member(project_id, user_id, company_id)
-        if not member:
-            return {"error": "Member not found"}, 404
-
         # Parse and validate request data
         try:
-            schema = ProjectMemberUpdateSchema(partial=partial)
             data = request.get_json()
-            validated_data = schema.load(data)
+            validated_data = project_member_update_schema.load(
+                data, partial=partial
+            )
         except ValidationError as e:
+            # A missing member still takes precedence over a bad body
+            if not _get_member(project_id, user_id, company_id):
+                return {"error": "Member not found"}, 404
             return {"errors": e.messages}, 400
 
-        # If role_id is being updated, verify it exists and belongs to project
+        criteria = [
+            ProjectMember.project_id == project_id,
+            ProjectMember.user_id == user_id,
+            ProjectMember.company_id == company_id,
+            ProjectMember.removed_at.is_(None),
+        ]
+        # A new role must be an active role of the project: checked by
+        # the UPDATE itself rather than a separate SELECT
         if "role_id" in validated_data:
-            role = ProjectRole.query.filter_by(
-                id=validated_data["role_id"],
-                project_id=project_id,
-                company_id=company_id,
-                removed_at=None,
-            ).first()
-
-            if not role:
-                return {"error": "Role not found"}, 404
-
-        # Update member fields
+            criteria.append(
+                select(ProjectRole.id)
+                .where(
+                    ProjectRole.id == validated_data["role_id"],
+                    ProjectRole.project_id == project_id,
+                    ProjectRole.company_id == company_id,
+                    ProjectRole.removed_at.is_(None),
+                )
+                .exists()
+            )
+
+        # Lookup and update in one statement, setting only the submitted
+        # fields (an empty PATCH just reads the member)
         try:
-            for key, value in validated_data.items():
-                setattr(member, key, value)
-
+            if validated_data:
+                member = update_returning(
+                    ProjectMember, validated_data, *criteria
+                )
+                # Bulk UPDATEs bypass the flush events: flag the change
+                mark_access_changed(db.session)
+            else:
+                member = _get_member(project_id, user_id, company_id)
+            if not member:
+                db.session.rollback()
+                # Only a failed update pays for finding out which is
+                # missing; a missing member takes precedence over the role
+                if "role_id" in validated_data and _get_member(
+                    project_id, user_id, company_id
+                ):
+                    return {"error": "Role not found"}, 404
+                return {"error": "Member not found"}, 404
+
+            result = project_member_schema.dump(member)
             db.session.commit()
 
-            schema = ProjectMemberSchema()
-            return schema.dump(member), 200
+            return result, 200
         except Exception as e:
             db.session.rollback()
             return {"error": str(e)}, 500
@@ -311,9 +384,36 @@ def _get_member(project_id, user_id, company_id):
     Returns:
         ProjectMember instance or None
     """
-    return ProjectMember.query.filter_by(
-        project_id=project_id,
-        user_id=user_id,
-        company_id=company_id,
-        removed_at=None,
-    ).first()
+    return db.session.execute(
+        _ACTIVE_MEMBER,
+        {
+            "project_id": project_id,
+            "user_id": user_id,
+            "company_id": company_id,
+        },
+    ).scalar_one_or_none()
+
+
+def _get_member_targets(project_id, company_id, role_id, user_id):
+    """
+    Helper function to load what adding a member depends on in one query.
+
+    Args:
+        project_id: Project ID
+        company_id: Company ID from JWT
+        role_id: Role ID to assign
+        user_id: User ID to add
+
+    Returns:
+        Row (project id, role id or None, ProjectMember or None), or None
+        if the project does not exist
+    """
+    return db.session.execute(
+        _MEMBER_TARGETS,
+        {
+            "project_id": project_id,
+            "company_id": company_id,
+            "role_id": role_id,
+            "user_id": user_id,
+        },
+    ).one_or_none()
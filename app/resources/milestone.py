@@ -12,13 +12,20 @@ Endpoints:
 - DELETE /milestones/{id} - Delete milestone (soft delete)
 """
 
-import uuid
-from datetime import datetime, timezone
 from flask import request, g
 from marshmallow import ValidationError
-from app.resources.base import BaseResource, error_response, validate_uuid
+from sqlalchemy import select, update
+from app.resources.base import (
+    BaseResource,
+    error_response,
+    page_response,
+    paginate,
+    parse_page_args,
+    update_returning,
+    validate_uuid,
+)
 from app.utils.auth import require_jwt_auth, check_access_required
-from app.models.db import db
+from app.models.db import UtcNow, db
 from app.models.project import Project, Milestone
 from app.schemas.project_schema import (
     MilestoneSchema,
@@ -32,36 +39,61 @@ ERROR_MILESTONE_NOT_FOUND = "Milestone not found"
 ERROR_PROJECT_NOT_FOUND = "Project not found"
 ERROR_VALIDATION = "Validation error"
 
+# The list endpoint dumps rows straight from these columns (the fields of
+# MilestoneSchema), skipping ORM instances and per-field schema calls;
+# dates are encoded to ISO 8601 by orjson like the schema does
+_LIST_COLUMNS = tuple(Milestone.__table__.c)
+
+milestone_create_schema = MilestoneCreateSchema()
+milestone_schema = MilestoneSchema()
+milestone_update_schema = MilestoneUpdateSchema()
+
 
 class MilestoneListResource(BaseResource):
     """Resource for listing and creating milestones within a project."""
 
     @require_jwt_auth()
     def get(self, project_id):
-        """List all milestones for a specific project."""
+        """
+        List all milestones for a specific project.
+
+        With ?limit= and/or ?cursor=, returns one page (newest first) as
+        {"data": [...], "next_cursor": ...} instead of the full list.
+        """
         try:
             validate_uuid(project_id, "project_id")
-            company_id = str(uuid.UUID(g.company_id))
+            company_id = g.company_id
 
-            # Verify project exists and belongs to company
-            project = Project.query.filter(
+            project_filter = (
                 Project.id == project_id,
                 Project.company_id == company_id,
-            ).first()
-
-            if not project or project.removed_at:
+                Project.removed_at.is_(None),
+            )
+
+            # Non-deleted milestones of the project, provided it exists and
+            # belongs to the company, in one round-trip
+            # (served by idx_milestones_project_active)
+            stmt = (
+                select(*_LIST_COLUMNS)
+                .join(Project, Project.id == Milestone.project_id)
+                .where(*project_filter, Milestone.removed_at.is_(None))
+            )
+            page = parse_page_args()
+            if page:
+                stmt = paginate(stmt, Milestone, page)
+            rows = db.session.execute(stmt).mappings()
+            milestones = [dict(row) for row in rows]
+
+            # Only an empty result needs telling an empty project apart
+            # from a missing one
+            if not milestones and not Project.get_active_cached(
+                project_id, company_id
+            ):
                 return error_response(ERROR_PROJECT_NOT_FOUND, 404)
 
-            # Get milestones for this project
-            milestones = Milestone.query.filter(
-                Milestone.project_id == project_id
-            ).all()
-
-            # Filter out soft-deleted milestones
-            milestones = [m for m in milestones if not m.removed_at]
-
-            schema = MilestoneSchema(many=True)
-            return schema.dump(milestones), 200
+            if page:
+                return page_response(milestones, page), 200
+            return milestones, 200
 
         except ValueError as error:
             return error_response(str(error), 400)
@@ -74,15 +106,10 @@ class MilestoneListResource(BaseResource):
         """Create a new milestone for a project."""
         try:
             validate_uuid(project_id, "project_id")
-            company_id = str(uuid.UUID(g.company_id))
+            company_id = g.company_id
 
             # Verify project exists and belongs to company
-            project = Project.query.filter(
-                Project.id == project_id,
-                Project.company_id == company_id,
-            ).first()
-
-            if not project or project.removed_at:
+            if not Project.get_active(project_id, company_id):
                 return error_response(ERROR_PROJECT_NOT_FOUND, 404)
 
             data = request.get_json()
@@ -111,18 +138,17 @@ class MilestoneListResource(BaseResource):
             data["project_id"] = project_id
             data["company_id"] = str(company_id)
 
-            schema = MilestoneCreateSchema()
-            validated_data = schema.load(data)
+            validated_data = milestone_create_schema.load(data)
 
             # Create milestone instance
             milestone = Milestone(**validated_data)
             db.session.add(milestone)
 
-            if not self.commit_or_rollback():
+            result = self.commit_and_dump(milestone_schema, milestone)
+            if result is None:
                 return error_response("Failed to create milestone", 500)
 
-            result_schema = MilestoneSchema()
-            return result_schema.dump(milestone), 201
+            return result, 201
 
         except ValidationError as error:
             return error_response(ERROR_VALIDATION, 400, errors=error.messages)
@@ -141,14 +167,13 @@ class MilestoneResource(BaseResource):
         """Get milestone details."""
         try:
             validate_uuid(milestone_id, "milestone_id")
-            company_id = str(uuid.UUID(g.company_id))
+            company_id = g.company_id
 
             milestone = self._get_milestone(milestone_id, company_id)
             if not milestone:
                 return error_response(ERROR_MILESTONE_NOT_FOUND, 404)
 
-            schema = MilestoneSchema()
-            return schema.dump(milestone), 200
+            return milestone_schema.dump(milestone), 200
 
         except ValueError as error:
             return error_response(str(error), 400)
@@ -173,14 +198,22 @@ class MilestoneResource(BaseResource):
         """Delete a milestone (soft delete)."""
         try:
             validate_uuid(milestone_id, "milestone_id")
-            company_id = str(uuid.UUID(g.company_id))
-
-            milestone = self._get_milestone(milestone_id, company_id)
-            if not milestone:
+            company_id = g.company_id
+
+            # Lookup, idempotency check and soft delete in one statement
+            deleted = db.session.execute(
+                update(Milestone)
+                .where(
+                    Milestone.id == milestone_id,
+                    Milestone.company_id == company_id,
+                    Milestone.removed_at.is_(None),
+                )
+                .values(removed_at=UtcNow())
+                .returning(Milestone.id)
+            ).first()
+            if not deleted:
                 return error_response(ERROR_MILESTONE_NOT_FOUND, 404)
 
-            milestone.removed_at = datetime.now(timezone.utc)
-
             if not self.commit_or_rollback():
                 return error_response("Failed to delete milestone", 500)
 
@@ -195,25 +228,38 @@ class MilestoneResource(BaseResource):
         """Internal method to update a milestone."""
         try:
             validate_uuid(milestone_id, "milestone_id")
-            company_id = str(uuid.UUID(g.company_id))
+            company_id = g.company_id
 
-            milestone = self._get_milestone(milestone_id, company_id)
+            try:
+                data = milestone_update_schema.load(
+                    request.get_json(), partial=partial
+                )
+            except ValidationError:
+                # A missing milestone still takes precedence over a bad body
+                if not self._get_milestone(milestone_id, company_id):
+                    return error_response(ERROR_MILESTONE_NOT_FOUND, 404)
+                raise
+
+            # Lookup and update in one statement, setting only the
+            # submitted fields (an empty PATCH just reads the milestone)
+            if data:
+                milestone = update_returning(
+                    Milestone,
+                    data,
+                    Milestone.id == milestone_id,
+                    Milestone.company_id == company_id,
+                    Milestone.removed_at.is_(None),
+                )
+            else:
+                milestone = self._get_milestone(milestone_id, company_id)
             if not milestone:
                 return error_response(ERROR_MILESTONE_NOT_FOUND, 404)
 
-            schema = MilestoneUpdateSchema(partial=partial)
-            data = schema.load(request.get_json())
-
-            # Update fields
-            for field, value in data.items():
-                if hasattr(milestone, field):
-                    setattr(milestone, field, value)
-
-            if not self.commit_or_rollback():
+            result = self.commit_and_dump(milestone_schema, milestone)
+            if result is None:
                 return error_response("Failed to update milestone", 500)
 
-            result_schema = MilestoneSchema()
-            return result_schema.dump(milestone), 200
+            return result, 200
 
         except ValidationError as error:
             return error_response(ERROR_VALIDATION, 400, errors=error.messages)
@@ -225,19 +271,16 @@ class MilestoneResource(BaseResource):
     @staticmethod
     def _get_milestone(milestone_id, company_id):
         """Get milestone by ID and company."""
-        # Ensure string UUIDs for comparison (db.String(36))
-        if not isinstance(milestone_id, str):
-            milestone_id = str(milestone_id)
-        if not isinstance(company_id, str):
-            company_id = str(company_id)
-
-        milestone = Milestone.query.filter(
-            Milestone.id == milestone_id,
-            Milestone.company_id == company_id,
-        ).first()
-
-        # Check if soft-deleted
-        if milestone and milestone.removed_at:
+        # Primary-key lookup: served from the session's identity map when
+        # the milestone is already loaded in this request
+        milestone = db.session.get(Milestone, milestone_id)
+
+        # Check tenancy and if soft-deleted
+        if (
+            milestone is None
+            or milestone.company_id != company_id
+            or milestone.removed_at
+        ):
             return None
 
         return milestone
@@ -16,12 +16,56 @@ Resources:
 
 from flask import g, request
 from flask_restful import Resource
+from sqlalchemy import delete, exists, select
 from sqlalchemy.exc import SQLAlchemyError
 from app.models.db import db
-from app.models.project import Project, Milestone, Deliverable
+from app.models.project import (
+    Project,
+    Milestone,
+    Deliverable,
+    milestone_deliverable_association,
+)
 from app.schemas.project_schema import DeliverableSchema
 from app.utils import require_jwt_auth, check_access_required
 
+deliverable_schema = DeliverableSchema()
+
+# The list endpoint dumps rows straight from these columns (the fields of
+# DeliverableSchema), skipping ORM instances and per-field schema calls
+_DELIVERABLE_COLUMNS = tuple(Deliverable.__table__.c)
+
+
+def _is_associated(milestone_id, deliverable_id):
+    """Return True if the deliverable is linked to the milestone (EXISTS)."""
+    return db.session.scalar(
+        select(
+            exists().where(
+                milestone_deliverable_association.c.milestone_id
+                == milestone_id,
+                milestone_deliverable_association.c.deliverable_id
+                == deliverable_id,
+            )
+        )
+    )
+
+
+def _get_in_project(model, object_id, project):
+    """
+    Return the non-deleted milestone or deliverable of the project, or None.
+
+    Primary-key lookup: served from the session's identity map when the
+    object is already loaded in this request.
+    """
+    obj = db.session.get(model, object_id)
+    if (
+        obj is None
+        or obj.project_id != project.id
+        or obj.company_id != project.company_id
+        or obj.removed_at
+    ):
+        return None
+    return obj
+
 
 class MilestoneDeliverableListResource(Resource):
     """
@@ -53,29 +97,42 @@ class MilestoneDeliverableListResource(Resource):
             company_id = g.company_id
 
             # Verify project exists
-            project = Project.query.filter_by(
-                id=project_id, company_id=company_id, removed_at=None
-            ).first()
-            if not project:
+            if not Project.get_active_cached(project_id, company_id):
                 return {"error": "Project not found"}, 404
 
-            # Verify milestone exists and belongs to project
-            milestone = Milestone.query.filter_by(
-                id=milestone_id,
-                project_id=project_id,
-                company_id=company_id,
-                removed_at=None,
-            ).first()
-            if not milestone:
+            milestone_filter = (
+                Milestone.id == milestone_id,
+                Milestone.project_id == project_id,
+                Milestone.company_id == company_id,
+                Milestone.removed_at.is_(None),
+            )
+
+            # Non-deleted deliverables of the milestone, provided it exists
+            # in the project, as plain rows in one round-trip
+            rows = db.session.execute(
+                select(*_DELIVERABLE_COLUMNS)
+                .join(
+                    milestone_deliverable_association,
+                    milestone_deliverable_association.c.deliverable_id
+                    == Deliverable.id,
+                )
+                .join(
+                    Milestone,
+                    Milestone.id
+                    == milestone_deliverable_association.c.milestone_id,
+                )
+                .where(*milestone_filter, Deliverable.removed_at.is_(None))
+            ).mappings()
+            deliverables = [dict(row) for row in rows]
+
+            # Only an empty result needs telling an empty milestone apart
+            # from a missing one
+            if not deliverables and not db.session.scalar(
+                select(exists().where(*milestone_filter))
+            ):
                 return {"error": "Milestone not found"}, 404
 
-            # Get all deliverables associated with this milestone
-            deliverables = milestone.deliverables.filter(
-                Deliverable.removed_at.is_(None)
-            ).all()
-
-            schema = DeliverableSchema(many=True)
-            return schema.dump(deliverables), 200
+            return deliverables, 200
 
         except Exception as e:
             return {
@@ -101,19 +158,12 @@ class MilestoneDeliverableListResource(Resource):
             company_id = g.company_id
 
             # Verify project exists
-            project = Project.query.filter_by(
-                id=project_id, company_id=company_id, removed_at=None
-            ).first()
+            project = Project.get_active(project_id, company_id)
             if not project:
                 return {"error": "Project not found"}, 404
 
             # Verify milestone exists and belongs to project
-            milestone = Milestone.query.filter_by(
-                id=milestone_id,
-                project_id=project_id,
-                company_id=company_id,
-                removed_at=None,
-            ).first()
+            milestone = _get_in_project(Milestone, milestone_id, project)
             if not milestone:
                 return {"error": "Milestone not found"}, 404
 
@@ -128,12 +178,7 @@ class MilestoneDeliverableListResource(Resource):
             deliverable_id = data["deliverable_id"]
 
             # Verify deliverable exists and belongs to same project
-            deliverable = Deliverable.query.filter_by(
-                id=deliverable_id,
-                project_id=project_id,
-                company_id=company_id,
-                removed_at=None,
-            ).first()
+            deliverable = _get_in_project(Deliverable, deliverable_id, project)
             if not deliverable:
                 return {
                     "error": "Deliverable not found",
@@ -141,10 +186,7 @@ class MilestoneDeliverableListResource(Resource):
                 }, 404
 
             # Check if association already exists
-            existing = milestone.deliverables.filter_by(
-                id=deliverable_id
-            ).first()
-            if existing:
+            if _is_associated(milestone_id, deliverable_id):
                 return {
                     "error": "Association already exists",
                     "detail": "This deliverable is already associated with this milestone",
@@ -155,8 +197,7 @@ class MilestoneDeliverableListResource(Resource):
             db.session.commit()
 
             # Return the associated deliverable
-            schema = DeliverableSchema()
-            return schema.dump(deliverable), 201
+            return deliverable_schema.dump(deliverable), 201
 
         except SQLAlchemyError as e:
             db.session.rollback()
@@ -193,44 +234,36 @@ class MilestoneDeliverableResource(Resource):
             company_id = g.company_id
 
             # Verify project exists
-            project = Project.query.filter_by(
-                id=project_id, company_id=company_id, removed_at=None
-            ).first()
+            project = Project.get_active(project_id, company_id)
             if not project:
                 return {"error": "Project not found"}, 404
 
             # Verify milestone exists and belongs to project
-            milestone = Milestone.query.filter_by(
-                id=milestone_id,
-                project_id=project_id,
-                company_id=company_id,
-                removed_at=None,
-            ).first()
+            milestone = _get_in_project(Milestone, milestone_id, project)
             if not milestone:
                 return {"error": "Milestone not found"}, 404
 
             # Verify deliverable exists and belongs to same project
-            deliverable = Deliverable.query.filter_by(
-                id=deliverable_id,
-                project_id=project_id,
-                company_id=company_id,
-                removed_at=None,
-            ).first()
+            deliverable = _get_in_project(Deliverable, deliverable_id, project)
             if not deliverable:
                 return {"error": "Deliverable not found"}, 404
 
-            # Check if association exists
-            existing = milestone.deliverables.filter_by(
-                id=deliverable_id
-            ).first()
-            if not existing:
+            # Remove the association, if any, in one statement: the row
+            # count tells whether it existed
+            result = db.session.execute(
+                delete(milestone_deliverable_association).where(
+                    milestone_deliverable_association.c.milestone_id
+                    == milestone.id,
+                    milestone_deliverable_association.c.deliverable_id
+                    == deliverable.id,
+                )
+            )
+            if not result.rowcount:
+                db.session.rollback()
                 return {
                     "error": "Association not found",
                     "detail": "This deliverable is not associated with this milestone",
                 }, 404
-
-            # Remove association
-            milestone.deliverables.remove(deliverable)
             db.session.commit()
 
             return "", 204
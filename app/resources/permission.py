@@ -29,12 +29,33 @@ Resources:
 - PermissionListResource: GET (list only) - READ-ONLY
 """
 
+import uuid
+
 from flask import g
 from flask_restful import Resource
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
 from app.models.db import db
-from app.models.project import ProjectPermission, Project
-from app.schemas.project_schema import ProjectPermissionSchema
+from app.models.project import PERMISSION_KINDS, ProjectPermission, Project
 from app.utils import require_jwt_auth, check_access_required
+from app.utils.cache import TTLCache
+
+# The list endpoint dumps rows straight from these columns (the fields of
+# ProjectPermissionSchema, which leaves out kind), skipping ORM instances
+# and per-field schema calls
+_LIST_COLUMNS = tuple(
+    column for column in ProjectPermission.__table__.c if column.key != "kind"
+)
+
+# Seconds a project's permission list stays cached in a worker process
+PERMISSION_LIST_CACHE_TTL = 3600
+
+# (project_id, company_id) -> listed permissions. Only non-empty lists are
+# cached: a project's permissions are seeded once, all together, and never
+# change afterwards, so other workers cannot keep serving a stale list.
+permission_list_cache = TTLCache(ttl=PERMISSION_LIST_CACHE_TTL, maxsize=4096)
 
 
 class PermissionListResource(Resource):
@@ -64,26 +85,29 @@ class PermissionListResource(Resource):
             company_id = g.company_id
 
             # Verify project exists and belongs to company
-            project = Project.query.filter_by(
-                id=project_id, company_id=company_id, removed_at=None
-            ).first()
-
-            if not project:
+            if not Project.get_active_cached(project_id, company_id):
                 return {"error": "Project not found"}, 404
 
-            # Get all permissions for project (filter soft-deleted)
-            permissions = (
-                ProjectPermission.query.filter_by(
-                    project_id=project_id,
-                    company_id=company_id,
-                    removed_at=None,
+            key = (project_id, company_id)
+            cached = permission_list_cache.get(key)
+            if cached is not None:
+                return cached, 200
+
+            # Non-deleted permissions of the project, as plain rows
+            rows = db.session.execute(
+                select(*_LIST_COLUMNS)
+                .where(
+                    ProjectPermission.project_id == project_id,
+                    ProjectPermission.company_id == company_id,
+                    ProjectPermission.removed_at.is_(None),
                 )
                 .order_by(ProjectPermission.category, ProjectPermission.name)
-                .all()
-            )
+            ).mappings()
+            permissions = [dict(row) for row in rows]
 
-            schema = ProjectPermissionSchema(many=True)
-            return schema.dump(permissions), 200
+            if permissions:
+                permission_list_cache.set(key, permissions)
+            return permissions, 200
 
         except Exception as e:
             return {
@@ -92,11 +116,71 @@ class PermissionListResource(Resource):
             }, 500
 
 
+# The 10 predefined permissions seeded on every initialized project
+PREDEFINED_PERMISSIONS = (
+    # File Operations (5)
+    {
+        "name": "read_files",
+        "description": "Read files in Storage Service",
+        "category": "file_operations",
+    },
+    {
+        "name": "write_files",
+        "description": "Write/upload files in Storage Service",
+        "category": "file_operations",
+    },
+    {
+        "name": "delete_files",
+        "description": "Delete files in Storage Service",
+        "category": "file_operations",
+    },
+    {
+        "name": "lock_files",
+        "description": "Lock files in Storage Service",
+        "category": "file_operations",
+    },
+    {
+        "name": "validate_files",
+        "description": "Validate files in Storage Service",
+        "category": "file_operations",
+    },
+    # Project Operations (2)
+    {
+        "name": "update_project",
+        "description": "Update project metadata",
+        "category": "project_operations",
+    },
+    {
+        "name": "delete_project",
+        "description": "Delete/archive project",
+        "category": "project_operations",
+    },
+    # Member Operations (3)
+    {
+        "name": "manage_members",
+        "description": "Add/remove project members",
+        "category": "member_operations",
+    },
+    {
+        "name": "manage_roles",
+        "description": "Create/modify project roles",
+        "category": "member_operations",
+    },
+    {
+        "name": "manage_policies",
+        "description": "Create/modify project policies",
+        "category": "member_operations",
+    },
+)
+
+
 def seed_project_permissions(project_id, company_id):
     """
     Seed the 10 predefined permissions for a project.
 
     This function should be called when a project transitions to 'initialized' status.
+    All rows go in one INSERT ... ON CONFLICT DO NOTHING: permissions the
+    project already has (uq_project_permission_name) are left untouched.
 
     Args:
         project_id: The project ID to seed permissions for
@@ -105,81 +189,29 @@ def seed_project_permissions(project_id, company_id):
     Returns:
         List of created ProjectPermission objects
     """
-    # Define the 10 predefined permissions
-    predefined_permissions = [
-        # File Operations (5)
-        {
-            "name": "read_files",
-            "description": "Read files in Storage Service",
-            "category": "file_operations",
-        },
-        {
-            "name": "write_files",
-            "description": "Write/upload files in Storage Service",
-            "category": "file_operations",
-        },
-        {
-            "name": "delete_files",
-            "description": "Delete files in Storage Service",
-            "category": "file_operations",
-        },
-        {
-            "name": "lock_files",
-            "description": "Lock files in Storage Service",
-            "category": "file_operations",
-        },
-        {
-            "name": "validate_files",
-            "description": "Validate files in Storage Service",
-            "category": "file_operations",
-        },
-        # Project Operations (2)
-        {
-            "name": "update_project",
-            "description": "Update project metadata",
-            "category": "project_operations",
-        },
-        {
-            "name": "delete_project",
-            "description": "Delete/archive project",
-            "category": "project_operations",
-        },
-        # Member Operations (3)
-        {
-            "name": "manage_members",
-            "description": "Add/remove project members",
-            "category": "member_operations",
-        },
-        {
-            "name": "manage_roles",
-            "description": "Create/modify project roles",
-            "category": "member_operations",
-        },
-        {
-            "name": "manage_policies",
-            "description": "Create/modify project policies",
-            "category": "member_operations",
-        },
-    ]
-
-    created_permissions = []
-
-    for perm_data in predefined_permissions:
-        # Check if permission already exists (avoid duplicates)
-        existing = ProjectPermission.query.filter_by(
-            project_id=project_id, name=perm_data["name"], removed_at=None
-        ).first()
-
-        if not existing:
-            permission = ProjectPermission(
-                project_id=project_id,
-                company_id=company_id,
-                name=perm_data["name"],
-                description=perm_data["description"],
-                category=perm_data["category"],
-            )
-            db.session.add(permission)
-            created_permissions.append(permission)
+    dialect_name = db.session.get_bind().dialect.name
+    insert = pg_insert if dialect_name == "postgresql" else sqlite_insert
+    # Bulk inserts skip the name validator: kind is set explicitly
+    stmt = (
+        insert(ProjectPermission)
+        .values(
+            [
+                {
+                    "id": str(uuid.uuid4()),
+                    "project_id": project_id,
+                    "company_id": company_id,
+                    "kind": PERMISSION_KINDS[perm_data["name"]],
+                    **perm_data,
+                }
+                for perm_data in PREDEFINED_PERMISSIONS
+            ]
+        )
+        .on_conflict_do_nothing(index_elements=["project_id", "name"])
+        .returning(ProjectPermission)
+    )
+    created_permissions = db.session.scalars(stmt).all()
 
     db.session.commit()
+    if created_permissions:
+        permission_list_cache.delete((project_id, company_id))
     return created_permissions
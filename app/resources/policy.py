@@ -18,12 +18,12 @@ Resources:
 - PolicyResource: GET (retrieve), PUT (full update), PATCH (partial update), DELETE (soft delete)
 """
 
-from datetime import datetime, timezone
 from flask import request, g
 from flask_restful import Resource
 from marshmallow import ValidationError
+from sqlalchemy import exists, select
 from sqlalchemy.exc import SQLAlchemyError
-from app.models.db import db
+from app.models.db import UtcNow, db
 from app.models.project import ProjectPolicy, Project, role_policy_association
 from app.schemas.project_schema import (
     ProjectPolicySchema,
@@ -32,6 +32,27 @@ from app.schemas.project_schema import (
 )
 from app.utils import require_jwt_auth, check_access_required
 
+project_policy_create_schema = ProjectPolicyCreateSchema()
+project_policy_schema = ProjectPolicySchema()
+project_policy_update_schema = ProjectPolicyUpdateSchema()
+
+# The list endpoint dumps rows straight from these columns (the fields of
+# ProjectPolicySchema), skipping ORM instances and per-field schema calls
+_LIST_COLUMNS = tuple(ProjectPolicy.__table__.c)
+
+
+def _name_taken(project_id, name):
+    """Return True if a non-deleted policy of the project has this name."""
+    return db.session.scalar(
+        select(
+            exists().where(
+                ProjectPolicy.project_id == project_id,
+                ProjectPolicy.name == name,
+                ProjectPolicy.removed_at.is_(None),
+            )
+        )
+    )
+
 
 class PolicyListResource(Resource):
     """
@@ -64,20 +85,19 @@ class PolicyListResource(Resource):
             company_id = g.company_id
 
             # Verify project exists and belongs to company
-            project = Project.query.filter_by(
-                id=project_id, company_id=company_id, removed_at=None
-            ).first()
-
-            if not project:
+            if not Project.get_active_cached(project_id, company_id):
                 return {"error": "Project not found"}, 404
 
-            # Get all policies for project (filter soft-deleted)
-            policies = ProjectPolicy.query.filter_by(
-                project_id=project_id, company_id=company_id, removed_at=None
-            ).all()
+            # Non-deleted policies of the project, as plain rows
+            rows = db.session.execute(
+                select(*_LIST_COLUMNS).where(
+                    ProjectPolicy.project_id == project_id,
+                    ProjectPolicy.company_id == company_id,
+                    ProjectPolicy.removed_at.is_(None),
+                )
+            ).mappings()
 
-            schema = ProjectPolicySchema(many=True)
-            return schema.dump(policies), 200
+            return [dict(row) for row in rows], 200
 
         except Exception as e:
             return {
@@ -107,17 +127,12 @@ class PolicyListResource(Resource):
             company_id = g.company_id
 
             # Verify project exists and belongs to company
-            project = Project.query.filter_by(
-                id=project_id, company_id=company_id, removed_at=None
-            ).first()
-
-            if not project:
+            if not Project.get_active(project_id, company_id):
                 return {"error": "Project not found"}, 404
 
             # Parse and validate input
-            schema = ProjectPolicyCreateSchema()
             try:
-                data = schema.load(request.get_json())
+                data = project_policy_create_schema.load(request.get_json())
             except ValidationError as err:
                 return {
                     "error": "Invalid input data",
@@ -125,11 +140,7 @@ class PolicyListResource(Resource):
                 }, 400
 
             # Check for duplicate policy name in project
-            existing_policy = ProjectPolicy.query.filter_by(
-                project_id=project_id, name=data["name"], removed_at=None
-            ).first()
-
-            if existing_policy:
+            if _name_taken(project_id, data["name"]):
                 return {
                     "error": "Policy name already exists in this project",
                     "detail": f"A policy named '{data['name']}' already exists",
@@ -147,8 +158,7 @@ class PolicyListResource(Resource):
             db.session.commit()
 
             # Return created policy
-            response_schema = ProjectPolicySchema()
-            return response_schema.dump(policy), 201
+            return project_policy_schema.dump(policy), 201
 
         except SQLAlchemyError as e:
             db.session.rollback()
@@ -201,8 +211,7 @@ class PolicyResource(Resource):
             if not policy:
                 return {"error": "Policy not found"}, 404
 
-            schema = ProjectPolicySchema()
-            return schema.dump(policy), 200
+            return project_policy_schema.dump(policy), 200
 
         except Exception as e:
             return {
@@ -286,7 +295,7 @@ class PolicyResource(Resource):
                 }, 400
 
             # Soft delete the policy
-            policy.removed_at = datetime.now(timezone.utc)
+            policy.removed_at = UtcNow()
             db.session.commit()
 
             return "", 204
@@ -318,9 +327,10 @@ class PolicyResource(Resource):
                 return {"error": "Policy not found"}, 404
 
             # Parse and validate input
-            schema = ProjectPolicyUpdateSchema(partial=partial)
             try:
-                data = schema.load(request.get_json())
+                data = project_policy_update_schema.load(
+                    request.get_json(), partial=partial
+                )
             except ValidationError as err:
                 return {
                     "error": "Invalid input data",
@@ -329,11 +339,7 @@ class PolicyResource(Resource):
 
             # Check for duplicate policy name if name is being changed
             if "name" in data and data["name"] != policy.name:
-                existing_policy = ProjectPolicy.query.filter_by(
-                    project_id=project_id, name=data["name"], removed_at=None
-                ).first()
-
-                if existing_policy:
+                if _name_taken(project_id, data["name"]):
                     return {
                         "error": "Policy name already exists in this project",
                         "detail": f"A policy named '{data['name']}' already exists",
@@ -348,8 +354,7 @@ class PolicyResource(Resource):
             db.session.commit()
 
             # Return updated policy
-            response_schema = ProjectPolicySchema()
-            return response_schema.dump(policy), 200
+            return project_policy_schema.dump(policy), 200
 
         except SQLAlchemyError as e:
             db.session.rollback()
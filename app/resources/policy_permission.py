@@ -16,12 +16,33 @@ Resources:
 
 from flask import g, request
 from flask_restful import Resource
+from sqlalchemy import exists, select
 from sqlalchemy.exc import SQLAlchemyError
 from app.models.db import db
-from app.models.project import Project, ProjectPolicy, ProjectPermission
+from app.models.project import (
+    Project,
+    ProjectPermission,
+    ProjectPolicy,
+    policy_permission_association,
+)
 from app.schemas.project_schema import ProjectPermissionSchema
 from app.utils import require_jwt_auth, check_access_required
 
+project_permissions_schema = ProjectPermissionSchema(many=True)
+project_permission_schema = ProjectPermissionSchema()
+
+
+def _is_assigned(policy_id, permission_id):
+    """Return True if the permission is assigned to the policy (single EXISTS)."""
+    return db.session.scalar(
+        select(
+            exists().where(
+                policy_permission_association.c.policy_id == policy_id,
+                policy_permission_association.c.permission_id == permission_id,
+            )
+        )
+    )
+
 
 class PolicyPermissionListResource(Resource):
     """
@@ -42,12 +63,7 @@ class PolicyPermissionListResource(Resource):
         company_id = g.company_id
 
         # Verify project exists and belongs to company
-        project = db.session.get(Project, project_id)
-        if (
-            not project
-            or project.company_id != company_id
-            or project.removed_at
-        ):
+        if not Project.get_active_cached(project_id, company_id):
             return {"error": "Project not found"}, 404
 
         # Verify policy exists and belongs to project
@@ -56,12 +72,13 @@ class PolicyPermissionListResource(Resource):
             return {"error": "Policy not found"}, 404
 
         # Get associated permissions through the relationship
-        # Filter out soft-deleted permissions
-        permissions = [p for p in policy.permissions if not p.removed_at]
+        # Soft-deleted permissions are filtered out by the database
+        permissions = policy.permissions.filter(
+            ProjectPermission.removed_at.is_(None)
+        ).all()
 
         # Serialize
-        permission_schema = ProjectPermissionSchema(many=True)
-        return permission_schema.dump(permissions), 200
+        return project_permissions_schema.dump(permissions), 200
 
     @require_jwt_auth()
     @check_access_required("update_project")
@@ -74,12 +91,7 @@ class PolicyPermissionListResource(Resource):
         company_id = g.company_id
 
         # Verify project exists and belongs to company
-        project = db.session.get(Project, project_id)
-        if (
-            not project
-            or project.company_id != company_id
-            or project.removed_at
-        ):
+        if not Project.get_active(project_id, company_id):
             return {"error": "Project not found"}, 404
 
         # Verify policy exists and belongs to project
@@ -104,7 +116,7 @@ class PolicyPermissionListResource(Resource):
             return {"error": "Permission not found"}, 404
 
         # Check if association already exists
-        if permission in policy.permissions:
+        if _is_assigned(policy.id, permission.id):
             return {
                 "error": "Permission is already assigned to this policy"
             }, 409
@@ -115,8 +127,7 @@ class PolicyPermissionListResource(Resource):
             db.session.commit()
 
             # Return the added permission
-            permission_schema = ProjectPermissionSchema()
-            return permission_schema.dump(permission), 201
+            return project_permission_schema.dump(permission), 201
 
         except SQLAlchemyError as e:
             db.session.rollback()
@@ -144,12 +155,7 @@ class PolicyPermissionResource(Resource):
         company_id = g.company_id
 
         # Verify project exists and belongs to company
-        project = db.session.get(Project, project_id)
-        if (
-            not project
-            or project.company_id != company_id
-            or project.removed_at
-        ):
+        if not Project.get_active(project_id, company_id):
             return {"error": "Project not found"}, 404
 
         # Verify policy exists and belongs to project
@@ -167,7 +173,7 @@ class PolicyPermissionResource(Resource):
             return {"error": "Permission not found"}, 404
 
         # Check if association exists
-        if permission not in policy.permissions:
+        if not _is_assigned(policy.id, permission.id):
             return {"error": "Permission is not assigned to this policy"}, 404
 
         try:
@@ -12,10 +12,9 @@ Endpoints:
 - DELETE /projects/{id} - Delete project (soft delete)
 """
 
-import uuid
-from datetime import datetime, timezone
 from flask import request, g
 from marshmallow import ValidationError
+from sqlalchemy import select
 from app.resources.base import BaseResource, error_response, validate_uuid
 from app.resources.permission import seed_project_permissions
 from app.utils.auth import require_jwt_auth, check_access_required
@@ -32,6 +31,14 @@ from app.logger import logger
 ERROR_PROJECT_NOT_FOUND = "Project not found"
 ERROR_VALIDATION = "Validation error"
 
+# The list endpoint dumps rows straight from these columns (the fields of
+# ProjectSchema), skipping ORM instances and per-field schema calls
+_LIST_COLUMNS = tuple(Project.__table__.c)
+
+project_create_schema = ProjectCreateSchema()
+project_schema = ProjectSchema()
+project_update_schema = ProjectUpdateSchema()
+
 
 class ProjectListResource(BaseResource):
     """Resource for listing and creating projects."""
@@ -40,17 +47,18 @@ class ProjectListResource(BaseResource):
     def get(self):
         """List all projects for the authenticated user's company."""
         try:
-            company_id = str(uuid.UUID(g.company_id))
-
-            projects = Project.query.filter(
-                Project.company_id == company_id
-            ).all()
-
-            # Filter out soft-deleted projects
-            projects = [p for p in projects if not p.removed_at]
+            company_id = g.company_id
+
+            # Non-deleted projects as plain rows
+            # (served by idx_projects_company_active)
+            rows = db.session.execute(
+                select(*_LIST_COLUMNS).where(
+                    Project.company_id == company_id,
+                    Project.removed_at.is_(None),
+                )
+            ).mappings()
 
-            schema = ProjectSchema(many=True)
-            return schema.dump(projects), 200
+            return [dict(row) for row in rows], 200
 
         except Exception as error:
             return self.handle_error(error)
@@ -60,7 +68,7 @@ class ProjectListResource(BaseResource):
     def post(self):
         """Create a new project."""
         try:
-            company_id = str(uuid.UUID(g.company_id))
+            company_id = g.company_id
             user_id = g.user_id  # Keep as string for external reference
 
             data = request.get_json()
@@ -88,8 +96,7 @@ class ProjectListResource(BaseResource):
             data["company_id"] = str(company_id)
             data["created_by"] = user_id
 
-            schema = ProjectCreateSchema()
-            validated_data = schema.load(data)
+            validated_data = project_create_schema.load(data)
 
             # Create project instance
             project = Project(**validated_data)
@@ -101,16 +108,21 @@ class ProjectListResource(BaseResource):
             db.session.flush()
 
             # Create history entry for project creation
-            history = ProjectHistory(
-                project_id=project.id,
-                company_id=str(company_id),
-                changed_by=str(user_id),
-                action="created",
-                field_name="status",
-                new_value="created",
-                comment=f"Project '{validated_data['name']}' created",
+            ProjectHistory.record_many(
+                [
+                    {
+                        "project_id": project.id,
+                        "company_id": str(company_id),
+                        "changed_by": str(user_id),
+                        "action": "created",
+                        "field_name": "status",
+                        "new_value": "created",
+                        "comment": (
+                            f"Project '{validated_data['name']}' created"
+                        ),
+                    }
+                ]
             )
-            db.session.add(history)
 
             if not self.commit_or_rollback():
                 return error_response("Failed to create project", 500)
@@ -168,14 +180,13 @@ class ProjectResource(BaseResource):
         """Get project details."""
         try:
             validate_uuid(project_id, "project_id")
-            company_id = str(uuid.UUID(g.company_id))
+            company_id = g.company_id
 
             project = self._get_project(project_id, company_id)
             if not project:
                 return error_response(ERROR_PROJECT_NOT_FOUND, 404)
 
-            schema = ProjectSchema()
-            return schema.dump(project), 200
+            return project_schema.dump(project), 200
 
         except ValueError as error:
             return self._handle_value_error(error)
@@ -200,24 +211,29 @@ class ProjectResource(BaseResource):
         """Delete a project (soft delete)."""
         try:
             validate_uuid(project_id, "project_id")
-            company_id = str(uuid.UUID(g.company_id))
+            company_id = g.company_id
             user_id = g.user_id  # Keep as string for external reference
 
             project = self._get_project(project_id, company_id)
             if not project:
                 return error_response(ERROR_PROJECT_NOT_FOUND, 404)
 
-            project.removed_at = datetime.now(timezone.utc)
-
-            history = ProjectHistory(
-                project_id=project.id,
-                company_id=str(company_id),
-                changed_by=str(user_id),
-                action="deleted",
-                field_name="removed_at",
-                new_value=project.removed_at.isoformat(),
+            # Same UTC clock as the bulk path; removed_at is read back for
+            # the audit entry
+            project.soft_delete()
+
+            ProjectHistory.record_many(
+                [
+                    {
+                        "project_id": project.id,
+                        "company_id": str(company_id),
+                        "changed_by": str(user_id),
+                        "action": "deleted",
+                        "field_name": "removed_at",
+                        "new_value": project.removed_at.isoformat(),
+                    }
+                ]
             )
-            db.session.add(history)
 
             if not self.commit_or_rollback():
                 return error_response("Failed to delete project", 500)
@@ -235,15 +251,16 @@ class ProjectResource(BaseResource):
         """Internal method to update a project."""
         try:
             validate_uuid(project_id, "project_id")
-            company_id = str(uuid.UUID(g.company_id))
+            company_id = g.company_id
             user_id = g.user_id  # Keep as string for external reference
 
             project = self._get_project(project_id, company_id)
             if not project:
                 return error_response(ERROR_PROJECT_NOT_FOUND, 404)
 
-            schema = ProjectUpdateSchema(partial=partial)
-            data = schema.load(request.get_json())
+            data = project_update_schema.load(
+                request.get_json(), partial=partial
+            )
 
             changes = {}
             for field, value in data.items():
@@ -260,9 +277,11 @@ class ProjectResource(BaseResource):
             ):
                 seed_project_permissions(project.id, company_id)
 
-            # Create history entries for each changed field
+            # Create history entries for each changed field, inserted
+            # together in one statement
             if changes:
                 action = "status_changed" if "status" in changes else "updated"
+                entries = []
                 for field_name, change in changes.items():
                     # Convert values to string for storage
                     old_val = (
@@ -274,22 +293,23 @@ class ProjectResource(BaseResource):
                         str(change["to"]) if change["to"] is not None else None
                     )
 
-                    history = ProjectHistory(
-                        project_id=project.id,
-                        company_id=str(company_id),
-                        changed_by=str(user_id),
-                        action=action,
-                        field_name=field_name,
-                        old_value=old_val,
-                        new_value=new_val,
+                    entries.append(
+                        {
+                            "project_id": project.id,
+                            "company_id": str(company_id),
+                            "changed_by": str(user_id),
+                            "action": action,
+                            "field_name": field_name,
+                            "old_value": old_val,
+                            "new_value": new_val,
+                        }
                     )
-                    db.session.add(history)
+                ProjectHistory.record_many(entries)
 
             if not self.commit_or_rollback():
                 return error_response("Failed to update project", 500)
 
-            return_schema = ProjectSchema()
-            return return_schema.dump(project), 200
+            return project_schema.dump(project), 200
 
         except ValidationError as error:
             return error_response(ERROR_VALIDATION, 400, errors=error.messages)
@@ -301,12 +321,8 @@ class ProjectResource(BaseResource):
     @staticmethod
     def _get_project(project_id, company_id):
         """Get project by ID and company."""
-        # Ensure string UUIDs for comparison (db.String(36))
-        if not isinstance(project_id, str):
-            project_id = str(project_id)
-        if not isinstance(company_id, str):
-            company_id = str(company_id)
-
+        # Both IDs arrive as strings: project_id from the URL, company_id
+        # canonicalized once by require_jwt_auth
         project = Project.query.filter(
             Project.id == project_id, Project.company_id == company_id
         ).first()
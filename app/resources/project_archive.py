@@ -2,10 +2,9 @@
 Project archive and restore operations.
 """
 
-from datetime import datetime, timezone
 from flask import g
 from flask_restful import Resource
-from app.models.db import db
+from app.models.db import UtcNow, db
 from app.models.project import Project
 from app.schemas import ProjectSchema
 from app.utils.auth import require_jwt_auth, check_access_required
@@ -62,8 +61,8 @@ class ProjectArchiveResource(Resource):
 
         # Update status and dates
         project.status = "archived"
-        project.archived_at = datetime.now(timezone.utc)
-        project.updated_at = datetime.now(timezone.utc)
+        project.archived_at = UtcNow()
+        project.updated_at = UtcNow()
 
         db.session.commit()
 
@@ -120,7 +119,7 @@ class ProjectRestoreResource(Resource):
 
         # Update status
         project.status = "active"
-        project.updated_at = datetime.now(timezone.utc)
+        project.updated_at = UtcNow()
 
         db.session.commit()
 
@@ -18,13 +18,13 @@ Security:
 - Default roles (is_default=True) cannot be modified or deleted
 """
 
-from datetime import datetime, timezone
 from flask import request, g
 from flask_restful import Resource
 from marshmallow import ValidationError
+from sqlalchemy import exists, select
 from sqlalchemy.exc import IntegrityError
 
-from app.models.db import db
+from app.models.db import UtcNow, db
 from app.models.project import Project, ProjectRole, ProjectMember
 from app.schemas.project_schema import (
     ProjectRoleCreateSchema,
@@ -36,6 +36,14 @@ from app.utils import (
     check_access_required,
 )
 
+project_role_create_schema = ProjectRoleCreateSchema()
+project_role_schema = ProjectRoleSchema()
+project_role_update_schema = ProjectRoleUpdateSchema()
+
+# The list endpoint dumps rows straight from these columns (the fields of
+# ProjectRoleSchema), skipping ORM instances and per-field schema calls
+_LIST_COLUMNS = tuple(ProjectRole.__table__.c)
+
 
 class RoleListResource(Resource):
     """
@@ -57,20 +65,19 @@ class RoleListResource(Resource):
         company_id = g.company_id
 
         # Verify project exists and belongs to company
-        project = Project.query.filter_by(
-            id=project_id, company_id=company_id, removed_at=None
-        ).first()
-
-        if not project:
+        if not Project.get_active_cached(project_id, company_id):
             return {"error": "Project not found"}, 404
 
-        # Get all non-deleted roles
-        roles = ProjectRole.query.filter_by(
-            project_id=project_id, company_id=company_id, removed_at=None
-        ).all()
+        # Non-deleted roles of the project, as plain rows
+        rows = db.session.execute(
+            select(*_LIST_COLUMNS).where(
+                ProjectRole.project_id == project_id,
+                ProjectRole.company_id == company_id,
+                ProjectRole.removed_at.is_(None),
+            )
+        ).mappings()
 
-        schema = ProjectRoleSchema(many=True)
-        return schema.dump(roles), 200
+        return [dict(row) for row in rows], 200
 
     @require_jwt_auth()
     @check_access_required("create")
@@ -93,16 +100,11 @@ class RoleListResource(Resource):
         company_id = g.company_id
 
         # Verify project exists and belongs to company
-        project = Project.query.filter_by(
-            id=project_id, company_id=company_id, removed_at=None
-        ).first()
-
-        if not project:
+        if not Project.get_active(project_id, company_id):
             return {"error": "Project not found"}, 404
 
         # Parse and validate request data
         try:
-            schema = ProjectRoleCreateSchema()
             data = request.get_json()
 
             # Inject authoritative values
@@ -110,18 +112,12 @@ class RoleListResource(Resource):
             data["company_id"] = company_id
             data["is_default"] = False  # Custom roles are never default
 
-            validated_data = schema.load(data)
+            validated_data = project_role_create_schema.load(data)
         except ValidationError as e:
             return {"errors": e.messages}, 400
 
         # Check for duplicate role name in project
-        existing_role = ProjectRole.query.filter_by(
-            project_id=project_id,
-            name=validated_data["name"],
-            removed_at=None,
-        ).first()
-
-        if existing_role:
+        if _name_taken(project_id, validated_data["name"]):
             return {
                 "error": f"Role '{validated_data['name']}' already exists in this project"
             }, 409
@@ -132,8 +128,7 @@ class RoleListResource(Resource):
             db.session.add(role)
             db.session.commit()
 
-            schema = ProjectRoleSchema()
-            return schema.dump(role), 201
+            return project_role_schema.dump(role), 201
         except IntegrityError:
             db.session.rollback()
             return {"error": "Database integrity error"}, 400
@@ -167,8 +162,7 @@ class RoleResource(Resource):
         if not role:
             return {"error": "Role not found"}, 404
 
-        schema = ProjectRoleSchema()
-        return schema.dump(role), 200
+        return project_role_schema.dump(role), 200
 
     @require_jwt_auth()
     @check_access_required("update")
@@ -247,7 +241,7 @@ class RoleResource(Resource):
 
         # Soft delete
         try:
-            role.removed_at = datetime.now(timezone.utc)
+            role.removed_at = UtcNow()
             db.session.commit()
             return "", 204
         except Exception as e:
@@ -284,21 +278,16 @@ class RoleResource(Resource):
 
         # Parse and validate request data
         try:
-            schema = ProjectRoleUpdateSchema(partial=partial)
             data = request.get_json()
-            validated_data = schema.load(data)
+            validated_data = project_role_update_schema.load(
+                data, partial=partial
+            )
         except ValidationError as e:
             return {"errors": e.messages}, 400
 
         # If name is being updated, check for duplicates
         if "name" in validated_data and validated_data["name"] != role.name:
-            existing_role = ProjectRole.query.filter_by(
-                project_id=project_id,
-                name=validated_data["name"],
-                removed_at=None,
-            ).first()
-
-            if existing_role:
+            if _name_taken(project_id, validated_data["name"]):
                 return {
                     "error": f"Role '{validated_data['name']}' already exists in this project"
                 }, 409
@@ -310,8 +299,7 @@ class RoleResource(Resource):
 
             db.session.commit()
 
-            schema = ProjectRoleSchema()
-            return schema.dump(role), 200
+            return project_role_schema.dump(role), 200
         except Exception as e:
             db.session.rollback()
             return {"error": str(e)}, 500
@@ -335,3 +323,25 @@ def _get_role(project_id, role_id, company_id):
         company_id=company_id,
         removed_at=None,
     ).first()
+
+
+def _name_taken(project_id, name):
+    """
+    Return True if a non-deleted role of the project already has this name.
+
+    Args:
+        project_id: Project ID
+        name: Role name
+
+    Returns:
+        bool (single EXISTS, no row is loaded)
+    """
+    return db.session.scalar(
+        select(
+            exists().where(
+                ProjectRole.project_id == project_id,
+                ProjectRole.name == name,
+                ProjectRole.removed_at.is_(None),
+            )
+        )
+    )
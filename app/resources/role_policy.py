@@ -16,12 +16,33 @@ Resources:
 
 from flask import g, request
 from flask_restful import Resource
+from sqlalchemy import exists, select
 from sqlalchemy.exc import SQLAlchemyError
 from app.models.db import db
-from app.models.project import Project, ProjectRole, ProjectPolicy
+from app.models.project import (
+    Project,
+    ProjectPolicy,
+    ProjectRole,
+    role_policy_association,
+)
 from app.schemas.project_schema import ProjectPolicySchema
 from app.utils import require_jwt_auth, check_access_required
 
+project_policies_schema = ProjectPolicySchema(many=True)
+project_policy_schema = ProjectPolicySchema()
+
+
+def _is_assigned(role_id, policy_id):
+    """Return True if the policy is assigned to the role (single EXISTS)."""
+    return db.session.scalar(
+        select(
+            exists().where(
+                role_policy_association.c.role_id == role_id,
+                role_policy_association.c.policy_id == policy_id,
+            )
+        )
+    )
+
 
 class RolePolicyListResource(Resource):
     """
@@ -42,12 +63,7 @@ class RolePolicyListResource(Resource):
         company_id = g.company_id
 
         # Verify project exists and belongs to company
-        project = db.session.get(Project, project_id)
-        if (
-            not project
-            or project.company_id != company_id
-            or project.removed_at
-        ):
+        if not Project.get_active_cached(project_id, company_id):
             return {"error": "Project not found"}, 404
 
         # Verify role exists and belongs to project
@@ -56,12 +72,13 @@ class RolePolicyListResource(Resource):
             return {"error": "Role not found"}, 404
 
         # Get associated policies through the relationship
-        # Filter out soft-deleted policies
-        policies = [p for p in role.policies if not p.removed_at]
+        # Soft-deleted policies are filtered out by the database
+        policies = role.policies.filter(
+            ProjectPolicy.removed_at.is_(None)
+        ).all()
 
         # Serialize
-        policy_schema = ProjectPolicySchema(many=True)
-        return policy_schema.dump(policies), 200
+        return project_policies_schema.dump(policies), 200
 
     @require_jwt_auth()
     @check_access_required("update_project")
@@ -74,12 +91,7 @@ class RolePolicyListResource(Resource):
         company_id = g.company_id
 
         # Verify project exists and belongs to company
-        project = db.session.get(Project, project_id)
-        if (
-            not project
-            or project.company_id != company_id
-            or project.removed_at
-        ):
+        if not Project.get_active(project_id, company_id):
             return {"error": "Project not found"}, 404
 
         # Verify role exists and belongs to project
@@ -100,7 +112,7 @@ class RolePolicyListResource(Resource):
             return {"error": "Policy not found"}, 404
 
         # Check if association already exists
-        if policy in role.policies:
+        if _is_assigned(role.id, policy.id):
             return {"error": "Policy is already assigned to this role"}, 409
 
         try:
@@ -109,8 +121,7 @@ class RolePolicyListResource(Resource):
             db.session.commit()
 
             # Return the added policy
-            policy_schema = ProjectPolicySchema()
-            return policy_schema.dump(policy), 201
+            return project_policy_schema.dump(policy), 201
 
         except SQLAlchemyError as e:
             db.session.rollback()
@@ -138,12 +149,7 @@ class RolePolicyResource(Resource):
         company_id = g.company_id
 
         # Verify project exists and belongs to company
-        project = db.session.get(Project, project_id)
-        if (
-            not project
-            or project.company_id != company_id
-            or project.removed_at
-        ):
+        if not Project.get_active(project_id, company_id):
             return {"error": "Project not found"}, 404
 
         # Verify role exists and belongs to project
@@ -157,7 +163,7 @@ class RolePolicyResource(Resource):
             return {"error": "Policy not found"}, 404
 
         # Check if association exists
-        if policy not in role.policies:
+        if not _is_assigned(role.id, policy.id):
             return {"error": "Policy is not assigned to this role"}, 404
 
         try:
@@ -8,6 +8,7 @@ Routes for the Flask application.
 
 from flask_restful import Api
 from app.logger import logger
+from app.utils import output_json
 from app.resources.version import VersionResource
 from app.resources.config import ConfigResource
 from app.resources.health import HealthResource
@@ -73,6 +74,7 @@ def register_routes(app):
     endpoints for the Project Service API.
     """
     api = Api(app)
+    api.representation("application/json")(output_json)
 
     # System endpoints
     api.add_resource(HealthResource, "/health")
@@ -0,0 +1,54 @@
+"""
+runtime_config.py
+-----------------
+
+Immutable snapshot of the settings read on the request path.
+
+The snapshot is built once by ``create_app`` (after the selected
+configuration has loaded the environment) and stored as
+``app.extensions["cfg"]``, so hot paths use a plain attribute access
+instead of environment or Flask config lookups.
+"""
+
+import os
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class RuntimeConfig:
+    """Settings resolved once per application."""
+
+    env: str | None
+    jwt_secret: str | None
+    # Body of GET /config (secrets are only reported as set or not)
+    exposed_config: dict
+    # Access-check requests a user may run at once per worker (0: no limit)
+    max_concurrent_checks: int
+    # Checks accepted in one access-check request
+    max_access_check_batch: int
+    # Database connections pooled per worker: one per gunicorn thread
+    db_pool_size: int
+
+    @classmethod
+    def from_env(cls):
+        """Build the runtime settings from the process environment."""
+        environ = os.environ
+        return cls(
+            env=environ.get("FLASK_ENV"),
+            jwt_secret=environ.get("JWT_SECRET"),
+            exposed_config={
+                "FLASK_ENV": environ.get("FLASK_ENV"),
+                "LOG_LEVEL": environ.get("LOG_LEVEL"),
+                "DATABASE_URI": environ.get("DATABASE_URI"),
+                "GUARDIAN_SERVICE_URL": environ.get("GUARDIAN_SERVICE_URL"),
+                "JWT_SECRET": "JWT_SECRET_KEY" in environ,
+                "INTERNAL_AUTH_TOKEN": "INTERNAL_SECRET_KEY" in environ,
+            },
+            max_concurrent_checks=int(
+                environ.get("MAX_CONCURRENT_CHECKS", "4")
+            ),
+            max_access_check_batch=int(
+                environ.get("MAX_ACCESS_CHECK_BATCH", "500")
+            ),
+            db_pool_size=int(environ.get("GUNICORN_THREADS", "8")),
+        )
@@ -9,11 +9,13 @@ from app.schemas.project_schema import (
     DeliverableCreateSchema,
     DeliverableSchema,
     DeliverableUpdateSchema,
+    FileAccessCheckSchema,
     MilestoneCreateSchema,
     MilestoneDeliverableAssociationSchema,
     MilestoneSchema,
     MilestoneUpdateSchema,
     PolicyPermissionAssociationSchema,
+    ProjectAccessCheckSchema,
     ProjectCreateSchema,
     ProjectHistorySchema,
     ProjectMemberCreateSchema,
@@ -55,4 +57,6 @@ __all__ = [
     "MilestoneDeliverableAssociationSchema",
     "RolePolicyAssociationSchema",
     "PolicyPermissionAssociationSchema",
+    "ProjectAccessCheckSchema",
+    "FileAccessCheckSchema",
 ]
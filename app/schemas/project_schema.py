@@ -6,7 +6,14 @@ Marshmallow schemas for Project Service models.
 Handles serialization, deserialization, and validation.
 """
 
-from marshmallow import ValidationError, fields, validates
+from marshmallow import (
+    EXCLUDE,
+    Schema,
+    ValidationError,
+    fields,
+    validate,
+    validates,
+)
 from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
 
 from app.models.project import (
@@ -20,13 +27,37 @@ from app.models.project import (
     ProjectRole,
 )
 
+# ============================================================================
+# BASE SCHEMA
+# ============================================================================
+
+
+class AutoSchema(SQLAlchemyAutoSchema):
+    """
+    SQLAlchemyAutoSchema with a cheaper load for plain data.
+
+    marshmallow-sqlalchemy looks up the installed marshmallow version on
+    every load() call, which costs more than validating the payload
+    itself. Schemas that do not build model instances go straight to
+    marshmallow's load().
+    """
+
+    def load(self, data, *, session=None, instance=None, **kwargs):
+        """Deserialize data, skipping the instance-loading wrapper."""
+        if self._load_instance or session or instance:
+            return super().load(
+                data, session=session, instance=instance, **kwargs
+            )
+        kwargs.pop("transient", None)
+        return Schema.load(self, data, **kwargs)
+
 
 # ============================================================================
 # PROJECT SCHEMAS
 # ============================================================================
 
 
-class ProjectSchema(SQLAlchemyAutoSchema):
+class ProjectSchema(AutoSchema):
     """
     Schema for Project model.
 
@@ -89,12 +120,16 @@ class ProjectSchema(SQLAlchemyAutoSchema):
         return value
 
 
-class ProjectCreateSchema(SQLAlchemyAutoSchema):
+class ProjectCreateSchema(AutoSchema):
     """
     Schema for creating a new project.
     Only includes fields needed at creation time.
     """
 
+    budget_currency = fields.String(
+        allow_none=True, validate=validate.Length(equal=3)
+    )
+
     class Meta:
         """Meta configuration for ProjectCreateSchema."""
 
@@ -112,12 +147,16 @@ class ProjectCreateSchema(SQLAlchemyAutoSchema):
         )
 
 
-class ProjectUpdateSchema(SQLAlchemyAutoSchema):
+class ProjectUpdateSchema(AutoSchema):
     """
     Schema for updating an existing project.
     All fields are optional for partial updates.
     """
 
+    budget_currency = fields.String(
+        allow_none=True, validate=validate.Length(equal=3)
+    )
+
     class Meta:
         """Meta configuration for ProjectUpdateSchema."""
 
@@ -141,7 +180,7 @@ class ProjectUpdateSchema(SQLAlchemyAutoSchema):
 # ============================================================================
 
 
-class MilestoneSchema(SQLAlchemyAutoSchema):
+class MilestoneSchema(AutoSchema):
     """Schema for Milestone model."""
 
     class Meta:
@@ -169,7 +208,7 @@ class MilestoneSchema(SQLAlchemyAutoSchema):
         return value
 
 
-class MilestoneCreateSchema(SQLAlchemyAutoSchema):
+class MilestoneCreateSchema(AutoSchema):
     """Schema for creating a new milestone."""
 
     class Meta:
@@ -186,7 +225,7 @@ class MilestoneCreateSchema(SQLAlchemyAutoSchema):
         )
 
 
-class MilestoneUpdateSchema(SQLAlchemyAutoSchema):
+class MilestoneUpdateSchema(AutoSchema):
     """Schema for updating a milestone."""
 
     class Meta:
@@ -211,7 +250,7 @@ class MilestoneUpdateSchema(SQLAlchemyAutoSchema):
 # ============================================================================
 
 
-class DeliverableSchema(SQLAlchemyAutoSchema):
+class DeliverableSchema(AutoSchema):
     """Schema for Deliverable model."""
 
     class Meta:
@@ -255,7 +294,7 @@ class DeliverableSchema(SQLAlchemyAutoSchema):
         return value
 
 
-class DeliverableCreateSchema(SQLAlchemyAutoSchema):
+class DeliverableCreateSchema(AutoSchema):
     """Schema for creating a new deliverable."""
 
     class Meta:
@@ -267,7 +306,7 @@ class DeliverableCreateSchema(SQLAlchemyAutoSchema):
         exclude = ("id", "created_at", "updated_at", "removed_at")
 
 
-class DeliverableUpdateSchema(SQLAlchemyAutoSchema):
+class DeliverableUpdateSchema(AutoSchema):
     """Schema for updating a deliverable."""
 
     class Meta:
@@ -292,7 +331,7 @@ class DeliverableUpdateSchema(SQLAlchemyAutoSchema):
 # ============================================================================
 
 
-class ProjectRoleSchema(SQLAlchemyAutoSchema):
+class ProjectRoleSchema(AutoSchema):
     """Schema for ProjectRole model."""
 
     class Meta:
@@ -304,7 +343,7 @@ class ProjectRoleSchema(SQLAlchemyAutoSchema):
         dump_only = ("id", "created_at", "updated_at", "removed_at")
 
 
-class ProjectRoleCreateSchema(SQLAlchemyAutoSchema):
+class ProjectRoleCreateSchema(AutoSchema):
     """Schema for creating a new role."""
 
     class Meta:
@@ -316,7 +355,7 @@ class ProjectRoleCreateSchema(SQLAlchemyAutoSchema):
         exclude = ("id", "created_at", "updated_at", "removed_at")
 
 
-class ProjectRoleUpdateSchema(SQLAlchemyAutoSchema):
+class ProjectRoleUpdateSchema(AutoSchema):
     """Schema for updating a role."""
 
     class Meta:
@@ -337,7 +376,7 @@ class ProjectRoleUpdateSchema(SQLAlchemyAutoSchema):
         partial = True
 
 
-class ProjectPolicySchema(SQLAlchemyAutoSchema):
+class ProjectPolicySchema(AutoSchema):
     """Schema for ProjectPolicy model."""
 
     class Meta:
@@ -349,7 +388,7 @@ class ProjectPolicySchema(SQLAlchemyAutoSchema):
         dump_only = ("id", "created_at", "updated_at", "removed_at")
 
 
-class ProjectPolicyCreateSchema(SQLAlchemyAutoSchema):
+class ProjectPolicyCreateSchema(AutoSchema):
     """Schema for creating a new policy."""
 
     class Meta:
@@ -368,7 +407,7 @@ class ProjectPolicyCreateSchema(SQLAlchemyAutoSchema):
         )
 
 
-class ProjectPolicyUpdateSchema(SQLAlchemyAutoSchema):
+class ProjectPolicyUpdateSchema(AutoSchema):
     """Schema for updating a policy."""
 
     class Meta:
@@ -388,7 +427,7 @@ class ProjectPolicyUpdateSchema(SQLAlchemyAutoSchema):
         partial = True
 
 
-class ProjectPermissionSchema(SQLAlchemyAutoSchema):
+class ProjectPermissionSchema(AutoSchema):
     """Schema for ProjectPermission model."""
 
     class Meta:
@@ -398,6 +437,7 @@ class ProjectPermissionSchema(SQLAlchemyAutoSchema):
         load_instance = True
         include_fk = True
         dump_only = ("id", "created_at", "removed_at")
+        exclude = ("kind",)
 
     @validates("category")
     def validate_category(self, value):
@@ -414,7 +454,7 @@ class ProjectPermissionSchema(SQLAlchemyAutoSchema):
         return value
 
 
-class ProjectPermissionCreateSchema(SQLAlchemyAutoSchema):
+class ProjectPermissionCreateSchema(AutoSchema):
     """Schema for creating a new permission."""
 
     class Meta:
@@ -423,7 +463,7 @@ class ProjectPermissionCreateSchema(SQLAlchemyAutoSchema):
         model = ProjectPermission
         load_instance = True
         include_fk = True
-        exclude = ("id", "created_at", "removed_at")
+        exclude = ("id", "kind", "created_at", "removed_at")
 
 
 # ============================================================================
@@ -431,7 +471,7 @@ class ProjectPermissionCreateSchema(SQLAlchemyAutoSchema):
 # ============================================================================
 
 
-class ProjectMemberSchema(SQLAlchemyAutoSchema):
+class ProjectMemberSchema(AutoSchema):
     """Schema for ProjectMember model."""
 
     class Meta:
@@ -440,10 +480,10 @@ class ProjectMemberSchema(SQLAlchemyAutoSchema):
         model = ProjectMember
         load_instance = True
         include_fk = True
-        dump_only = ("added_at", "removed_at")
+        dump_only = ("id", "added_at", "removed_at")
 
 
-class ProjectMemberCreateSchema(SQLAlchemyAutoSchema):
+class ProjectMemberCreateSchema(AutoSchema):
     """Schema for adding a member to a project."""
 
     class Meta:
@@ -452,10 +492,10 @@ class ProjectMemberCreateSchema(SQLAlchemyAutoSchema):
         model = ProjectMember
         load_instance = False
         include_fk = True
-        exclude = ("added_at", "removed_at")
+        exclude = ("id", "added_at", "removed_at")
 
 
-class ProjectMemberUpdateSchema(SQLAlchemyAutoSchema):
+class ProjectMemberUpdateSchema(AutoSchema):
     """Schema for updating a project member."""
 
     class Meta:
@@ -465,6 +505,7 @@ class ProjectMemberUpdateSchema(SQLAlchemyAutoSchema):
         load_instance = False
         include_fk = True
         exclude = (
+            "id",
             "project_id",
             "user_id",
             "company_id",
@@ -480,7 +521,7 @@ class ProjectMemberUpdateSchema(SQLAlchemyAutoSchema):
 # ============================================================================
 
 
-class ProjectHistorySchema(SQLAlchemyAutoSchema):
+class ProjectHistorySchema(AutoSchema):
     """Schema for ProjectHistory model."""
 
     class Meta:
@@ -516,22 +557,49 @@ class ProjectHistorySchema(SQLAlchemyAutoSchema):
 # ============================================================================
 
 
-class MilestoneDeliverableAssociationSchema(SQLAlchemyAutoSchema):
+class MilestoneDeliverableAssociationSchema(AutoSchema):
     """Schema for associating milestones with deliverables."""
 
     milestone_id = fields.UUID(required=True)
     deliverable_id = fields.UUID(required=True)
 
 
-class RolePolicyAssociationSchema(SQLAlchemyAutoSchema):
+class RolePolicyAssociationSchema(AutoSchema):
     """Schema for associating roles with policies."""
 
     role_id = fields.UUID(required=True)
     policy_id = fields.UUID(required=True)
 
 
-class PolicyPermissionAssociationSchema(SQLAlchemyAutoSchema):
+class PolicyPermissionAssociationSchema(AutoSchema):
     """Schema for associating policies with permissions."""
 
     policy_id = fields.UUID(required=True)
     permission_id = fields.UUID(required=True)
+
+
+# ============================================================================
+# ACCESS CHECK SCHEMAS (for requests)
+# ============================================================================
+
+
+class ProjectAccessCheckSchema(Schema):
+    """
+    Schema for one check of the access control endpoints.
+
+    Loaded with many=True: errors are reported per check index.
+    """
+
+    class Meta:
+        """Meta configuration for ProjectAccessCheckSchema."""
+
+        unknown = EXCLUDE
+
+    project_id = fields.String(required=True)
+    action = fields.String(required=True)
+
+
+class FileAccessCheckSchema(ProjectAccessCheckSchema):
+    """Schema for one check of the file access control endpoint."""
+
+    file_id = fields.String(required=True)
@@ -6,6 +6,10 @@ This module provides utility functions for the Project Service.
 
 Modules:
 - auth: Authentication and authorization utilities
+- cache: Process-local TTL cache
+- limiter: Per-user limit on concurrent requests
+- serialization: orjson-backed JSON provider, representation and streaming
+- singleflight: Deduplication of concurrent computations
 """
 
 from app.utils.auth import (
@@ -15,11 +19,26 @@ from app.utils.auth import (
     extract_jwt_data,
     require_jwt_auth,
 )
+from app.utils.cache import TTLCache
+from app.utils.limiter import ConcurrencyLimiter, limit_concurrency
+from app.utils.serialization import (
+    OrjsonProvider,
+    output_json,
+    stream_json_list,
+)
+from app.utils.singleflight import Singleflight
 
 __all__ = [
     "camel_to_snake",
     "check_access",
     "check_access_required",
+    "ConcurrencyLimiter",
     "extract_jwt_data",
+    "limit_concurrency",
+    "OrjsonProvider",
+    "output_json",
     "require_jwt_auth",
+    "Singleflight",
+    "stream_json_list",
+    "TTLCache",
 ]
@@ -5,11 +5,14 @@ import re
 import uuid
 from functools import wraps
 import jwt
-from flask import request, g
+from flask import current_app, request, g
 import requests
 
 from app.logger import logger
 
+# Environments where the Guardian service is bypassed
+ACCESS_BYPASS_ENVIRONMENTS = frozenset({"testing", "development"})
+
 
 def camel_to_snake(name):
     """
@@ -38,7 +41,7 @@ def extract_jwt_data():
         logger.debug("JWT token not found in cookies")
         return None
 
-    jwt_secret = os.environ.get("JWT_SECRET")
+    jwt_secret = current_app.extensions["cfg"].jwt_secret
     if not jwt_secret:
         logger.warning("JWT_SECRET not found in environment variables")
         return None
@@ -67,6 +70,27 @@ def extract_jwt_data():
         return None
 
 
+def _malformed_id_error():
+    """
+    Return a 400 response if a ``*_id`` URL parameter is not a valid UUID.
+
+    Identifier columns use the native UUID type, so malformed values must
+    not reach the database. Checked once the caller is authenticated:
+    anonymous requests get 401 whatever the URL.
+
+    Returns:
+        tuple: Error response (400) for the first malformed ID, else None.
+    """
+    for name, value in (request.view_args or {}).items():
+        if not name.endswith("_id"):
+            continue
+        try:
+            uuid.UUID(value)
+        except ValueError:
+            return {"message": f"Invalid {name}: must be a valid UUID"}, 400
+    return None
+
+
 def require_jwt_auth():
     """
     Decorator to require JWT authentication and extract JWT information.
@@ -80,7 +104,7 @@ def require_jwt_auth():
 
     Stores in g:
         - g.user_id: User ID from JWT
-        - g.company_id: Company ID from JWT
+        - g.company_id: Company ID from JWT (canonical UUID string)
         - g.jwt_data: Complete JWT payload
         - g.json_data: Original request JSON data (unmodified)
     """
@@ -119,15 +143,20 @@ def require_jwt_auth():
                     "message": "Invalid JWT token: missing company_id"
                 }, 401
 
-            # Validate UUID format for company_id
+            # Validate UUID format for company_id, parsed once here: views
+            # get it in canonical form
             try:
-                uuid.UUID(company_id)
+                company_id = str(uuid.UUID(company_id))
             except (ValueError, TypeError):
                 logger.error(f"Invalid company_id format in JWT: {company_id}")
                 return {
                     "message": "Invalid JWT token: company_id must be a valid UUID"
                 }, 401
 
+            malformed_id = _malformed_id_error()
+            if malformed_id:
+                return malformed_id
+
             # Store company_id, user_id and jwt_data in g for use in view functions
             g.company_id = company_id
             g.user_id = user_id
@@ -233,8 +262,8 @@ def check_access(user_id, resource_name, operation):
         f"resource_name: {resource_name}, operation: {operation}"
     )
 
-    flask_env = os.environ.get("FLASK_ENV", "production").lower()
-    if flask_env in ["testing", "development"]:
+    flask_env = os.environ.get("FLASK_ENV", "production").strip().lower()
+    if flask_env in ACCESS_BYPASS_ENVIRONMENTS:
         logger.debug("check_access: testing/development environment")
         return True, "Access granted in testing/development environment.", 200
 
@@ -0,0 +1,110 @@
+"""
+app.utils.cache
+---------------
+
+Process-local cache with per-entry expiry.
+
+Used to memoize hot lookups that rarely change (e.g. project existence
+checks) within a worker process. Entries are explicitly invalidated by the
+code paths that modify the underlying rows; the TTL bounds staleness across
+worker processes.
+"""
+
+import threading
+import time
+
+
+class TTLCache:
+    """
+    Thread-safe in-memory cache whose entries expire after ``ttl`` seconds.
+
+    When ``maxsize`` is reached the oldest entry is evicted. ``generation``
+    is incremented by every clear(): callers capture it before reading the
+    source data and pass it to set_many(), which then drops values read
+    before an invalidation.
+    """
+
+    def __init__(self, ttl=60, maxsize=1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.generation = 0
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Return the cached value for key, or default if missing or expired.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def get_many(self, keys):
+        """
+        Return a dict of the cached values for keys, skipping misses.
+        """
+        now = time.monotonic()
+        found = {}
+        with self._lock:
+            for key in keys:
+                entry = self._data.get(key)
+                if entry is None:
+                    continue
+                expires_at, value = entry
+                if expires_at <= now:
+                    del self._data[key]
+                    continue
+                found[key] = value
+        return found
+
+    def set(self, key, value):
+        """Store value under key for ``ttl`` seconds."""
+        with self._lock:
+            self._store(key, value, time.monotonic() + self.ttl)
+
+    def set_many(self, items, generation=None):
+        """
+        Store every (key, value) of the items dict for ``ttl`` seconds.
+
+        Nothing is stored if ``generation`` is given and the cache has been
+        cleared since it was captured.
+
+        Returns:
+            bool: True if the items were stored
+        """
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return False
+            for key, value in items.items():
+                self._store(key, value, expires_at)
+        return True
+
+    def _store(self, key, value, expires_at):
+        """Store an entry; the caller holds the lock."""
+        self._data.pop(key, None)
+        if len(self._data) >= self.maxsize:
+            # Dicts keep insertion order: the first key is the oldest
+            self._data.pop(next(iter(self._data)))
+        self._data[key] = (expires_at, value)
+
+    def delete(self, key):
+        """Remove key from the cache if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        """Remove every entry from the cache and start a new generation."""
+        with self._lock:
+            self._data.clear()
+            self.generation += 1
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
@@ -0,0 +1,92 @@
+"""
+app.utils.limiter
+-----------------
+
+Per-user limit on concurrent requests within a worker process.
+
+Expensive endpoints (e.g. large access-check batches) wrap their views with
+``limit_concurrency``: once a user has the configured number of requests in
+flight in the worker, further ones are rejected with 429 instead of queuing
+for a thread and a database connection.
+"""
+
+import threading
+from functools import wraps
+
+from flask import current_app, g
+
+
+class ConcurrencyLimiter:
+    """
+    Thread-safe count of in-flight requests per key.
+    """
+
+    def __init__(self):
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key, limit):
+        """
+        Register one more request for key.
+
+        Returns:
+            bool: False (nothing registered) if key already has ``limit``
+            requests in flight.
+        """
+        with self._lock:
+            count = self._in_flight.get(key, 0)
+            if count >= limit:
+                return False
+            self._in_flight[key] = count + 1
+            return True
+
+    def release(self, key):
+        """Unregister one request of key."""
+        with self._lock:
+            count = self._in_flight.pop(key) - 1
+            if count:
+                self._in_flight[key] = count
+
+    def __len__(self):
+        with self._lock:
+            return len(self._in_flight)
+
+
+def limit_concurrency(limiter, setting, retry_after=1):
+    """
+    Decorator limiting the requests a user runs concurrently.
+
+    Must be applied under ``require_jwt_auth`` (requests are counted per
+    ``g.user_id``).
+
+    Args:
+        limiter (ConcurrencyLimiter): Counter shared by the limited views.
+        setting (str): RuntimeConfig attribute holding the limit; a limit of
+            0 disables the check.
+        retry_after (int): Seconds suggested to rejected clients.
+
+    Returns:
+        function: The decorated view returning 429 past the limit.
+    """
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapped(*args, **kwargs):
+            limit = getattr(current_app.extensions["cfg"], setting)
+            if not limit:
+                return view_func(*args, **kwargs)
+            key = g.user_id
+            if not limiter.acquire(key, limit):
+                return (
+                    {"message": "Too many concurrent requests"},
+                    429,
+                    {"Retry-After": str(retry_after)},
+                )
+            try:
+                return view_func(*args, **kwargs)
+            finally:
+                limiter.release(key)
+
+        return wrapped
+
+    return decorator
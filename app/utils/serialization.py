@@ -0,0 +1,91 @@
+"""
+app.utils.serialization
+-----------------------
+
+JSON encoding and decoding backed by orjson.
+
+``OrjsonProvider`` replaces Flask's JSON provider, so ``request.get_json()``
+and ``jsonify`` use orjson; ``output_json`` is the matching Flask-RESTful
+representation for resource responses. ``stream_json_list`` streams large
+result lists without building them in memory.
+"""
+
+from itertools import islice
+
+import orjson
+from flask import current_app, make_response, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+
+# Non-string keys are coerced like the standard library does
+_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj):
+    """Serialize the types orjson does not handle natively (e.g. Decimal)."""
+    return DefaultJSONProvider.default(obj)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider serializing with orjson."""
+
+    def dumps(self, obj, **kwargs):
+        """Serialize obj to a JSON string."""
+        option = _OPTIONS
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=_default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize a JSON string or bytes."""
+        return orjson.loads(s)
+
+
+def output_json(data, code, headers=None):
+    """Make a Flask-RESTful response with an orjson encoded body."""
+    body = orjson.dumps(
+        data, default=_default, option=_OPTIONS | orjson.OPT_APPEND_NEWLINE
+    )
+    resp = make_response(body, code)
+    resp.headers.extend(headers or {})
+    resp.mimetype = "application/json"
+    return resp
+
+
+# Rows encoded per chunk written to the client: large enough to keep the
+# number of socket writes low, small enough to bound memory
+STREAM_CHUNK_ROWS = 500
+
+
+def stream_json_list(key, rows, code=200):
+    """
+    Make a response streaming ``{key: [rows...]}``.
+
+    Rows are pulled from the iterable and encoded by chunks of
+    STREAM_CHUNK_ROWS, so only one chunk is resident at a time.
+
+    Args:
+        key (str): Name of the list member of the JSON object
+        rows: Iterable of JSON-serializable rows
+        code (int): HTTP status code
+
+    Returns:
+        Response: Streamed application/json response
+    """
+
+    def generate():
+        rows_iter = iter(rows)
+        separator = b""
+        yield b"{" + orjson.dumps(key) + b":["
+        while chunk := list(islice(rows_iter, STREAM_CHUNK_ROWS)):
+            yield separator + b",".join(
+                orjson.dumps(row, default=_default, option=_OPTIONS)
+                for row in chunk
+            )
+            separator = b","
+        yield b"]}\n"
+
+    return current_app.response_class(
+        stream_with_context(generate()),
+        status=code,
+        mimetype="application/json",
+    )
@@ -0,0 +1,66 @@
+"""
+app.utils.singleflight
+----------------------
+
+Deduplication of concurrent computations within a worker process.
+
+When several threads need the same keys at the same time (e.g. parallel
+access-check batches asking the same questions), only the first one
+computes each key; the others wait for its result instead of repeating the
+work.
+"""
+
+import threading
+from concurrent.futures import Future
+
+
+class Singleflight:
+    """
+    Thread-safe registry of in-flight computations keyed by hashable keys.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def run_many(self, keys, compute):
+        """
+        Return a {key: value} dict for keys, sharing in-flight computations.
+
+        Keys already being computed by another thread are awaited; the
+        remaining keys are passed to ``compute``, which must return a
+        {key: value} dict covering all of them. Exceptions raised by
+        ``compute`` are propagated to every waiting thread.
+        """
+        owned, waiting = {}, {}
+        with self._lock:
+            for key in keys:
+                future = self._calls.get(key)
+                if future is None:
+                    owned[key] = self._calls[key] = Future()
+                else:
+                    waiting[key] = future
+
+        results = {}
+        if owned:
+            try:
+                results = compute(list(owned))
+            except BaseException as exc:
+                for future in owned.values():
+                    future.set_exception(exc)
+                raise
+            else:
+                for key, future in owned.items():
+                    future.set_result(results.get(key))
+            finally:
+                with self._lock:
+                    for key in owned:
+                        del self._calls[key]
+
+        for key, future in waiting.items():
+            results[key] = future.result()
+        return results
+
+    def __len__(self):
+        with self._lock:
+            return len(self._calls)
@@ -19,7 +19,10 @@ fi
 case "$APP_MODE" in
     "production")
         echo "Starting application with Gunicorn..."
-        exec gunicorn --bind 0.0.0.0:5000 --workers 4 --timeout 60 wsgi:app
+        # Threaded workers overlap requests waiting on the database
+        exec gunicorn --bind 0.0.0.0:5000 --workers 4 \
+            --worker-class gthread --threads "${GUNICORN_THREADS:-8}" \
+            --timeout 60 wsgi:app
         ;;
     "staging"|"development")
         echo "Starting application with Python development server..."
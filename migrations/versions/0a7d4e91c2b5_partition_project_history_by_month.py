@@ -0,0 +1,194 @@
+"""Partition project_history by month
+
+Revision ID: 0a7d4e91c2b5
+Revises: f3c58a2d9b16
+Create Date: 2026-10-15 19:04:12.553870
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0a7d4e91c2b5"
+down_revision = "f3c58a2d9b16"
+branch_labels = None
+depends_on = None
+
+# Monthly partitions created after the current month; afterwards
+# `flask project-history partitions` keeps them ahead (run it nightly)
+MONTHS_AHEAD = 3
+
+CREATE_PARTITIONED_TABLE = """
+    CREATE TABLE project_history (
+        id uuid NOT NULL,
+        project_id uuid NOT NULL
+            REFERENCES projects (id) ON DELETE CASCADE,
+        company_id uuid NOT NULL,
+        changed_by uuid NOT NULL,
+        changed_at timestamp without time zone NOT NULL
+            DEFAULT TIMEZONE('utc', CURRENT_TIMESTAMP),
+        action varchar(20) NOT NULL,
+        field_name varchar(50),
+        old_value text,
+        new_value text,
+        comment varchar(500),
+        -- The partition key must be part of the primary key
+        CONSTRAINT project_history_pkey PRIMARY KEY (id, changed_at),
+        CONSTRAINT check_history_action CHECK (
+            action IN ('created', 'updated', 'status_changed', 'deleted',
+                       'restored', 'member_added', 'member_removed',
+                       'role_assigned')
+        )
+    ) PARTITION BY RANGE (changed_at)
+"""
+
+# Creates the monthly partitions covering [p_from, p_to). Rows of those
+# months already stored in the default partition are moved into the new
+# partition before it is attached.
+CREATE_PARTITIONS_FUNCTION = """
+    CREATE FUNCTION project_history_create_partitions(p_from date, p_to date)
+    RETURNS integer
+    LANGUAGE plpgsql
+    AS $$
+    DECLARE
+        month_start date := date_trunc('month', p_from)::date;
+        month_end date;
+        partition_name text;
+        created integer := 0;
+    BEGIN
+        WHILE month_start < p_to LOOP
+            month_end := (month_start + interval '1 month')::date;
+            partition_name := 'project_history_'
+                || to_char(month_start, 'YYYY_MM');
+            IF to_regclass(partition_name) IS NULL THEN
+                EXECUTE format(
+                    'CREATE TABLE %I (LIKE project_history '
+                    'INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+                    partition_name
+                );
+                EXECUTE format(
+                    'WITH moved AS (DELETE FROM project_history_default '
+                    'WHERE changed_at >= %L AND changed_at < %L '
+                    'RETURNING *) INSERT INTO %I SELECT * FROM moved',
+                    month_start, month_end, partition_name
+                );
+                EXECUTE format(
+                    'ALTER TABLE project_history ATTACH PARTITION %I '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    partition_name, month_start, month_end
+                );
+                created := created + 1;
+            END IF;
+            month_start := month_end;
+        END LOOP;
+        RETURN created;
+    END
+    $$
+"""
+
+# Detaches and drops the monthly partitions ending on or before p_before:
+# retention is enforced without row-level DELETEs.
+DROP_PARTITIONS_FUNCTION = """
+    CREATE FUNCTION project_history_drop_partitions(p_before date)
+    RETURNS integer
+    LANGUAGE plpgsql
+    AS $$
+    DECLARE
+        partition_name text;
+        dropped integer := 0;
+    BEGIN
+        FOR partition_name IN
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            WHERE parent.relname = 'project_history'
+              AND child.relname ~ '^project_history_[0-9]{4}_[0-9]{2}$'
+        LOOP
+            IF to_date(substr(partition_name, 17), 'YYYY_MM')
+                    + interval '1 month' <= p_before THEN
+                EXECUTE format(
+                    'ALTER TABLE project_history DETACH PARTITION %I',
+                    partition_name
+                );
+                EXECUTE format('DROP TABLE %I', partition_name);
+                dropped := dropped + 1;
+            END IF;
+        END LOOP;
+        RETURN dropped;
+    END
+    $$
+"""
+
+
+def upgrade():
+    op.execute("ALTER TABLE project_history RENAME TO project_history_flat")
+    op.execute(
+        "ALTER TABLE project_history_flat "
+        "RENAME CONSTRAINT project_history_pkey TO project_history_flat_pkey"
+    )
+    op.execute("DROP INDEX idx_history_project_changed_desc")
+
+    op.execute(CREATE_PARTITIONED_TABLE)
+    op.execute(
+        "CREATE TABLE project_history_default "
+        "PARTITION OF project_history DEFAULT"
+    )
+    op.execute(
+        "CREATE INDEX idx_history_project_changed_desc "
+        "ON project_history (project_id, changed_at DESC)"
+    )
+    op.execute(CREATE_PARTITIONS_FUNCTION)
+    op.execute(DROP_PARTITIONS_FUNCTION)
+
+    # Existing rows land in the default partition, then move into their
+    # monthly partitions as these are created.
+    op.execute(
+        "INSERT INTO project_history SELECT * FROM project_history_flat"
+    )
+    op.execute(
+        "SELECT project_history_create_partitions("
+        "COALESCE((SELECT min(changed_at) FROM project_history_flat), "
+        "now())::date, "
+        f"(date_trunc('month', now()) + interval '{MONTHS_AHEAD + 1} months')"
+        "::date)"
+    )
+    op.execute("DROP TABLE project_history_flat")
+
+
+def downgrade():
+    op.execute("ALTER TABLE project_history RENAME TO project_history_parted")
+    op.execute(
+        "ALTER TABLE project_history_parted "
+        "RENAME CONSTRAINT project_history_pkey "
+        "TO project_history_parted_pkey"
+    )
+    op.execute("DROP INDEX idx_history_project_changed_desc")
+    op.execute(
+        """
+        CREATE TABLE project_history (
+            LIKE project_history_parted
+            INCLUDING DEFAULTS INCLUDING CONSTRAINTS
+        )
+        """
+    )
+    op.execute(
+        "ALTER TABLE project_history "
+        "ADD CONSTRAINT project_history_pkey PRIMARY KEY (id)"
+    )
+    op.execute(
+        "ALTER TABLE project_history ADD CONSTRAINT "
+        "project_history_project_id_fkey FOREIGN KEY (project_id) "
+        "REFERENCES projects (id) ON DELETE CASCADE"
+    )
+    op.execute(
+        "INSERT INTO project_history SELECT * FROM project_history_parted"
+    )
+    op.execute(
+        "CREATE INDEX idx_history_project_changed_desc "
+        "ON project_history (project_id, changed_at DESC)"
+    )
+    op.execute("DROP TABLE project_history_parted CASCADE")
+    op.execute("DROP FUNCTION project_history_drop_partitions(date)")
+    op.execute("DROP FUNCTION project_history_create_partitions(date, date)")
@@ -0,0 +1,42 @@
+"""Cover role_id in the active project member index
+
+Revision ID: 1c6e8b3f5a27
+Revises: 0a7d4e91c2b5
+Create Date: 2026-10-16 00:41:37.904215
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "1c6e8b3f5a27"
+down_revision = "0a7d4e91c2b5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # INCLUDE (role_id) lets the access checks resolve a membership and
+    # its role with an index-only scan (PostgreSQL)
+    with op.batch_alter_table("project_members", schema=None) as batch_op:
+        batch_op.drop_index("idx_project_members_user_active")
+        batch_op.create_index(
+            "idx_project_members_user_active",
+            ["user_id", "project_id"],
+            unique=False,
+            postgresql_where=sa.text("removed_at IS NULL"),
+            postgresql_include=["role_id"],
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("project_members", schema=None) as batch_op:
+        batch_op.drop_index("idx_project_members_user_active")
+        batch_op.create_index(
+            "idx_project_members_user_active",
+            ["user_id", "project_id"],
+            unique=False,
+            postgresql_where=sa.text("removed_at IS NULL"),
+        )
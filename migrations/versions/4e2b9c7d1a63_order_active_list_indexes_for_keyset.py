@@ -0,0 +1,49 @@
+"""Order the active milestone/deliverable indexes for keyset pagination
+
+Revision ID: 4e2b9c7d1a63
+Revises: 1c6e8b3f5a27
+Create Date: 2026-10-16 09:12:45.318240
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "4e2b9c7d1a63"
+down_revision = "1c6e8b3f5a27"
+branch_labels = None
+depends_on = None
+
+TABLES = ("milestones", "deliverables")
+
+
+def upgrade():
+    # (project_id, created_at DESC, id DESC) serves both the full listing
+    # and the pages of ?cursor= without a sort
+    for table in TABLES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_index(f"idx_{table}_project_active")
+            batch_op.create_index(
+                f"idx_{table}_project_active",
+                [
+                    "project_id",
+                    sa.text("created_at DESC"),
+                    sa.text("id DESC"),
+                ],
+                unique=False,
+                postgresql_where=sa.text("removed_at IS NULL"),
+            )
+
+
+def downgrade():
+    for table in TABLES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_index(f"idx_{table}_project_active")
+            batch_op.create_index(
+                f"idx_{table}_project_active",
+                ["project_id"],
+                unique=False,
+                postgresql_where=sa.text("removed_at IS NULL"),
+            )
@@ -0,0 +1,32 @@
+"""Add a partial index for listing the active members of a project
+
+Revision ID: 8d3f6a1c2e95
+Revises: 4e2b9c7d1a63
+Create Date: 2026-10-16 10:02:37.514820
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "8d3f6a1c2e95"
+down_revision = "4e2b9c7d1a63"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("project_members", schema=None) as batch_op:
+        batch_op.create_index(
+            "idx_project_members_project_active",
+            ["project_id", "company_id"],
+            unique=False,
+            postgresql_where=sa.text("removed_at IS NULL"),
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("project_members", schema=None) as batch_op:
+        batch_op.drop_index("idx_project_members_project_active")
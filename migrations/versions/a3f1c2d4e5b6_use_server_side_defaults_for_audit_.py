@@ -0,0 +1,273 @@
+"""Use server-side defaults for audit timestamps
+
+Revision ID: a3f1c2d4e5b6
+Revises: 809aaed134f3
+Create Date: 2026-10-15 09:12:41.503128
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "a3f1c2d4e5b6"
+down_revision = "809aaed134f3"
+branch_labels = None
+depends_on = None
+
+# Naive UTC, as written by the application: now() alone would store the
+# session's local time into these timestamp without time zone columns
+UTC_NOW = sa.text("TIMEZONE('utc', CURRENT_TIMESTAMP)")
+
+
+def upgrade():
+    with op.batch_alter_table("projects", schema=None) as batch_op:
+        batch_op.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=UTC_NOW,
+        )
+        batch_op.alter_column(
+            "updated_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=UTC_NOW,
+        )
+
+    with op.batch_alter_table("milestones", schema=None) as batch_op:
+        batch_op.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=UTC_NOW,
+        )
+        batch_op.alter_column(
+            "updated_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=UTC_NOW,
+        )
+
+    with op.batch_alter_table("deliverables", schema=None) as batch_op:
+        batch_op.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=UTC_NOW,
+        )
+        batch_op.alter_column(
+            "updated_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=UTC_NOW,
+        )
+
+    with op.batch_alter_table("project_members", schema=None) as batch_op:
+        batch_op.alter_column(
+            "added_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=UTC_NOW,
+        )
+
+    with op.batch_alter_table("project_roles", schema=None) as batch_op:
+        batch_op.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=UTC_NOW,
+        )
+        batch_op.alter_column(
+            "updated_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=UTC_NOW,
+        )
+
+    with op.batch_alter_table("project_policies", schema=None) as batch_op:
+        batch_op.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=UTC_NOW,
+        )
+        batch_op.alter_column(
+            "updated_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=UTC_NOW,
+        )
+
+    with op.batch_alter_table("project_permissions", schema=None) as batch_op:
+        batch_op.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=UTC_NOW,
+        )
+
+    with op.batch_alter_table("project_history", schema=None) as batch_op:
+        batch_op.alter_column(
+            "changed_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=UTC_NOW,
+        )
+
+    with op.batch_alter_table(
+        "milestone_deliverable_association", schema=None
+    ) as batch_op:
+        batch_op.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=UTC_NOW,
+        )
+
+    with op.batch_alter_table(
+        "role_policy_association", schema=None
+    ) as batch_op:
+        batch_op.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=UTC_NOW,
+        )
+
+    with op.batch_alter_table(
+        "policy_permission_association", schema=None
+    ) as batch_op:
+        batch_op.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=UTC_NOW,
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("projects", schema=None) as batch_op:
+        batch_op.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=None,
+        )
+        batch_op.alter_column(
+            "updated_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=None,
+        )
+
+    with op.batch_alter_table("milestones", schema=None) as batch_op:
+        batch_op.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=None,
+        )
+        batch_op.alter_column(
+            "updated_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=None,
+        )
+
+    with op.batch_alter_table("deliverables", schema=None) as batch_op:
+        batch_op.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=None,
+        )
+        batch_op.alter_column(
+            "updated_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=None,
+        )
+
+    with op.batch_alter_table("project_members", schema=None) as batch_op:
+        batch_op.alter_column(
+            "added_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=None,
+        )
+
+    with op.batch_alter_table("project_roles", schema=None) as batch_op:
+        batch_op.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=None,
+        )
+        batch_op.alter_column(
+            "updated_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=None,
+        )
+
+    with op.batch_alter_table("project_policies", schema=None) as batch_op:
+        batch_op.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=None,
+        )
+        batch_op.alter_column(
+            "updated_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=None,
+        )
+
+    with op.batch_alter_table("project_permissions", schema=None) as batch_op:
+        batch_op.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=None,
+        )
+
+    with op.batch_alter_table("project_history", schema=None) as batch_op:
+        batch_op.alter_column(
+            "changed_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=None,
+        )
+
+    with op.batch_alter_table(
+        "milestone_deliverable_association", schema=None
+    ) as batch_op:
+        batch_op.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=None,
+        )
+
+    with op.batch_alter_table(
+        "role_policy_association", schema=None
+    ) as batch_op:
+        batch_op.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=None,
+        )
+
+    with op.batch_alter_table(
+        "policy_permission_association", schema=None
+    ) as batch_op:
+        batch_op.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=None,
+        )
@@ -0,0 +1,39 @@
+"""Add role_permissions_mv materialized view
+
+Revision ID: a61e4b8c2d70
+Revises: f08c3d1e6b47
+Create Date: 2026-10-15 13:41:12.518204
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "a61e4b8c2d70"
+down_revision = "f08c3d1e6b47"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW role_permissions_mv AS
+        SELECT DISTINCT rpa.role_id AS role_id, perm.name AS permission_name
+        FROM role_policy_association rpa
+        JOIN project_policies pol ON pol.id = rpa.policy_id
+        JOIN policy_permission_association ppa ON ppa.policy_id = pol.id
+        JOIN project_permissions perm ON perm.id = ppa.permission_id
+        WHERE pol.removed_at IS NULL AND perm.removed_at IS NULL
+        """
+    )
+    # Unique index required by REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute(
+        "CREATE UNIQUE INDEX idx_role_permissions_mv_role_permission "
+        "ON role_permissions_mv (role_id, permission_name)"
+    )
+
+
+def downgrade():
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS role_permissions_mv")
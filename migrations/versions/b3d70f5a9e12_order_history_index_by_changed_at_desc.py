@@ -0,0 +1,37 @@
+"""Order project_history index by changed_at DESC
+
+Revision ID: b3d70f5a9e12
+Revises: a61e4b8c2d70
+Create Date: 2026-10-15 14:02:37.904115
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "b3d70f5a9e12"
+down_revision = "a61e4b8c2d70"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("project_history", schema=None) as batch_op:
+        batch_op.drop_index("idx_project_history_project_date")
+        batch_op.create_index(
+            "idx_history_project_changed_desc",
+            ["project_id", sa.text("changed_at DESC")],
+            unique=False,
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("project_history", schema=None) as batch_op:
+        batch_op.drop_index("idx_history_project_changed_desc")
+        batch_op.create_index(
+            "idx_project_history_project_date",
+            ["project_id", "changed_at"],
+            unique=False,
+        )
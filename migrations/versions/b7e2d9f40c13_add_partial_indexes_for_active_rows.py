@@ -0,0 +1,78 @@
+"""Add partial indexes for active (non soft-deleted) rows
+
+Revision ID: b7e2d9f40c13
+Revises: a3f1c2d4e5b6
+Create Date: 2026-10-15 10:04:18.270931
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "b7e2d9f40c13"
+down_revision = "a3f1c2d4e5b6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("projects", schema=None) as batch_op:
+        batch_op.drop_index("idx_projects_company_removed")
+        batch_op.create_index(
+            "idx_projects_company_active",
+            ["company_id"],
+            unique=False,
+            postgresql_where=sa.text("removed_at IS NULL"),
+        )
+        batch_op.create_index(
+            "idx_projects_company_status_active",
+            ["company_id", "status"],
+            unique=False,
+            postgresql_where=sa.text("removed_at IS NULL"),
+        )
+
+    with op.batch_alter_table("milestones", schema=None) as batch_op:
+        batch_op.create_index(
+            "idx_milestones_project_active",
+            ["project_id"],
+            unique=False,
+            postgresql_where=sa.text("removed_at IS NULL"),
+        )
+
+    with op.batch_alter_table("deliverables", schema=None) as batch_op:
+        batch_op.create_index(
+            "idx_deliverables_project_active",
+            ["project_id"],
+            unique=False,
+            postgresql_where=sa.text("removed_at IS NULL"),
+        )
+
+    with op.batch_alter_table("project_members", schema=None) as batch_op:
+        batch_op.create_index(
+            "idx_project_members_user_active",
+            ["user_id", "project_id"],
+            unique=False,
+            postgresql_where=sa.text("removed_at IS NULL"),
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("project_members", schema=None) as batch_op:
+        batch_op.drop_index("idx_project_members_user_active")
+
+    with op.batch_alter_table("deliverables", schema=None) as batch_op:
+        batch_op.drop_index("idx_deliverables_project_active")
+
+    with op.batch_alter_table("milestones", schema=None) as batch_op:
+        batch_op.drop_index("idx_milestones_project_active")
+
+    with op.batch_alter_table("projects", schema=None) as batch_op:
+        batch_op.drop_index("idx_projects_company_status_active")
+        batch_op.drop_index("idx_projects_company_active")
+        batch_op.create_index(
+            "idx_projects_company_removed",
+            ["company_id", "removed_at"],
+            unique=False,
+        )
@@ -0,0 +1,103 @@
+"""Use native ENUM types for status and type columns
+
+Revision ID: c41d8e2a7f95
+Revises: b7e2d9f40c13
+Create Date: 2026-10-15 10:41:52.918374
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "c41d8e2a7f95"
+down_revision = "b7e2d9f40c13"
+branch_labels = None
+depends_on = None
+
+PROJECT_STATUSES = (
+    "created",
+    "initialized",
+    "consultation",
+    "lost",
+    "active",
+    "suspended",
+    "completed",
+    "archived",
+)
+WORK_ITEM_STATUSES = (
+    "planned",
+    "in_progress",
+    "completed",
+    "delayed",
+    "cancelled",
+)
+DELIVERABLE_TYPES = ("document", "software", "hardware", "service", "other")
+
+# (table, column, enum name, values, check constraint name)
+ENUM_COLUMNS = (
+    (
+        "projects",
+        "status",
+        "project_status",
+        PROJECT_STATUSES,
+        "check_project_status",
+    ),
+    (
+        "milestones",
+        "status",
+        "milestone_status",
+        WORK_ITEM_STATUSES,
+        "check_milestone_status",
+    ),
+    (
+        "deliverables",
+        "status",
+        "deliverable_status",
+        WORK_ITEM_STATUSES,
+        "check_deliverable_status",
+    ),
+    (
+        "deliverables",
+        "type",
+        "deliverable_type",
+        DELIVERABLE_TYPES,
+        "check_deliverable_type",
+    ),
+)
+
+
+def upgrade():
+    bind = op.get_bind()
+    for table, column, enum_name, values, check_name in ENUM_COLUMNS:
+        enum_type = postgresql.ENUM(*values, name=enum_name)
+        enum_type.create(bind, checkfirst=True)
+        op.drop_constraint(check_name, table, type_="check")
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.String(length=20),
+            type_=enum_type,
+            existing_nullable=False,
+            postgresql_using=f"{column}::{enum_name}",
+        )
+
+
+def downgrade():
+    bind = op.get_bind()
+    for table, column, enum_name, values, check_name in ENUM_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=postgresql.ENUM(*values, name=enum_name),
+            type_=sa.String(length=20),
+            existing_nullable=False,
+            postgresql_using=f"{column}::text",
+        )
+        quoted = ", ".join(f"'{value}'" for value in values)
+        op.create_check_constraint(
+            check_name, table, f"{column} IN ({quoted})"
+        )
+        postgresql.ENUM(name=enum_name).drop(bind, checkfirst=True)
@@ -0,0 +1,63 @@
+"""Add partial indexes for permission checks
+
+Revision ID: c9f2a4e7d318
+Revises: b3d70f5a9e12
+Create Date: 2026-10-15 16:27:45.130962
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "c9f2a4e7d318"
+down_revision = "b3d70f5a9e12"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_project_permissions_active_lookup",
+            "project_permissions",
+            ["project_id", "name"],
+            unique=False,
+            postgresql_where=sa.text("removed_at IS NULL"),
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "idx_project_permissions_project_name",
+            table_name="project_permissions",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "idx_policy_permission_permission_policy",
+            "policy_permission_association",
+            ["permission_id", "policy_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_policy_permission_permission_policy",
+            table_name="policy_permission_association",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "idx_project_permissions_project_name",
+            "project_permissions",
+            ["project_id", "name"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "idx_project_permissions_active_lookup",
+            table_name="project_permissions",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,54 @@
+"""Add rebac_check_batch function
+
+Revision ID: d4a81c6f0b59
+Revises: c9f2a4e7d318
+Create Date: 2026-10-15 17:12:08.604417
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d4a81c6f0b59"
+down_revision = "c9f2a4e7d318"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Evaluates (project_id, action) pairs for one user in a single call.
+    # project_ids and actions are parallel arrays.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION rebac_check_batch(
+            p_user_id uuid,
+            p_company_id uuid,
+            p_project_ids uuid[],
+            p_actions text[]
+        )
+        RETURNS TABLE (project_id uuid, action text, allowed boolean)
+        LANGUAGE sql
+        STABLE
+        AS $$
+            SELECT c.project_id, c.action, EXISTS (
+                SELECT 1
+                FROM projects p
+                JOIN project_members m ON m.project_id = p.id
+                JOIN project_roles r ON r.id = m.role_id
+                JOIN role_permissions_mv rp ON rp.role_id = r.id
+                WHERE p.id = c.project_id
+                  AND p.company_id = p_company_id
+                  AND p.removed_at IS NULL
+                  AND m.user_id = p_user_id
+                  AND m.removed_at IS NULL
+                  AND r.removed_at IS NULL
+                  AND rp.permission_name = c.action
+            )
+            FROM unnest(p_project_ids, p_actions) AS c(project_id, action)
+        $$
+        """)
+
+
+def downgrade():
+    op.execute(
+        "DROP FUNCTION IF EXISTS rebac_check_batch(uuid, uuid, uuid[], text[])"
+    )
@@ -0,0 +1,42 @@
+"""Use CHAR(3) for budget_currency
+
+Revision ID: d92b5c6e1a08
+Revises: c41d8e2a7f95
+Create Date: 2026-10-15 11:06:27.114590
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "d92b5c6e1a08"
+down_revision = "c41d8e2a7f95"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("projects", schema=None) as batch_op:
+        batch_op.drop_constraint("check_currency_code", type_="check")
+        batch_op.alter_column(
+            "budget_currency",
+            existing_type=sa.String(length=3),
+            type_=sa.CHAR(length=3),
+            existing_nullable=True,
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("projects", schema=None) as batch_op:
+        batch_op.alter_column(
+            "budget_currency",
+            existing_type=sa.CHAR(length=3),
+            type_=sa.String(length=3),
+            existing_nullable=True,
+        )
+        batch_op.create_check_constraint(
+            "check_currency_code",
+            "budget_currency IS NULL OR length(budget_currency) = 3",
+        )
@@ -0,0 +1,76 @@
+"""Drop created_at from association tables
+
+Revision ID: e5a07f3b9d21
+Revises: d92b5c6e1a08
+Create Date: 2026-10-15 11:32:09.640215
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "e5a07f3b9d21"
+down_revision = "d92b5c6e1a08"
+branch_labels = None
+depends_on = None
+
+# Naive UTC, as written by the application: now() alone would store the
+# session's local time into these timestamp without time zone columns
+UTC_NOW = sa.text("TIMEZONE('utc', CURRENT_TIMESTAMP)")
+
+
+def upgrade():
+    with op.batch_alter_table(
+        "milestone_deliverable_association", schema=None
+    ) as batch_op:
+        batch_op.drop_column("created_at")
+
+    with op.batch_alter_table(
+        "role_policy_association", schema=None
+    ) as batch_op:
+        batch_op.drop_column("created_at")
+
+    with op.batch_alter_table(
+        "policy_permission_association", schema=None
+    ) as batch_op:
+        batch_op.drop_column("created_at")
+
+
+def downgrade():
+    with op.batch_alter_table(
+        "milestone_deliverable_association", schema=None
+    ) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "created_at",
+                sa.DateTime(),
+                server_default=UTC_NOW,
+                nullable=False,
+            )
+        )
+
+    with op.batch_alter_table(
+        "role_policy_association", schema=None
+    ) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "created_at",
+                sa.DateTime(),
+                server_default=UTC_NOW,
+                nullable=False,
+            )
+        )
+
+    with op.batch_alter_table(
+        "policy_permission_association", schema=None
+    ) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "created_at",
+                sa.DateTime(),
+                server_default=UTC_NOW,
+                nullable=False,
+            )
+        )
@@ -0,0 +1,154 @@
+"""Add project_permissions.kind SMALLINT code
+
+Revision ID: e7b29c4f1a83
+Revises: d4a81c6f0b59
+Create Date: 2026-10-15 17:48:31.207915
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "e7b29c4f1a83"
+down_revision = "d4a81c6f0b59"
+branch_labels = None
+depends_on = None
+
+# Must match app.models.project.PERMISSION_KINDS
+PERMISSION_KINDS = {
+    "read_files": 1,
+    "write_files": 2,
+    "delete_files": 3,
+    "lock_files": 4,
+    "validate_files": 5,
+    "update_project": 6,
+    "delete_project": 7,
+    "manage_members": 8,
+    "manage_roles": 9,
+    "manage_policies": 10,
+}
+
+# Names outside PERMISSION_KINDS are left without a kind by the backfill:
+# abort with the offending names rather than on the NOT NULL constraint
+CHECK_UNKNOWN_PERMISSIONS = """
+    DO $$
+    DECLARE
+        unknown text;
+    BEGIN
+        SELECT string_agg(DISTINCT name, ', ') INTO unknown
+        FROM project_permissions
+        WHERE kind IS NULL;
+        IF unknown IS NOT NULL THEN
+            RAISE EXCEPTION 'project_permissions has unknown names: %', unknown
+                USING HINT = 'Delete or rename these rows, then rerun.';
+        END IF;
+    END
+    $$
+"""
+
+ROLE_PERMISSIONS_MV = """
+    CREATE MATERIALIZED VIEW role_permissions_mv AS
+    SELECT DISTINCT rpa.role_id AS role_id, perm.{column} AS {alias}
+    FROM role_policy_association rpa
+    JOIN project_policies pol ON pol.id = rpa.policy_id
+    JOIN policy_permission_association ppa ON ppa.policy_id = pol.id
+    JOIN project_permissions perm ON perm.id = ppa.permission_id
+    WHERE pol.removed_at IS NULL AND perm.removed_at IS NULL
+"""
+
+REBAC_CHECK_BATCH = """
+    CREATE FUNCTION rebac_check_batch(
+        p_user_id uuid,
+        p_company_id uuid,
+        p_project_ids uuid[],
+        p_{alias}s {sql_type}[]
+    )
+    RETURNS TABLE (project_id uuid, {alias} {sql_type}, allowed boolean)
+    LANGUAGE sql
+    STABLE
+    AS $$
+        SELECT c.project_id, c.{alias}, EXISTS (
+            SELECT 1
+            FROM projects p
+            JOIN project_members m ON m.project_id = p.id
+            JOIN project_roles r ON r.id = m.role_id
+            JOIN role_permissions_mv rp ON rp.role_id = r.id
+            WHERE p.id = c.project_id
+              AND p.company_id = p_company_id
+              AND p.removed_at IS NULL
+              AND m.user_id = p_user_id
+              AND m.removed_at IS NULL
+              AND r.removed_at IS NULL
+              AND rp.{column} = c.{alias}
+        )
+        FROM unnest(p_project_ids, p_{alias}s) AS c(project_id, {alias})
+    $$
+"""
+
+
+def _recreate_rbac_objects(mv_column, mv_alias, function_alias, sql_type):
+    """Rebuild the role permissions view and the batch check function."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS role_permissions_mv")
+    op.execute(ROLE_PERMISSIONS_MV.format(column=mv_column, alias=mv_alias))
+    op.execute(
+        "CREATE UNIQUE INDEX idx_role_permissions_mv_role_permission "
+        f"ON role_permissions_mv (role_id, {mv_alias})"
+    )
+    op.execute(
+        REBAC_CHECK_BATCH.format(
+            column=mv_alias, alias=function_alias, sql_type=sql_type
+        )
+    )
+
+
+def upgrade():
+    op.execute(
+        "DROP FUNCTION IF EXISTS rebac_check_batch(uuid, uuid, uuid[], text[])"
+    )
+
+    op.add_column("project_permissions", sa.Column("kind", sa.SmallInteger()))
+    cases = " ".join(
+        f"WHEN '{name}' THEN {kind}" for name, kind in PERMISSION_KINDS.items()
+    )
+    op.execute(f"UPDATE project_permissions SET kind = CASE name {cases} END")
+    op.execute(CHECK_UNKNOWN_PERMISSIONS)
+    op.alter_column("project_permissions", "kind", nullable=False)
+    op.create_check_constraint(
+        "check_permission_kind", "project_permissions", "kind BETWEEN 1 AND 10"
+    )
+    op.drop_index(
+        "idx_project_permissions_active_lookup",
+        table_name="project_permissions",
+    )
+    op.create_index(
+        "idx_project_permissions_active_lookup",
+        "project_permissions",
+        ["project_id", "kind"],
+        postgresql_where=sa.text("removed_at IS NULL"),
+    )
+
+    _recreate_rbac_objects("kind", "permission_kind", "kind", "smallint")
+
+
+def downgrade():
+    op.execute(
+        "DROP FUNCTION IF EXISTS "
+        "rebac_check_batch(uuid, uuid, uuid[], smallint[])"
+    )
+    _recreate_rbac_objects("name", "permission_name", "action", "text")
+
+    op.drop_index(
+        "idx_project_permissions_active_lookup",
+        table_name="project_permissions",
+    )
+    op.create_index(
+        "idx_project_permissions_active_lookup",
+        "project_permissions",
+        ["project_id", "name"],
+        postgresql_where=sa.text("removed_at IS NULL"),
+    )
+    op.drop_constraint(
+        "check_permission_kind", "project_permissions", type_="check"
+    )
+    op.drop_column("project_permissions", "kind")
@@ -0,0 +1,41 @@
+"""Add surrogate BIGINT key to project_members
+
+Revision ID: f08c3d1e6b47
+Revises: e5a07f3b9d21
+Create Date: 2026-10-15 12:03:55.381602
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "f08c3d1e6b47"
+down_revision = "e5a07f3b9d21"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.drop_constraint(
+        "project_members_pkey", "project_members", type_="primary"
+    )
+    # BIGSERIAL back-fills existing rows with sequence values
+    op.execute("ALTER TABLE project_members ADD COLUMN id BIGSERIAL")
+    op.create_primary_key("project_members_pkey", "project_members", ["id"])
+    op.create_unique_constraint(
+        "uq_project_member", "project_members", ["project_id", "user_id"]
+    )
+
+
+def downgrade():
+    op.drop_constraint(
+        "uq_project_member", "project_members", type_="unique"
+    )
+    op.drop_constraint(
+        "project_members_pkey", "project_members", type_="primary"
+    )
+    op.drop_column("project_members", "id")
+    op.create_primary_key(
+        "project_members_pkey", "project_members", ["project_id", "user_id"]
+    )
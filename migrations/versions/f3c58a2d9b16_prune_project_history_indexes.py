@@ -0,0 +1,39 @@
+"""Prune project_history indexes
+
+Revision ID: f3c58a2d9b16
+Revises: e7b29c4f1a83
+Create Date: 2026-10-15 18:36:54.118302
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f3c58a2d9b16"
+down_revision = "e7b29c4f1a83"
+branch_labels = None
+depends_on = None
+
+# Indexes no query uses: project_id is the prefix of
+# idx_history_project_changed_desc, history is never looked up by company,
+# action or date alone, and idx_project_history_company duplicated
+# ix_project_history_company_id.
+UNUSED_INDEXES = (
+    ("ix_project_history_project_id", ["project_id"]),
+    ("ix_project_history_company_id", ["company_id"]),
+    ("ix_project_history_changed_at", ["changed_at"]),
+    ("idx_project_history_company", ["company_id"]),
+    ("idx_project_history_action", ["action"]),
+)
+
+
+def upgrade():
+    with op.batch_alter_table("project_history", schema=None) as batch_op:
+        for name, _columns in UNUSED_INDEXES:
+            batch_op.drop_index(name)
+
+
+def downgrade():
+    with op.batch_alter_table("project_history", schema=None) as batch_op:
+        for name, columns in UNUSED_INDEXES:
+            batch_op.create_index(name, columns, unique=False)
@@ -13,6 +13,8 @@ Tests cover:
 - Authorization (401 on missing JWT)
 """
 
+import dataclasses
+import time
 import pytest
 import uuid
 from tests.conftest import create_jwt_token
@@ -214,6 +216,78 @@ class TestCheckFileAccessResource:
         assert data["results"][1]["allowed"] is True  # write_files
         assert data["results"][2]["allowed"] is False  # delete_files
 
+    def test_check_file_access_batch_mixed_ids(
+        self, auth_client, project_with_permissions
+    ):
+        """Test batch results map back for repeated and malformed IDs"""
+        project_id = project_with_permissions["project"]["id"]
+
+        response = auth_client.post(
+            "/check-file-access",
+            json={
+                "file_checks": [
+                    {
+                        "file_id": str(uuid.uuid4()),
+                        "project_id": project_id.upper(),
+                        "action": "read_files",
+                    },
+                    {
+                        "file_id": str(uuid.uuid4()),
+                        "project_id": "not-a-uuid",
+                        "action": "read_files",
+                    },
+                    {
+                        "file_id": str(uuid.uuid4()),
+                        "project_id": project_id,
+                        "action": "read_files",
+                    },
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        results = response.get_json()["results"]
+        assert [r["allowed"] for r in results] == [True, False, True]
+
+    def test_check_file_access_batch_deduplicates_pairs(
+        self, auth_client, project_with_permissions, monkeypatch
+    ):
+        """Test repeated (project, action) pairs are evaluated only once"""
+        from app.resources import access_control
+
+        evaluated = []
+        query_allowed_pairs = access_control._query_allowed_pairs
+
+        def recording_query(user_id, company_id, pairs):
+            evaluated.append(set(pairs))
+            return query_allowed_pairs(user_id, company_id, pairs)
+
+        monkeypatch.setattr(
+            access_control, "_query_allowed_pairs", recording_query
+        )
+        project_id = project_with_permissions["project"]["id"]
+        file_ids = [str(uuid.uuid4()) for _ in range(5)]
+
+        response = auth_client.post(
+            "/check-file-access",
+            json={
+                "file_checks": [
+                    {
+                        "file_id": file_id,
+                        "project_id": project_id,
+                        "action": "read_files",
+                    }
+                    for file_id in file_ids
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        results = response.get_json()["results"]
+        assert [r["file_id"] for r in results] == file_ids
+        assert all(r["allowed"] for r in results)
+        assert evaluated == [{(project_id, "read_files")}]
+
     def test_check_file_access_non_member(self, auth_client):
         """Test file access denied when user is not a project member"""
         # Create another client with different user
@@ -340,6 +414,127 @@ class TestCheckProjectAccessResource:
         assert result["action"] == "update_project"
         assert result["allowed"] is True
 
+    def test_check_project_access_revoked_permission(
+        self, auth_client, project_with_permissions
+    ):
+        """Test a cached decision is dropped when the permission is revoked"""
+        project = project_with_permissions["project"]
+        policy = project_with_permissions["policy"]
+        permission = project_with_permissions["permissions"]["update_project"]
+        payload = {
+            "project_checks": [
+                {"project_id": project["id"], "action": "update_project"}
+            ]
+        }
+
+        response = auth_client.post("/check-project-access", json=payload)
+        assert response.get_json()["results"][0]["allowed"] is True
+
+        response = auth_client.delete(
+            f"/projects/{project['id']}/policies/{policy['id']}"
+            f"/permissions/{permission['id']}"
+        )
+        assert response.status_code == 204
+
+        response = auth_client.post("/check-project-access", json=payload)
+        assert response.get_json()["results"][0]["allowed"] is False
+
+    def test_check_project_access_removed_member(
+        self, auth_client, project_with_permissions
+    ):
+        """Test a cached decision is dropped when the member is removed"""
+        project = project_with_permissions["project"]
+        payload = {
+            "project_checks": [
+                {"project_id": project["id"], "action": "update_project"}
+            ]
+        }
+
+        response = auth_client.post("/check-project-access", json=payload)
+        assert response.get_json()["results"][0]["allowed"] is True
+
+        response = auth_client.delete(
+            f"/projects/{project['id']}/members/{auth_client.user_id}"
+        )
+        assert response.status_code == 204
+
+        response = auth_client.post("/check-project-access", json=payload)
+        assert response.get_json()["results"][0]["allowed"] is False
+
+    def test_check_project_access_other_worker_staleness_window(
+        self, auth_client, project_with_permissions
+    ):
+        """Test a revocation committed elsewhere is served stale until TTL"""
+        from unittest import mock
+
+        from sqlalchemy import delete
+
+        from app.models.db import db
+        from app.models.project import (
+            PERMISSION_CACHE_TTL,
+            policy_permission_association,
+        )
+
+        project = project_with_permissions["project"]
+        permission = project_with_permissions["permissions"]["update_project"]
+        payload = {
+            "project_checks": [
+                {"project_id": project["id"], "action": "update_project"}
+            ]
+        }
+
+        response = auth_client.post("/check-project-access", json=payload)
+        assert response.get_json()["results"][0]["allowed"] is True
+
+        # Revoked by another worker: a bulk DELETE bypasses the flush
+        # events, so this process's caches are not cleared by the commit
+        db.session.execute(
+            delete(policy_permission_association).where(
+                policy_permission_association.c.permission_id
+                == permission["id"]
+            )
+        )
+        db.session.commit()
+
+        response = auth_client.post("/check-project-access", json=payload)
+        assert response.get_json()["results"][0]["allowed"] is True
+
+        expired = time.monotonic() + PERMISSION_CACHE_TTL + 1
+        with mock.patch(
+            "app.utils.cache.time.monotonic", return_value=expired
+        ):
+            response = auth_client.post("/check-project-access", json=payload)
+        assert response.get_json()["results"][0]["allowed"] is False
+
+    def test_check_project_access_concurrent_commit_not_cached(
+        self, auth_client, project_with_permissions, monkeypatch
+    ):
+        """Test a decision read before an access change commits is not cached"""
+        from app.models.project import permission_cache
+        from app.resources import access_control
+
+        query_allowed_pairs = access_control._query_allowed_pairs
+
+        def racing_query(user_id, company_id, pairs):
+            allowed = query_allowed_pairs(user_id, company_id, pairs)
+            # An access change commits while the decision is in flight
+            permission_cache.clear()
+            return allowed
+
+        monkeypatch.setattr(
+            access_control, "_query_allowed_pairs", racing_query
+        )
+        project = project_with_permissions["project"]
+        payload = {
+            "project_checks": [
+                {"project_id": project["id"], "action": "update_project"}
+            ]
+        }
+
+        response = auth_client.post("/check-project-access", json=payload)
+        assert response.get_json()["results"][0]["allowed"] is True
+        assert len(permission_cache) == 0
+
     def test_check_project_access_denied(
         self, auth_client, project_with_permissions
     ):
@@ -385,6 +580,48 @@ class TestCheckProjectAccessResource:
         assert data["results"][1]["allowed"] is False  # delete_project
         assert data["results"][2]["allowed"] is False  # manage_members
 
+    def test_check_project_access_batch_chunked(
+        self, auth_client, project_with_permissions, monkeypatch
+    ):
+        """Test checks split across several statements keep their results"""
+        monkeypatch.setattr("app.resources.access_control.QUERY_CHUNK_SIZE", 1)
+        project = project_with_permissions["project"]
+        actions = ["read_files", "delete_project", "update_project"]
+
+        response = auth_client.post(
+            "/check-project-access",
+            json={
+                "project_checks": [
+                    {"project_id": project["id"], "action": action}
+                    for action in actions
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        results = response.get_json()["results"]
+        assert [r["allowed"] for r in results] == [True, False, True]
+
+    def test_check_project_access_unknown_action(
+        self, auth_client, project_with_permissions
+    ):
+        """Test actions outside the predefined permissions are rejected"""
+        project = project_with_permissions["project"]
+
+        response = auth_client.post(
+            "/check-project-access",
+            json={
+                "project_checks": [
+                    {"project_id": project["id"], "action": "launch_rockets"}
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        result = response.get_json()["results"][0]
+        assert result["allowed"] is False
+        assert result["reason"] == "Unknown action"
+
     def test_check_project_access_non_member(self, auth_client):
         """Test project access denied when user is not a project member"""
         # Create another client with different user
@@ -411,6 +648,42 @@ class TestCheckProjectAccessResource:
         data = response.get_json()
         assert data["results"][0]["allowed"] is False
 
+    def test_check_project_access_non_member_skips_chain(
+        self, auth_client, project_with_permissions, monkeypatch
+    ):
+        """Test projects the user is not a member of skip the chain query"""
+        from app.resources import access_control
+
+        evaluated = []
+        execute_allowed_kinds = access_control._execute_allowed_kinds
+
+        def recording_execute(user_id, company_id, kind_pairs, dialect):
+            evaluated.extend(kind_pairs)
+            return execute_allowed_kinds(
+                user_id, company_id, kind_pairs, dialect
+            )
+
+        monkeypatch.setattr(
+            access_control, "_execute_allowed_kinds", recording_execute
+        )
+        project_id = project_with_permissions["project"]["id"]
+        unknown_project_id = str(uuid.uuid4())
+
+        response = auth_client.post(
+            "/check-project-access",
+            json={
+                "project_checks": [
+                    {"project_id": unknown_project_id, "action": "read_files"},
+                    {"project_id": project_id, "action": "read_files"},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        results = response.get_json()["results"]
+        assert [r["allowed"] for r in results] == [False, True]
+        assert [pair[0] for pair in evaluated] == [project_id]
+
     def test_check_project_access_invalid_request(self, auth_client):
         """Test project access check with invalid request"""
         # Missing project_checks
@@ -438,6 +711,95 @@ class TestCheckProjectAccessResource:
         assert result["allowed"] is False
         assert "reason" in result
 
+    def test_check_project_access_malformed_checks(
+        self, auth_client, project_with_permissions
+    ):
+        """Test malformed checks are rejected without failing the batch"""
+        project_id = project_with_permissions["project"]["id"]
+
+        response = auth_client.post(
+            "/check-project-access",
+            json={
+                "project_checks": [
+                    "not a check",
+                    {"project_id": project_id, "action": ["read_files"]},
+                    {"project_id": project_id, "action": "read_files"},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        results = response.get_json()["results"]
+        assert [r.get("reason") for r in results] == [
+            "Invalid check format",
+            "Invalid check format",
+            None,
+        ]
+        assert results[1]["project_id"] == project_id
+        assert results[2]["allowed"] is True
+
+    def test_check_project_access_concurrency_limit(self, app, auth_client):
+        """Test requests past the per-user concurrency limit get a 429"""
+        from app.resources.access_control import _check_requests
+
+        limit = app.extensions["cfg"].max_concurrent_checks
+        for _ in range(limit):
+            assert _check_requests.acquire(auth_client.user_id, limit)
+        payload = {
+            "project_checks": [
+                {"project_id": str(uuid.uuid4()), "action": "read_files"}
+            ]
+        }
+        try:
+            response = auth_client.post("/check-project-access", json=payload)
+        finally:
+            for _ in range(limit):
+                _check_requests.release(auth_client.user_id)
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "1"
+
+        response = auth_client.post("/check-project-access", json=payload)
+        assert response.status_code == 200
+
+    def test_check_project_access_batch_too_large(
+        self, app, auth_client, monkeypatch
+    ):
+        """Test batches over the size cap are rejected with a 413"""
+        monkeypatch.setitem(
+            app.extensions,
+            "cfg",
+            dataclasses.replace(
+                app.extensions["cfg"], max_access_check_batch=2
+            ),
+        )
+        check = {"project_id": str(uuid.uuid4()), "action": "read_files"}
+
+        response = auth_client.post(
+            "/check-project-access", json={"project_checks": [check] * 3}
+        )
+        assert response.status_code == 413
+
+        response = auth_client.post(
+            "/check-project-access-batch", json={"checks": [check] * 3}
+        )
+        assert response.status_code == 413
+
+        response = auth_client.post(
+            "/check-project-access", json={"project_checks": [check] * 2}
+        )
+        assert response.status_code == 200
+
+    def test_check_project_access_malformed_json(self, auth_client):
+        """Test a body that is not valid JSON is rejected"""
+        response = auth_client.post(
+            "/check-project-access",
+            data=b'{"project_checks": [',
+            content_type="application/json",
+        )
+
+        assert response.status_code == 400
+
     def test_check_project_access_project_not_found(self, auth_client):
         """Test project access check with non-existent project"""
         response = auth_client.post(
@@ -470,3 +832,177 @@ class TestCheckProjectAccessResource:
             },
         )
         assert response.status_code == 401
+
+
+class TestCheckAccessBatchResources:
+    """Tests for the batch endpoints (POST /check-*-access-batch)"""
+
+    def test_check_file_access_batch_reasons(
+        self, auth_client, project_with_permissions
+    ):
+        """Test each batch result carries the role and the denial reason"""
+        project = project_with_permissions["project"]
+        other_project = auth_client.post(
+            "/projects", json={"name": "Not a member"}
+        ).get_json()
+
+        response = auth_client.post(
+            "/check-file-access-batch",
+            json={
+                "checks": [
+                    {"project_id": project["id"], "action": "read_files"},
+                    {"project_id": project["id"], "action": "delete_files"},
+                    {
+                        "project_id": other_project["id"],
+                        "action": "read_files",
+                    },
+                    {"project_id": str(uuid.uuid4()), "action": "read_files"},
+                    {"action": "read_files"},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        results = response.get_json()["results"]
+        role_name = project_with_permissions["role"]["name"]
+        assert [(r["allowed"], r["role"], r["reason"]) for r in results] == [
+            (True, role_name, None),
+            (False, role_name, "Permission denied"),
+            (False, None, "User is not a member of the project"),
+            (False, None, "Project not found"),
+            (False, None, "Invalid check format"),
+        ]
+
+    def test_check_file_access_batch_revoked_permission(
+        self, auth_client, project_with_permissions
+    ):
+        """Test cached member access is dropped when a permission is revoked"""
+        project = project_with_permissions["project"]
+        policy = project_with_permissions["policy"]
+        permission = project_with_permissions["permissions"]["read_files"]
+        payload = {
+            "checks": [{"project_id": project["id"], "action": "read_files"}]
+        }
+
+        response = auth_client.post("/check-file-access-batch", json=payload)
+        assert response.get_json()["results"][0]["allowed"] is True
+
+        response = auth_client.delete(
+            f"/projects/{project['id']}/policies/{policy['id']}"
+            f"/permissions/{permission['id']}"
+        )
+        assert response.status_code == 204
+
+        response = auth_client.post("/check-file-access-batch", json=payload)
+        result = response.get_json()["results"][0]
+        assert result["allowed"] is False
+        assert result["reason"] == "Permission denied"
+
+    def test_check_project_access_batch_deduplicates_checks(
+        self, auth_client, project_with_permissions, monkeypatch
+    ):
+        """Test identical checks of a batch are evaluated only once"""
+        from app.resources import access_control
+
+        evaluated = []
+        evaluate_member_access = access_control._evaluate_member_access
+
+        def recording_evaluate(member_access, permission_name):
+            evaluated.append(permission_name)
+            return evaluate_member_access(member_access, permission_name)
+
+        monkeypatch.setattr(
+            access_control, "_evaluate_member_access", recording_evaluate
+        )
+        project_id = project_with_permissions["project"]["id"]
+
+        response = auth_client.post(
+            "/check-project-access-batch",
+            json={
+                "checks": [
+                    {"project_id": project_id, "action": "read"},
+                    {"project_id": project_id.upper(), "action": "read"},
+                    {"project_id": project_id, "action": "manage"},
+                    {"project_id": project_id, "action": "read"},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        results = response.get_json()["results"]
+        assert [r["allowed"] for r in results] == [True, True, False, True]
+        assert results[1]["project_id"] == project_id.upper()
+        assert evaluated == ["read_files", "manage_project"]
+
+    def test_check_project_access_batch_maps_actions(
+        self, auth_client, project_with_permissions
+    ):
+        """Test generic actions are mapped to file permissions"""
+        project = project_with_permissions["project"]
+
+        response = auth_client.post(
+            "/check-project-access-batch",
+            json={
+                "checks": [
+                    {"project_id": project["id"], "action": "read"},
+                    {"project_id": project["id"], "action": "manage"},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        results = response.get_json()["results"]
+        assert results[0]["allowed"] is True
+        assert results[1]["allowed"] is False
+        assert results[1]["reason"] == "Permission denied"
+
+    def test_check_file_access_batch_query_count(
+        self, app, auth_client, project_with_permissions
+    ):
+        """Test the statement count does not grow with the batch size"""
+        from sqlalchemy import event
+        from app.models.db import db
+        from app.models.project import member_access_cache
+
+        project = project_with_permissions["project"]
+        other_projects = [
+            auth_client.post(
+                "/projects", json={"name": f"Other {index}"}
+            ).get_json()
+            for index in range(5)
+        ]
+
+        def count_statements(checks):
+            member_access_cache.clear()
+            statements = []
+
+            def record(*_):
+                statements.append(None)
+
+            engine = db.engine
+            event.listen(engine, "before_cursor_execute", record)
+            try:
+                response = auth_client.post(
+                    "/check-file-access-batch", json={"checks": checks}
+                )
+            finally:
+                event.remove(engine, "before_cursor_execute", record)
+            assert response.status_code == 200
+            return len(statements)
+
+        single = count_statements(
+            [{"project_id": project["id"], "action": "read_files"}]
+        )
+        many = count_statements(
+            [
+                {"project_id": project_id, "action": action}
+                for project_id in [
+                    project["id"],
+                    *(other["id"] for other in other_projects),
+                    *(str(uuid.uuid4()) for _ in range(5)),
+                ]
+                for action in ("read_files", "write_files", "delete_files")
+            ]
+        )
+
+        assert 0 < many == single
@@ -0,0 +1,26 @@
+"""
+test_cli.py
+-----------
+This module contains tests for the maintenance CLI commands.
+"""
+
+
+def test_history_partitions_is_postgresql_only(app):
+    """
+    Test that the partition maintenance command is a no-op on SQLite.
+    """
+    result = app.test_cli_runner().invoke(
+        args=["project-history", "partitions", "--retention-months", "12"]
+    )
+    assert result.exit_code == 0
+    assert "only partitioned on PostgreSQL" in result.output
+
+
+def test_history_partitions_rejects_negative_months(app):
+    """
+    Test that negative month counts are rejected.
+    """
+    result = app.test_cli_runner().invoke(
+        args=["project-history", "partitions", "--months-ahead", "-1"]
+    )
+    assert result.exit_code != 0
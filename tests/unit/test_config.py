@@ -27,3 +27,19 @@ def test_config_endpoit(client):
     assert "FLASK_ENV" in data
     assert "LOG_LEVEL" in data
     assert "DATABASE_URI" in data
+
+
+def test_config_endpoint_reads_environment_once(client, monkeypatch):
+    """
+    Test the /config endpoint serves the environment read at app creation.
+    """
+    token = create_jwt_token(str(uuid.uuid4()), str(uuid.uuid4()))
+    client.set_cookie("access_token", token, domain="localhost")
+    monkeypatch.setenv("LOG_LEVEL", "changed-after-start")
+
+    response = client.get("/config")
+    assert response.status_code == 200
+
+    data = json.loads(response.data)
+    assert data["LOG_LEVEL"] != "changed-after-start"
+    assert isinstance(data["JWT_SECRET"], bool)
@@ -6,6 +6,9 @@ Tests for Deliverable CRUD resources.
 
 import uuid
 import pytest
+from sqlalchemy import event
+
+from app.models.db import db
 from tests.conftest import create_jwt_token
 
 
@@ -44,6 +47,60 @@ class TestDeliverableListResource:
         assert response.status_code == 404
         assert "not found" in response.json["message"].lower()
 
+    def test_get_deliverables_project_deleted(self, auth_client, project):
+        """Test GET /projects/{id}/deliverables on a deleted project."""
+        auth_client.post(
+            f"/projects/{project}/deliverables", json={"name": "Orphan"}
+        )
+        assert auth_client.delete(f"/projects/{project}").status_code == 204
+
+        response = auth_client.get(f"/projects/{project}/deliverables")
+        assert response.status_code == 404
+
+    def test_list_matches_detail(self, auth_client, project):
+        """Test listed deliverables are serialized like the detail view."""
+        response = auth_client.post(
+            f"/projects/{project}/deliverables",
+            json={"name": "Spec", "planned_date": "2026-03-01"},
+        )
+        deliverable_id = response.json["id"]
+
+        listed = auth_client.get(f"/projects/{project}/deliverables").json
+        detail = auth_client.get(f"/deliverables/{deliverable_id}").json
+        assert listed == [detail]
+
+    def test_get_deliverables_paginated(self, auth_client, project):
+        """Test GET /projects/{id}/deliverables?limit=&cursor=."""
+        for index in range(5):
+            auth_client.post(
+                f"/projects/{project}/deliverables",
+                json={"name": f"Deliverable {index}"},
+            )
+        full = auth_client.get(f"/projects/{project}/deliverables").json
+
+        seen = []
+        url = f"/projects/{project}/deliverables?limit=2"
+        for _ in range(3):
+            response = auth_client.get(url)
+            assert response.status_code == 200
+            assert len(response.json["data"]) <= 2
+            seen.extend(response.json["data"])
+            cursor = response.json["next_cursor"]
+            url = cursor and (
+                f"/projects/{project}/deliverables?limit=2&cursor={cursor}"
+            )
+
+        assert url is None
+        assert sorted(d["id"] for d in seen) == sorted(d["id"] for d in full)
+        keys = [(d["created_at"], d["id"]) for d in seen]
+        assert keys == sorted(keys, reverse=True)
+
+    @pytest.mark.parametrize("query", ["limit=0", "limit=x", "cursor=abc"])
+    def test_get_deliverables_bad_page(self, auth_client, project, query):
+        """Test invalid pagination parameters are rejected."""
+        response = auth_client.get(f"/projects/{project}/deliverables?{query}")
+        assert response.status_code == 400
+
     def test_create_deliverable(self, auth_client, project):
         """Test POST /projects/{id}/deliverables."""
         payload = {
@@ -122,6 +179,18 @@ class TestDeliverableResource:
         assert response.json["id"] == deliverable_id
         assert response.json["name"] == "Test Deliverable"
 
+    def test_get_deliverable_other_company(self, auth_client, project):
+        """Test GET /deliverables/{id} from another company."""
+        create_response = auth_client.post(
+            f"/projects/{project}/deliverables", json={"name": "Private"}
+        )
+        deliverable_id = create_response.json["id"]
+
+        token = create_jwt_token(str(uuid.uuid4()), str(uuid.uuid4()))
+        auth_client.set_cookie("access_token", token, domain="localhost")
+        response = auth_client.get(f"/deliverables/{deliverable_id}")
+        assert response.status_code == 404
+
     def test_get_deliverable_not_found(self, auth_client):
         """Test GET /deliverables/{id} with non-existent ID."""
         fake_id = str(uuid.uuid4())
@@ -165,6 +234,38 @@ class TestDeliverableResource:
         assert response.json["name"] == "Original Name"  # Unchanged
         assert response.json["description"] == "Partial update"
 
+    def test_write_does_not_reload_deliverable(self, auth_client, project):
+        """Test create and update responses need no SELECT of the row."""
+        statements = []
+
+        def record(_conn, _cursor, statement, *_):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            response = auth_client.post(
+                f"/projects/{project}/deliverables", json={"name": "Fresh"}
+            )
+            deliverable_id = response.json["id"]
+            response = auth_client.patch(
+                f"/deliverables/{deliverable_id}", json={"name": "Renamed"}
+            )
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+
+        assert response.json["name"] == "Renamed"
+        assert response.json["updated_at"]
+        writes = [s for s in statements if s.startswith(("INSERT", "UPDATE"))]
+        assert writes
+        # The PATCH updates the row and reads it back in one statement
+        assert not [
+            s
+            for s in statements
+            if s.startswith("SELECT") and "FROM deliverables" in s
+        ]
+        assert "UPDATE deliverables SET name=" in writes[-1]
+        assert "RETURNING" in writes[-1]
+
     def test_delete_deliverable(self, auth_client, project):
         """Test DELETE /deliverables/{id}."""
         # Create deliverable
@@ -181,6 +282,10 @@ class TestDeliverableResource:
         get_response = auth_client.get(f"/deliverables/{deliverable_id}")
         assert get_response.status_code == 404
 
+        # Soft-deleted deliverables are not listed
+        list_response = auth_client.get(f"/projects/{project}/deliverables")
+        assert list_response.json == []
+
     def test_unauthorized_missing_jwt(self, client):
         """Test endpoints without JWT."""
         # Create a project first with auth
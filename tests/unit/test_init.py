@@ -6,8 +6,13 @@ It ensures that the app is created correctly, custom error handlers work as expe
 and the main run logic is invoked properly.
 """
 
+import dataclasses
+
+import pytest
 from flask import Flask
 import app
+from app.config import ProductionConfig, TestingConfig
+from app.runtime_config import RuntimeConfig
 
 
 def test_main_runs(monkeypatch):
@@ -34,6 +39,37 @@ def test_create_app_returns_flask_app():
     assert isinstance(application, Flask)
 
 
+def test_create_app_stores_runtime_config():
+    """
+    Test that create_app stores an immutable runtime config snapshot.
+    """
+    application = app.create_app("app.config.TestingConfig")
+    cfg = application.extensions["cfg"]
+    assert isinstance(cfg, RuntimeConfig)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        cfg.jwt_secret = "changed"
+
+
+def test_create_app_validates_config(monkeypatch):
+    """
+    Test that create_app rejects a configuration without a database URL.
+    """
+    monkeypatch.setattr(TestingConfig, "SQLALCHEMY_DATABASE_URI", None)
+    with pytest.raises(ValueError, match="DATABASE_URL"):
+        app.create_app(TestingConfig)
+
+
+def test_create_app_sizes_pool_to_threads(monkeypatch):
+    """
+    Test that the production pool is sized from GUNICORN_THREADS by create_app.
+    """
+    monkeypatch.setenv("GUNICORN_THREADS", "3")
+    monkeypatch.setattr(app, "register_extensions", lambda _app: None)
+    application = app.create_app(ProductionConfig)
+    assert application.config["SQLALCHEMY_ENGINE_OPTIONS"]["pool_size"] == 3
+    assert "pool_size" not in ProductionConfig.SQLALCHEMY_ENGINE_OPTIONS
+
+
 def test_handle_404(client):
     """
     Test that a 404 error returns the correct JSON response.
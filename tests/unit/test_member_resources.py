@@ -6,6 +6,9 @@ Tests for Member CRUD resources.
 
 import uuid
 import pytest
+from sqlalchemy import event
+
+from app.models.db import db
 from tests.conftest import create_jwt_token
 
 
@@ -268,6 +271,40 @@ class TestMemberResource:
         assert response.status_code == 200
         assert response.json["role_id"] == new_role.id
 
+    def test_update_member_role_single_statement(
+        self, auth_client, project_with_role
+    ):
+        """Test a role change checks the role inside the UPDATE."""
+        project_id = project_with_role["project_id"]
+        role_id = project_with_role["role_id"]
+        user_id = str(uuid.uuid4())
+        auth_client.post(
+            f"/projects/{project_id}/members",
+            json={"user_id": user_id, "role_id": role_id},
+        )
+        statements = []
+
+        def record(_conn, _cursor, statement, *_):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            response = auth_client.patch(
+                f"/projects/{project_id}/members/{user_id}",
+                json={"role_id": role_id},
+            )
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+
+        assert response.status_code == 200
+        assert not [
+            s
+            for s in statements
+            if s.startswith("SELECT") and "FROM project_roles" in s
+        ]
+        (write,) = [s for s in statements if s.startswith("UPDATE")]
+        assert "EXISTS" in write
+
     def test_update_member_invalid_role(self, auth_client, project_with_role):
         """Test updating member with non-existent role."""
         project_id = project_with_role["project_id"]
@@ -289,6 +326,18 @@ class TestMemberResource:
         assert response.status_code == 404
         assert "role" in response.json["error"].lower()
 
+    def test_update_missing_member_invalid_role(
+        self, auth_client, project_with_role
+    ):
+        """Test a missing member is reported before an invalid role."""
+        project_id = project_with_role["project_id"]
+        response = auth_client.patch(
+            f"/projects/{project_id}/members/{uuid.uuid4()}",
+            json={"role_id": str(uuid.uuid4())},
+        )
+        assert response.status_code == 404
+        assert response.json["error"] == "Member not found"
+
     def test_delete_member(self, auth_client, project_with_role):
         """Test DELETE /projects/{project_id}/members/{user_id}."""
         project_id = project_with_role["project_id"]
@@ -313,6 +362,18 @@ class TestMemberResource:
         )
         assert get_response.status_code == 404
 
+        # Adding the user again restores the membership
+        response = auth_client.post(
+            f"/projects/{project_id}/members",
+            json={"user_id": user_id, "role_id": role_id},
+        )
+        assert response.status_code == 201
+        assert response.json["removed_at"] is None
+        get_response = auth_client.get(
+            f"/projects/{project_id}/members/{user_id}"
+        )
+        assert get_response.status_code == 200
+
     def test_delete_member_not_found(self, auth_client, project_with_role):
         """Test DELETE with non-existent member."""
         project_id = project_with_role["project_id"]
@@ -189,6 +189,19 @@ class TestMilestoneDeliverableListResource:
         )
         assert response.status_code == 404
 
+    def test_get_deliverables_milestone_deleted(
+        self, auth_client, project, milestone, deliverable
+    ):
+        """Test GET returns 404 once the milestone is soft-deleted"""
+        url = f"/projects/{project['id']}/milestones/{milestone['id']}/deliverables"
+        auth_client.post(url, json={"deliverable_id": deliverable["id"]})
+        response = auth_client.delete(f"/milestones/{milestone['id']}")
+        assert response.status_code == 204
+
+        response = auth_client.get(url)
+        assert response.status_code == 404
+        assert "milestone" in response.get_json()["error"].lower()
+
     def test_project_not_found(self, auth_client):
         """Test GET/POST returns 404 when project doesn't exist"""
         fake_project_id = str(uuid.uuid4())
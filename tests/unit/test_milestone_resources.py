@@ -44,6 +44,18 @@ class TestMilestoneListResource:
         assert response.status_code == 404
         assert "not found" in response.json["message"].lower()
 
+    def test_list_matches_detail(self, auth_client, project):
+        """Test listed milestones are serialized like the detail view."""
+        response = auth_client.post(
+            f"/projects/{project}/milestones",
+            json={"name": "Kickoff", "planned_date": "2026-03-01"},
+        )
+        milestone_id = response.json["id"]
+
+        listed = auth_client.get(f"/projects/{project}/milestones").json
+        detail = auth_client.get(f"/milestones/{milestone_id}").json
+        assert listed == [detail]
+
     def test_create_milestone(self, auth_client, project):
         """Test POST /projects/{id}/milestones."""
         payload = {
@@ -6,14 +6,21 @@ Unit tests for Project Service models.
 Tests model validation, relationships, soft deletes, and business logic.
 """
 
+import contextlib
+import importlib.metadata
 import uuid
-from datetime import date, datetime
+from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
+from types import SimpleNamespace
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import inspect, select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import selectinload
 
 from app.models.project import (
+    PERMISSION_KINDS,
     Deliverable,
     Milestone,
     Project,
@@ -22,8 +29,16 @@ from app.models.project import (
     ProjectPermission,
     ProjectPolicy,
     ProjectRole,
+    _ViewRefresher,
+    project_cache,
+)
+from app.schemas.project_schema import (
+    DeliverableCreateSchema,
+    DeliverableSchema,
+    DeliverableUpdateSchema,
+    MilestoneUpdateSchema,
+    ProjectMemberUpdateSchema,
 )
-
 
 # ============================================================================
 # FIXTURES
@@ -78,6 +93,15 @@ def sample_role(session, sample_project, company_id):
     return role
 
 
+def load_project(session, project_id, relationship):
+    """Load a project with one of its collections eagerly loaded."""
+    return session.scalars(
+        select(Project)
+        .where(Project.id == project_id)
+        .options(selectinload(relationship))
+    ).one()
+
+
 # ============================================================================
 # PROJECT MODEL TESTS
 # ============================================================================
@@ -138,6 +162,21 @@ class TestProjectModel:
         assert project.budget_currency == "EUR"
         assert project.consultation_date == date(2025, 1, 15)
 
+    def test_project_external_uuids_normalized(self, company_id):
+        """Test customer_id/created_by accept uuid.UUID and store strings."""
+        customer = uuid4()
+        project = Project(
+            name="UUID Project",
+            company_id=company_id,
+            customer_id=customer,
+            created_by=str(customer).upper(),
+        )
+
+        assert project.customer_id == str(customer)
+        assert project.created_by == str(customer)
+        with pytest.raises(ValueError):
+            project.customer_id = "not-a-uuid"
+
     def test_project_status_transition_valid(self, session, sample_project):
         """Test valid status transitions."""
         # created -> initialized
@@ -183,6 +222,13 @@ class TestProjectModel:
         assert sample_project.can_transition_to("active") is False
         assert sample_project.can_transition_to("completed") is False
 
+    def test_audit_timestamps_are_naive_utc(self, session, sample_project):
+        """Test database-filled timestamps use the same clock as Python."""
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        for stamp in (sample_project.created_at, sample_project.updated_at):
+            assert stamp.tzinfo is None
+            assert abs(stamp - now) < timedelta(minutes=1)
+
     def test_project_soft_delete(self, session, sample_project):
         """Test soft delete functionality."""
         assert sample_project.is_active() is True
@@ -194,6 +240,85 @@ class TestProjectModel:
         assert sample_project.removed_at is not None
         assert isinstance(sample_project.removed_at, datetime)
 
+    def test_project_soft_delete_many(self, session, company_id, user_id):
+        """Test bulk soft delete skips already deleted projects."""
+        projects = [
+            Project(
+                name=f"Bulk {i}", company_id=company_id, created_by=user_id
+            )
+            for i in range(3)
+        ]
+        session.add_all(projects)
+        session.commit()
+
+        ids = [p.id for p in projects]
+        assert Project.soft_delete_many(ids[:2]) == 2
+        assert Project.soft_delete_many(ids) == 1
+        session.commit()
+
+        assert all(p.removed_at is not None for p in projects)
+
+    def test_project_get_cached(self, session, sample_project):
+        """Test cached snapshots are invalidated on update and soft delete."""
+        snapshot = Project.get_cached(sample_project.id)
+        assert snapshot.company_id == sample_project.company_id
+        assert snapshot.status == "created"
+        assert Project.get_cached(sample_project.id) is snapshot
+
+        sample_project.status = "initialized"
+        session.commit()
+        assert Project.get_cached(sample_project.id).status == "initialized"
+
+        sample_project.soft_delete()
+        session.commit()
+        assert Project.get_cached(sample_project.id).removed_at is not None
+
+        assert Project.get_cached(str(uuid4())) is None
+
+    def test_project_get_cached_canonical_key(self, session, sample_project):
+        """Test every spelling of the id shares one entry and is evicted."""
+        spellings = [
+            sample_project.id.upper(),
+            sample_project.id.replace("-", ""),
+            f"urn:uuid:{sample_project.id}",
+        ]
+        snapshot = Project.get_cached(sample_project.id)
+        assert all(Project.get_cached(s) is snapshot for s in spellings)
+
+        sample_project.soft_delete()
+        # Evicted on commit only: the change is not visible before
+        assert Project.get_cached(spellings[0]) is snapshot
+        session.commit()
+        assert all(Project.get_cached(s).removed_at for s in spellings)
+        assert Project.get_cached("not-a-uuid") is None
+
+    def test_project_get_active_cached(self, session, sample_project):
+        """Test active snapshots are scoped to the company and live rows."""
+        project_id = sample_project.id
+        company_id = sample_project.company_id
+        assert Project.get_active_cached(project_id, company_id)
+        assert Project.get_active_cached(project_id, str(uuid4())) is None
+
+        sample_project.soft_delete()
+        session.commit()
+        assert Project.get_active_cached(project_id, company_id) is None
+
+    def test_project_get_active_ignores_cache(self, session, sample_project):
+        """Test write-path lookups are not fooled by a stale snapshot."""
+        project_id = sample_project.id
+        company_id = sample_project.company_id
+        snapshot = Project.get_active_cached(project_id, company_id)
+        assert Project.get_active(project_id, company_id) is sample_project
+        assert Project.get_active(project_id, str(uuid4())) is None
+        assert Project.get_active("not-a-uuid", company_id) is None
+
+        sample_project.soft_delete()
+        session.commit()
+        # Snapshot cached by another worker before the delete
+        project_cache.set(project_id, snapshot)
+        assert Project.get_active_cached(project_id, company_id)
+        assert Project.get_active(project_id, company_id) is None
+
     def test_project_restore(self, session, sample_project):
         """Test restoring a soft-deleted project."""
         sample_project.soft_delete()
@@ -204,6 +329,13 @@ class TestProjectModel:
         assert sample_project.is_active() is True
         assert sample_project.removed_at is None
 
+    def test_project_collections_require_explicit_load(
+        self, session, sample_project
+    ):
+        """Test project collections are never lazy loaded implicitly."""
+        with pytest.raises(InvalidRequestError):
+            _ = sample_project.milestones
+
     def test_project_repr(self, session, sample_project):
         """Test string representation."""
         assert "Test Project" in repr(sample_project)
@@ -254,7 +386,8 @@ class TestMilestoneModel:
         assert milestone.project.id == sample_project.id
 
         # Access from project side
-        milestones = sample_project.milestones.all()
+        project = load_project(session, sample_project.id, Project.milestones)
+        milestones = project.milestones
         assert len(milestones) == 1
         assert milestones[0].id == milestone.id
 
@@ -302,7 +435,10 @@ class TestDeliverableModel:
 
         session.commit()
 
-        deliverables = sample_project.deliverables.all()
+        project = load_project(
+            session, sample_project.id, Project.deliverables
+        )
+        deliverables = project.deliverables
         assert len(deliverables) == len(types)
 
     def test_milestone_deliverable_association(
@@ -474,6 +610,33 @@ class TestProjectPermissionModel:
         ).all()
         assert len(permissions) == len(categories)
 
+    def test_permission_kind_derived_from_name(
+        self, session, sample_project, company_id
+    ):
+        """Test that kind is set from the predefined permission name."""
+        permission = ProjectPermission(
+            project_id=sample_project.id,
+            company_id=company_id,
+            name="lock_files",
+            category="file_operations",
+        )
+        session.add(permission)
+        session.commit()
+
+        assert permission.kind == PERMISSION_KINDS["lock_files"]
+
+    def test_permission_unknown_name_rejected(
+        self, sample_project, company_id
+    ):
+        """Test that only predefined permission names are accepted."""
+        with pytest.raises(ValueError):
+            ProjectPermission(
+                project_id=sample_project.id,
+                company_id=company_id,
+                name="launch_rockets",
+                category="file_operations",
+            )
+
 
 class TestRBACAssociations:
     """Tests for RBAC association tables."""
@@ -547,7 +710,70 @@ class TestRBACAssociations:
 
         # Verify association
         assert policy.permissions.count() == 2
-        assert perm1.policies.count() == 1
+        assert len(perm1.policies) == 1
+
+    def test_role_has_permission(self, session, sample_project, sample_role):
+        """Test resolving a permission through the role's active policies."""
+        policy = ProjectPolicy(
+            project_id=sample_project.id,
+            company_id=sample_project.company_id,
+            name="File Operations",
+        )
+        read_perm = ProjectPermission(
+            project_id=sample_project.id,
+            company_id=sample_project.company_id,
+            name="read_files",
+            category="file_operations",
+        )
+        write_perm = ProjectPermission(
+            project_id=sample_project.id,
+            company_id=sample_project.company_id,
+            name="write_files",
+            category="file_operations",
+        )
+        session.add_all([policy, read_perm, write_perm])
+        session.commit()
+
+        policy.permissions.append(read_perm)
+        policy.permissions.append(write_perm)
+        sample_role.policies.append(policy)
+        session.commit()
+
+        assert sample_role.has_permission("read_files")
+        assert not sample_role.has_permission("delete_files")
+
+        write_perm.removed_at = datetime.now()
+        session.commit()
+
+        assert not sample_role.has_permission("write_files")
+
+        policy.removed_at = datetime.now()
+        session.commit()
+
+        assert not sample_role.has_permission("read_files")
+
+    def test_view_refresher_coalesces(self):
+        """Test a burst of scheduled refreshes runs a single refresh."""
+        statements = []
+
+        class FakeEngine:
+            """Engine stand-in recording the executed statements."""
+
+            @contextlib.contextmanager
+            def begin(self):
+                """Yield a connection appending to statements."""
+                yield SimpleNamespace(execute=statements.append)
+
+        refresher = _ViewRefresher("role_permissions_mv", delay=0.05)
+        refresher.schedule(FakeEngine())
+        timer = refresher._timer  # pylint: disable=protected-access
+        refresher.schedule(FakeEngine())
+        refresher.schedule(FakeEngine())
+        timer.join()
+
+        assert [str(stmt) for stmt in statements] == [
+            "REFRESH MATERIALIZED VIEW CONCURRENTLY role_permissions_mv"
+        ]
 
 
 # ============================================================================
@@ -592,7 +818,8 @@ class TestProjectMemberModel:
         session.commit()
 
         # Access from project side
-        members = sample_project.members.all()
+        project = load_project(session, sample_project.id, Project.members)
+        members = project.members
         assert len(members) == 1
         assert members[0].user_id == user_id
 
@@ -626,6 +853,24 @@ class TestProjectHistoryModel:
         assert history.action == "created"
         assert history.changed_by == user_id
 
+    def test_history_identity_includes_changed_at(
+        self, session, sample_project, company_id, user_id
+    ):
+        """Test the mapped primary key matches the table's (id, changed_at)."""
+        history = ProjectHistory(
+            project_id=sample_project.id,
+            company_id=company_id,
+            changed_by=user_id,
+            action="created",
+        )
+        session.add(history)
+        session.flush()
+
+        assert history.changed_at is not None
+        key = (history.id, history.changed_at)
+        assert inspect(history).identity == key
+        assert session.get(ProjectHistory, key) is history
+
     def test_history_field_change(
         self, session, sample_project, company_id, user_id
     ):
@@ -647,6 +892,31 @@ class TestProjectHistoryModel:
         assert history.old_value == "created"
         assert history.new_value == "initialized"
 
+    def test_record_many(self, session, sample_project, company_id, user_id):
+        """Test inserting several history entries in one statement."""
+        entries = [
+            {
+                "project_id": sample_project.id,
+                "company_id": company_id,
+                "changed_by": user_id,
+                "action": "updated",
+                "field_name": field_name,
+                "new_value": "value",
+            }
+            for field_name in ("name", "description")
+        ]
+        ProjectHistory.record_many(entries, session=session)
+        session.commit()
+
+        rows = session.scalars(
+            select(ProjectHistory).filter_by(project_id=sample_project.id)
+        ).all()
+        assert sorted(row.field_name for row in rows) == [
+            "description",
+            "name",
+        ]
+        assert all(row.id and row.changed_at for row in rows)
+
     def test_project_history_relationship(
         self, session, sample_project, company_id, user_id
     ):
@@ -669,7 +939,8 @@ class TestProjectHistoryModel:
         session.commit()
 
         # Access from project side (ordered by changed_at desc)
-        history_entries = sample_project.history.all()
+        project = load_project(session, sample_project.id, Project.history)
+        history_entries = project.history
         assert len(history_entries) == 2
 
 
@@ -717,3 +988,57 @@ class TestCascadeDeletes:
 
         # Verify role is also deleted
         assert session.get(ProjectRole, role_id) is None
+
+
+class TestUpdateSchemas:
+    """Update schemas feed UPDATE ... SET directly (update_returning)."""
+
+    @pytest.mark.parametrize(
+        "schema, model",
+        [
+            (DeliverableUpdateSchema, Deliverable),
+            (MilestoneUpdateSchema, Milestone),
+            (ProjectMemberUpdateSchema, ProjectMember),
+        ],
+    )
+    def test_loaded_fields_are_columns(self, schema, model):
+        """Test every field an update schema loads is a model column."""
+        loaded = {
+            field.attribute or name
+            for name, field in schema().load_fields.items()
+        }
+        assert loaded <= set(model.__table__.columns.keys())
+
+
+class TestSchemaLoad:
+    """Schemas that return plain data skip the instance-loading wrapper."""
+
+    def test_plain_load_skips_version_lookup(self, monkeypatch):
+        """Test loading plain data never inspects package metadata."""
+
+        def fail(_name):
+            raise AssertionError("version lookup on load")
+
+        monkeypatch.setattr(importlib.metadata, "version", fail)
+        data = DeliverableCreateSchema().load(
+            {
+                "project_id": str(uuid4()),
+                "company_id": str(uuid4()),
+                "name": "Spec",
+                "planned_date": "2026-03-01",
+            }
+        )
+        assert data["planned_date"] == date(2026, 3, 1)
+
+    def test_instance_load_still_builds_model(self, session, company_id):
+        """Test load_instance schemas still return model instances."""
+        deliverable = DeliverableSchema().load(
+            {
+                "project_id": str(uuid4()),
+                "company_id": company_id,
+                "name": "Spec",
+            },
+            session=session,
+        )
+        assert isinstance(deliverable, Deliverable)
+        assert deliverable.name == "Spec"
@@ -79,6 +79,35 @@ class TestPermissionListResource:
         assert "manage_roles" in permission_names
         assert "manage_policies" in permission_names
 
+    def test_get_permissions_cached(self, auth_client, project):
+        """Test the seeded permission list is served from the cache"""
+        from sqlalchemy import event
+        from app.models.db import db
+
+        url = f"/projects/{project['id']}/permissions"
+        # An empty list is not cached: seeding shows up right away
+        assert auth_client.get(url).get_json() == []
+        auth_client.put(
+            f"/projects/{project['id']}",
+            json={"name": project["name"], "status": "initialized"},
+        )
+        first = auth_client.get(url).get_json()
+        assert len(first) == 10
+
+        statements = []
+
+        def record(_conn, _cursor, statement, *_):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            second = auth_client.get(url).get_json()
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+
+        assert second == first
+        assert not [s for s in statements if "FROM project_permissions" in s]
+
     def test_get_permissions_categories(self, auth_client, project):
         """Test that permissions are categorized correctly"""
         # Initialize the project
@@ -183,3 +212,24 @@ class TestPermissionListResource:
             assert "created_at" in permission
             assert permission["project_id"] == project["id"]
             assert permission["company_id"] == project["company_id"]
+
+
+class TestSeedProjectPermissions:
+    """Tests for seed_project_permissions."""
+
+    def test_seed_is_idempotent(self, auth_client, project):
+        """Test seeding twice creates each permission once, with its kind"""
+        from app.models.project import PERMISSION_KINDS
+        from app.resources.permission import seed_project_permissions
+
+        created = seed_project_permissions(
+            project["id"], auth_client.company_id
+        )
+        assert {p.name: p.kind for p in created} == PERMISSION_KINDS
+        assert all(p.created_at for p in created)
+
+        assert not seed_project_permissions(
+            project["id"], auth_client.company_id
+        )
+        response = auth_client.get(f"/projects/{project['id']}/permissions")
+        assert len(response.get_json()) == len(PERMISSION_KINDS)
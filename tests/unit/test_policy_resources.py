@@ -151,6 +151,17 @@ class TestPolicyListResource:
         assert any(p["name"] == "File Management" for p in data)
         assert any(p["name"] == "Member Management" for p in data)
 
+    def test_list_matches_detail(self, auth_client, project):
+        """Test listed policies are serialized like the detail view"""
+        url = f"/projects/{project['id']}/policies"
+        policy = auth_client.post(
+            url, json={"name": "File Management", "description": "Files"}
+        ).get_json()
+
+        listed = auth_client.get(url).get_json()
+        detail = auth_client.get(f"{url}/{policy['id']}").get_json()
+        assert listed == [detail]
+
 
 class TestPolicyResource:
     """Tests for PolicyResource (GET, PUT, PATCH, DELETE /projects/{project_id}/policies/{policy_id})"""
@@ -5,7 +5,13 @@ Tests for Project CRUD resources.
 """
 
 import uuid
+from datetime import datetime, timedelta, timezone
+
 import pytest
+from sqlalchemy import select
+
+from app.models.db import db
+from app.models.project import Project, ProjectHistory
 from tests.conftest import create_jwt_token
 
 
@@ -46,6 +52,14 @@ class TestProjectListResource:
         assert response.status_code == 400
         assert "message" in response.json
 
+    def test_create_project_invalid_currency_length(self, auth_client):
+        """Test POST /projects with a currency code that is not 3 chars."""
+        payload = {"name": "Test Project", "budget_currency": "EU"}
+
+        response = auth_client.post("/projects", json=payload)
+        assert response.status_code == 400
+        assert "budget_currency" in response.json["errors"]
+
     def test_get_projects_after_create(self, auth_client):
         """Test GET /projects after creating a project."""
         # Create project
@@ -58,6 +72,34 @@ class TestProjectListResource:
         assert len(response.json) == 1
         assert response.json[0]["name"] == "Test Project"
 
+    def test_list_matches_detail(self, auth_client):
+        """Test listed projects are serialized like the detail view."""
+        payload = {
+            "name": "Budgeted",
+            "contract_amount": "1250.50",
+            "budget_currency": "EUR",
+            "contract_start_date": "2026-01-05",
+        }
+        project_id = auth_client.post("/projects", json=payload).json["id"]
+
+        listed = auth_client.get("/projects").json
+        detail = auth_client.get(f"/projects/{project_id}").json
+        assert listed == [detail]
+
+    def test_company_id_canonicalized(self, client):
+        """Test a non-canonical company_id in the JWT maps to the same data."""
+        company_id = str(uuid.uuid4())
+        user_id = str(uuid.uuid4())
+        upper = create_jwt_token(company_id.upper(), user_id)
+        client.set_cookie("access_token", upper, domain="localhost")
+        response = client.post("/projects", json={"name": "Shared"})
+        assert response.json["company_id"] == company_id
+
+        lower = create_jwt_token(company_id, user_id)
+        client.set_cookie("access_token", lower, domain="localhost")
+        response = client.get("/projects")
+        assert [p["name"] for p in response.json] == ["Shared"]
+
 
 class TestProjectResource:
     """Tests for ProjectResource."""
@@ -88,6 +130,11 @@ class TestProjectResource:
         assert response.status_code == 400
         assert "UUID" in response.json["message"]
 
+    def test_invalid_uuid_unauthenticated(self, client):
+        """Test anonymous requests get 401 before any ID validation."""
+        response = client.get("/projects/invalid-uuid/milestones")
+        assert response.status_code == 401
+
     def test_update_project_put(self, auth_client):
         """Test PUT /projects/{id}."""
         # Create project
@@ -141,6 +188,17 @@ class TestProjectResource:
         get_response = auth_client.get(f"/projects/{project_id}")
         assert get_response.status_code == 404
 
+        # Stamped in naive UTC and recorded in the history
+        project = db.session.get(Project, project_id)
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        assert abs(project.removed_at - now) < timedelta(minutes=1)
+        entry = db.session.scalars(
+            select(ProjectHistory).filter_by(
+                project_id=project_id, action="deleted"
+            )
+        ).one()
+        assert entry.new_value == project.removed_at.isoformat()
+
     def test_unauthorized_missing_jwt(self, client):
         """Test endpoints without JWT."""
         response = client.get("/projects")
@@ -5,7 +5,11 @@ Tests for Role CRUD resources.
 """
 
 import uuid
+from datetime import datetime, timedelta, timezone
+
 import pytest
+from app.models.db import db
+from app.models.project import ProjectRole
 from tests.conftest import create_jwt_token
 
 
@@ -107,6 +111,18 @@ class TestRoleListResource:
         assert response.status_code == 200
         assert len(response.json) == 2
 
+    def test_list_matches_detail(self, auth_client, project):
+        """Test listed roles are serialized like the detail view."""
+        response = auth_client.post(
+            f"/projects/{project}/roles",
+            json={"name": "viewer", "description": "View only role"},
+        )
+        role_id = response.json["id"]
+
+        listed = auth_client.get(f"/projects/{project}/roles").json
+        detail = auth_client.get(f"/projects/{project}/roles/{role_id}").json
+        assert listed == [detail]
+
 
 class TestRoleResource:
     """Tests for RoleResource."""
@@ -230,6 +246,11 @@ class TestRoleResource:
         get_response = auth_client.get(f"/projects/{project}/roles/{role_id}")
         assert get_response.status_code == 404
 
+        # Stamped in naive UTC, like the other soft deletes
+        removed_at = db.session.get(ProjectRole, role_id).removed_at
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        assert abs(removed_at - now) < timedelta(minutes=1)
+
     def test_delete_role_not_found(self, auth_client, project):
         """Test DELETE with non-existent role."""
         fake_role_id = str(uuid.uuid4())
@@ -2,11 +2,192 @@
 Tests for utility functions in app.utils module.
 """
 
+import threading
+import time
+from decimal import Decimal
 from unittest import mock
 
+import pytest
 import requests
 
-from app.utils import check_access
+from app.utils import (
+    ConcurrencyLimiter,
+    OrjsonProvider,
+    Singleflight,
+    TTLCache,
+    check_access,
+    output_json,
+    stream_json_list,
+)
+
+
+class TestTTLCache:
+    """Test cases for the process-local TTL cache."""
+
+    def test_get_set_delete(self):
+        """Test basic cache operations."""
+        cache = TTLCache(ttl=60)
+        assert cache.get("key") is None
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+        cache.delete("key")
+        assert cache.get("key", "default") == "default"
+
+    def test_entry_expires(self):
+        """Test entries are dropped once their TTL has elapsed."""
+        cache = TTLCache(ttl=10)
+        with mock.patch("app.utils.cache.time.monotonic", return_value=100):
+            cache.set("key", "value")
+        with mock.patch("app.utils.cache.time.monotonic", return_value=111):
+            assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_oldest_entry_evicted_at_maxsize(self):
+        """Test the oldest entry is evicted when the cache is full."""
+        cache = TTLCache(ttl=60, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    def test_get_many_skips_misses_and_expired(self):
+        """Test get_many returns only live entries."""
+        cache = TTLCache(ttl=10)
+        with mock.patch("app.utils.cache.time.monotonic", return_value=100):
+            cache.set("old", 1)
+        with mock.patch("app.utils.cache.time.monotonic", return_value=105):
+            cache.set("new", 2)
+        with mock.patch("app.utils.cache.time.monotonic", return_value=111):
+            assert cache.get_many(["old", "new", "missing"]) == {"new": 2}
+        assert len(cache) == 1
+
+    def test_set_many_skips_stale_generation(self):
+        """Test values read before a clear() are not stored."""
+        cache = TTLCache(ttl=60)
+        generation = cache.generation
+        assert cache.set_many({"a": 1, "b": 2}, generation) is True
+        assert cache.get_many(["a", "b"]) == {"a": 1, "b": 2}
+
+        cache.clear()
+        assert cache.set_many({"a": 3}, generation) is False
+        assert cache.get("a") is None
+        assert cache.set_many({"a": 3}, cache.generation) is True
+        assert cache.get("a") == 3
+
+
+class TestSingleflight:
+    """Test cases for the in-flight computation registry."""
+
+    def test_concurrent_callers_share_computation(self):
+        """Test a key in flight is awaited instead of recomputed."""
+        flight = Singleflight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def compute(keys):
+            calls.append(sorted(keys))
+            started.set()
+            release.wait(5)
+            return {key: key.upper() for key in keys}
+
+        owner_result = {}
+        owner = threading.Thread(
+            target=lambda: owner_result.update(flight.run_many(["a"], compute))
+        )
+        owner.start()
+        started.wait(5)
+
+        waiter_result = {}
+        waiter = threading.Thread(
+            target=lambda: waiter_result.update(
+                flight.run_many(["a", "b"], compute)
+            )
+        )
+        waiter.start()
+        deadline = time.monotonic() + 5
+        while len(calls) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        release.set()
+        owner.join(5)
+        waiter.join(5)
+
+        assert calls == [["a"], ["b"]]
+        assert owner_result == {"a": "A"}
+        assert waiter_result == {"a": "A", "b": "B"}
+        assert len(flight) == 0
+
+    def test_exception_is_propagated_and_keys_released(self):
+        """Test a failed computation raises and frees its keys."""
+        flight = Singleflight()
+
+        def compute(_keys):
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            flight.run_many(["a"], compute)
+        assert len(flight) == 0
+        assert flight.run_many(["a"], lambda keys: {"a": 1}) == {"a": 1}
+
+
+class TestConcurrencyLimiter:
+    """Test cases for the per-key in-flight request counter."""
+
+    def test_acquire_release(self):
+        """Test requests past the limit are refused until one is released."""
+        limiter = ConcurrencyLimiter()
+        assert limiter.acquire("user", 2)
+        assert limiter.acquire("user", 2)
+        assert not limiter.acquire("user", 2)
+        assert limiter.acquire("other", 2)
+
+        limiter.release("user")
+        assert limiter.acquire("user", 2)
+
+        for key in ("user", "user", "other"):
+            limiter.release(key)
+        assert len(limiter) == 0
+
+
+class TestSerialization:
+    """Test cases for the orjson JSON provider and representation."""
+
+    def test_provider_round_trip(self, app):
+        """Test dumps/loads with Decimal values and non-string keys."""
+        provider = OrjsonProvider(app)
+        dumped = provider.dumps({"b": Decimal("1.50"), 1: "x"})
+        assert provider.loads(dumped) == {"b": "1.50", "1": "x"}
+
+    def test_provider_sorts_keys_on_request(self, app):
+        """Test the sort_keys flag is honoured."""
+        provider = OrjsonProvider(app)
+        assert provider.dumps({"b": 1, "a": 2}, sort_keys=True) == (
+            '{"a":2,"b":1}'
+        )
+
+    def test_output_json(self, app):
+        """Test the Flask-RESTful representation response."""
+        with app.test_request_context():
+            response = output_json({"ok": True}, 201, {"X-Test": "1"})
+        assert response.status_code == 201
+        assert response.mimetype == "application/json"
+        assert response.headers["X-Test"] == "1"
+        assert response.get_data() == b'{"ok":true}\n'
+
+    def test_stream_json_list(self, app, monkeypatch):
+        """Test rows are streamed by chunks into a single JSON object."""
+        monkeypatch.setattr("app.utils.serialization.STREAM_CHUNK_ROWS", 2)
+        with app.test_request_context():
+            response = stream_json_list("results", iter(range(5)))
+            chunks = list(response.response)
+            empty = stream_json_list("results", [])
+            empty_body = b"".join(empty.response)
+        assert response.is_streamed
+        assert len(chunks) == 5
+        assert b"".join(chunks) == b'{"results":[0,1,2,3,4]}\n'
+        assert empty_body == b'{"results":[]}\n'
 
 
 class TestCheckAccess: